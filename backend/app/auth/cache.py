@@ -0,0 +1,50 @@
+from typing import Any, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.auth.models import User
+from app.cache import TTLCache
+from app.config import settings
+
+# Column values only: an ORM instance would stay bound to the session that
+# loaded it and be expired by that session's next commit or rollback.
+_COLUMNS: Tuple[str, ...] = tuple(column.key for column in User.__table__.columns)
+
+principal_cache: TTLCache[str, Tuple[Any, ...]] = TTLCache(
+    "principal",
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def snapshot_principal(user: User) -> Tuple[Any, ...]:
+    return tuple(getattr(user, key) for key in _COLUMNS)
+
+
+def restore_principal(snapshot: Tuple[Any, ...]) -> User:
+    """A fresh detached ``User`` holding the snapshot as its loaded state."""
+    user = User.__mapper__.class_manager.new_instance()
+    for key, value in zip(_COLUMNS, snapshot):
+        set_committed_value(user, key, value)
+    make_transient_to_detached(user)
+    return user
+
+
+def invalidate_principal(username: str) -> None:
+    principal_cache.invalidate(username)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_changed_user(mapper, connection, target: User) -> None:
+    # Relationship changes, such as a new blog of the user, also flush the
+    # user; only its own columns are cached.
+    state = inspect(target)
+    if any(state.attrs[key].history.has_changes() for key in _COLUMNS):
+        invalidate_principal(target.username)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, target: User) -> None:
+    invalidate_principal(target.username)
@@ -3,6 +3,7 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from app.auth.cache import principal_cache, restore_principal, snapshot_principal
 from app.auth.models import User
 from app.auth.security import decode_access_token
 from app.db.dependencies import DatabaseDependency
@@ -32,6 +33,12 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    snapshot = principal_cache.get(username)
+    if snapshot is not None:
+        # Attach a new instance to this request's session without hitting
+        # the database.
+        return await db.merge(restore_principal(snapshot), load=False)
+
     user = await db.get(User, username)
     if user is None:
         raise HTTPException(
@@ -40,6 +47,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    principal_cache.set(username, snapshot_principal(user))
     return user
 
 
@@ -1,6 +1,9 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
+from fastapi import HTTPException, status
 from jose import JWTError, jwt
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
@@ -18,6 +21,70 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """Runs Argon2 in worker processes so it never blocks the event loop.
+
+    At most ``max_pending`` operations may be queued or running at once; callers
+    that cannot get a slot within ``queue_timeout`` receive a 503. With
+    ``workers=0`` hashing runs inline on the event loop.
+    """
+
+    def __init__(self, workers: int, max_pending: int, queue_timeout: float):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def start(self) -> None:
+        if self.workers > 0 and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._slots = None
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        self.start()
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy. Please try again later.",
+                headers={"Retry-After": str(max(1, round(self.queue_timeout)))},
+            )
+
+        try:
+            if self._executor is None:
+                return fn(*args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._slots.release()
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
 
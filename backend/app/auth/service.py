@@ -6,14 +6,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.models import User
 from app.auth.schemas import Token, UserLogin, UserSignup
-from app.auth.security import create_access_token, hash_password, verify_password
+from app.auth.security import create_access_token, password_hasher
 from app.config import settings
 from app.user.models import UserLimits
 
 
 async def service_signup(db: AsyncSession, user: UserSignup) -> User:
     try:
-        hashed_pwd = hash_password(user.password)
+        hashed_pwd = await password_hasher.hash(user.password)
 
         new_user = User(
             username=user.username,
@@ -78,7 +78,7 @@ async def service_login(db: AsyncSession, user_credentials: UserLogin) -> Token:
     try:
         user = await db.get(User, user_credentials.username)
 
-        if not user or not verify_password(
+        if not user or not await password_hasher.verify(
             user_credentials.password, user.hashed_password
         ):
             raise HTTPException(
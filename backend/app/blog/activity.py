@@ -0,0 +1,56 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.blog.models import Blog, BlogDailyActivity
+
+
+async def count_blog_created(db: AsyncSession, day: date) -> None:
+    """Add one blog to the rollup row of ``day``, creating the row if needed."""
+    statement = insert(BlogDailyActivity).values(activity_date=day, blog_count=1)
+    await db.execute(
+        statement.on_duplicate_key_update(blog_count=BlogDailyActivity.blog_count + 1)
+    )
+
+
+async def count_blog_deleted(db: AsyncSession, day: date) -> None:
+    """Take one blog off the rollup row of ``day``.
+
+    Rows that reach zero are kept; readers skip them.
+    """
+    await db.execute(
+        update(BlogDailyActivity)
+        .where(BlogDailyActivity.activity_date == day, BlogDailyActivity.blog_count > 0)
+        .values(blog_count=BlogDailyActivity.blog_count - 1)
+    )
+
+
+async def rebuild_blog_activity(
+    db: AsyncSession, start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> int:
+    """Recount the rollup rows between the given dates from the blog table.
+
+    Needed after paths that add or remove blogs without the blog services,
+    such as bulk imports or cascading user deletes. Scans the blogs of the
+    range once, so run it from maintenance jobs rather than requests.
+    """
+    day = func.date(Blog.created_at)
+    counts = select(day, func.count()).group_by(day)
+    stale = delete(BlogDailyActivity)
+    if start_date is not None:
+        counts = counts.where(day >= start_date)
+        stale = stale.where(BlogDailyActivity.activity_date >= start_date)
+    if end_date is not None:
+        counts = counts.where(day <= end_date)
+        stale = stale.where(BlogDailyActivity.activity_date <= end_date)
+
+    await db.execute(stale)
+    result = await db.execute(
+        insert(BlogDailyActivity).from_select(
+            ["activity_date", "blog_count"], counts
+        )
+    )
+    return result.rowcount
@@ -0,0 +1,72 @@
+from typing import List, Optional
+
+from app.blog.schemas import BlogSearchResponse
+from app.blog.types import BlogSortBy, BlogSortOrder
+from app.cache import TTLCache
+from app.config import settings
+from app.events import BlogEvent, subscribe
+from app.schemas import PaginatedResponse
+
+search_cache: TTLCache[tuple, PaginatedResponse[BlogSearchResponse]] = TTLCache(
+    "blog_search",
+    max_size=settings.SEARCH_CACHE_MAX_SIZE,
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+)
+
+# Position of the all_positive_comments flag in search_cache_key().
+_ALL_POSITIVE_COMMENTS = 4
+
+
+def search_cache_key(
+    search: Optional[str],
+    tag_names: Optional[List[str]],
+    tag_match_all: bool,
+    authors: Optional[List[str]],
+    all_positive_comments: bool,
+    sort_by: BlogSortBy,
+    sort_order: BlogSortOrder,
+    page: int,
+    size: int,
+) -> tuple:
+    # Fulltext matching ignores case and extra whitespace, and without a
+    # search term relevance falls back to newest first.
+    search = " ".join(search.split()).lower() if search else None
+    if not search and sort_by == BlogSortBy.RELEVANCE:
+        sort_by, sort_order = BlogSortBy.CREATED_AT, BlogSortOrder.DESC
+    elif sort_by == BlogSortBy.RELEVANCE:
+        sort_order = BlogSortOrder.DESC
+
+    return (
+        search,
+        tuple(sorted(tag_names or ())),
+        bool(tag_names) and tag_match_all,
+        tuple(sorted(set(authors or ()))),
+        all_positive_comments,
+        sort_by.value,
+        sort_order.value,
+        page,
+        size,
+    )
+
+
+@subscribe(
+    BlogEvent.PUBLISHED,
+    BlogEvent.DELISTED,
+    BlogEvent.EDITED,
+    BlogEvent.RETAGGED,
+    BlogEvent.DELETED,
+)
+def _invalidate_on_blog_change(event: BlogEvent, blog_id: int) -> None:
+    # A changed blog can enter or leave any result set and shifts every
+    # total and page boundary after it, so nothing cached is safe to keep.
+    search_cache.clear()
+
+
+@subscribe(BlogEvent.COMMENTS_CHANGED)
+def _invalidate_on_comment_change(event: BlogEvent, blog_id: int) -> None:
+    # Comments feed the all-positive-comments filter and the counters shown
+    # for the blog itself; other cached pages are unaffected.
+    search_cache.invalidate_where(
+        lambda key, page: key[_ALL_POSITIVE_COMMENTS]
+        or any(item.id == blog_id for item in page.items)
+    )
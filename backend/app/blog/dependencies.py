@@ -1,24 +1,11 @@
-from datetime import date
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
 
 from app.auth.dependencies import UserDependency
 from app.blog.models import Blog
 from app.db.dependencies import DatabaseDependency
-from app.user.models import UserDailyActivity, UserLimits
-
-
-async def create_activity_record(username: str, db: DatabaseDependency):
-    today = date.today()
-    activity = UserDailyActivity(
-        username=username, activity_date=today, comments_made=0, blogs_made=0
-    )
-    db.add(activity)
-    await db.commit()
-    await db.refresh(activity)
-    return activity
+from app.user.quota import Quota, consume_quota
 
 
 async def get_user_blog(
@@ -43,23 +30,9 @@ async def get_user_blog(
 
 
 async def can_create_blog(user: UserDependency, db: DatabaseDependency):
-    today = date.today()
-    limits_query = select(UserLimits).filter_by(username=user.username)
-    limits = await db.scalar(limits_query)
-
-    if not limits:
-        raise Exception("User limits not found")
-
-    activity_query = select(UserDailyActivity).filter_by(
-        username=user.username, activity_date=today
-    )
-    activity = await db.scalar(activity_query)
-
-    if not activity:
-        await create_activity_record(user.username, db)
-    else:
-        if activity.blogs_made >= limits.blog_creation_limit:
-            raise HTTPException(status_code=403, detail="Blog creation limit reached")
+    # Taken in the request's transaction; create_blog_service commits it.
+    if not await consume_quota(db, user.username, Quota.BLOG):
+        raise HTTPException(status_code=403, detail="Blog creation limit reached")
 
 
 UserAuthorizedOwnedBlog = Annotated[Blog, Depends(get_user_blog)]
@@ -41,6 +41,11 @@ class DatabaseConstraintException(HTTPException):
         super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
 
 
+class InvalidCursorException(HTTPException):
+    def __init__(self, detail: str = "Invalid pagination cursor"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
 class InvalidDataException(HTTPException):
     def __init__(self, detail: str = "Invalid data provided"):
         super().__init__(
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Optional
+
+from sqlalchemy import Select, and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, undefer_group
+
+from app.blog.models import Blog
+from app.blog.schemas import BlogDetailResponse
+from app.blog.types import BlogStatus
+from app.config import settings
+
+
+def build_export_query(updated_since: Optional[datetime] = None) -> Select:
+    query = (
+        select(Blog)
+        .where(Blog.status == BlogStatus.PUBLISHED)
+        .options(selectinload(Blog.tags), undefer_group("body"))
+    )
+    # Inclusive, so rows sharing the watermark timestamp are never missed;
+    # consumers upsert by id, so a repeated row is harmless.
+    if updated_since is not None:
+        query = query.where(Blog.updated_at >= updated_since)
+    return query.order_by(Blog.updated_at, Blog.id)
+
+
+async def stream_published_blogs(
+    db: AsyncSession,
+    updated_since: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+) -> AsyncIterator[List[BlogDetailResponse]]:
+    """Published blogs in (updated_at, id) order, one batch at a time.
+
+    Each batch is its own buffered query continuing after the last
+    (updated_at, id) of the previous one, so memory use is bounded by
+    ``batch_size`` and the tags of a batch can be loaded while nothing
+    else is pending on the connection. A blog edited during the export
+    moves behind the position and is sent again. Vote flushes leave
+    updated_at alone, so vote counts alone never move a blog past the
+    watermark.
+    """
+    batch_size = batch_size or settings.BLOG_EXPORT_BATCH_SIZE
+    query = build_export_query(updated_since).limit(batch_size)
+    position = None
+    while True:
+        batch = query
+        if position is not None:
+            updated_at, blog_id = position
+            batch = batch.where(
+                or_(
+                    Blog.updated_at > updated_at,
+                    and_(Blog.updated_at == updated_at, Blog.id > blog_id),
+                )
+            )
+        blogs = (await db.scalars(batch)).all()
+        if not blogs:
+            return
+        records = [BlogDetailResponse.model_validate(blog) for blog in blogs]
+        # Keep the session from holding on to every exported blog.
+        db.expunge_all()
+        yield records
+        if len(blogs) < batch_size:
+            return
+        position = (blogs[-1].updated_at, blogs[-1].id)
+
+
+def to_ndjson(records: Iterable[BlogDetailResponse]) -> bytes:
+    return "".join(record.model_dump_json() + "\n" for record in records).encode()
+
+
+async def published_blogs_ndjson(
+    db: AsyncSession, updated_since: Optional[datetime] = None
+) -> AsyncIterator[bytes]:
+    async for records in stream_published_blogs(db, updated_since):
+        yield to_ndjson(records)
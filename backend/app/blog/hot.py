@@ -0,0 +1,99 @@
+import logging
+import math
+from datetime import datetime, timezone
+from typing import Set
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.blog.models import Blog
+from app.events import BlogEvent, subscribe
+
+logger = logging.getLogger(__name__)
+
+HOT_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# A post this much newer ranks level with one ten times as popular.
+HOT_DECAY_SECONDS = 45_000
+COMMENT_WEIGHT = 0.5
+REFRESH_BATCH_SIZE = 1_000
+
+_dirty: Set[int] = set()
+
+
+def hot_score(
+    upvotes: int, downvotes: int, comment_count: int, created_at: datetime
+) -> float:
+    """Log-scaled engagement plus a bonus that grows with the creation time.
+
+    Recency is measured from a fixed epoch rather than from now, so newer
+    posts outrank older ones without every score having to decay over
+    time. A score only changes when the blog's votes or comments do.
+    """
+    engagement = upvotes - downvotes + COMMENT_WEIGHT * comment_count
+    order = math.log10(max(abs(engagement), 1))
+    sign = (engagement > 0) - (engagement < 0)
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    age = (created_at - HOT_EPOCH).total_seconds()
+    return round(sign * order + age / HOT_DECAY_SECONDS, 7)
+
+
+@subscribe(BlogEvent.PUBLISHED, BlogEvent.COMMENTS_CHANGED, BlogEvent.VOTED)
+def _mark_dirty(event: BlogEvent, blog_id: int) -> None:
+    _dirty.add(blog_id)
+
+
+async def update_hot_scores(db: AsyncSession, *criteria) -> int:
+    """Recompute the stored score of every blog matching ``criteria``."""
+    rows = (
+        await db.execute(
+            select(
+                Blog.id,
+                Blog.upvotes,
+                Blog.downvotes,
+                Blog.comment_count,
+                Blog.created_at,
+            ).where(*criteria)
+        )
+    ).all()
+    if not rows:
+        return 0
+
+    blogs = Blog.__table__
+    await db.execute(
+        update(blogs)
+        .where(blogs.c.id == bindparam("blog_id"))
+        .values(hot_score=bindparam("score"), updated_at=blogs.c.updated_at),
+        [
+            {
+                "blog_id": row.id,
+                "score": hot_score(
+                    row.upvotes, row.downvotes, row.comment_count, row.created_at
+                ),
+            }
+            for row in rows
+        ],
+    )
+    return len(rows)
+
+
+async def refresh_hot_scores(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    """Rescore the blogs whose votes, comments or status changed since the last run.
+
+    Blogs of a failed run are kept for the next one.
+    """
+    if not _dirty:
+        return
+    blog_ids = sorted(_dirty)
+    _dirty.clear()
+
+    try:
+        async with session_maker() as db:
+            for start in range(0, len(blog_ids), REFRESH_BATCH_SIZE):
+                batch = blog_ids[start : start + REFRESH_BATCH_SIZE]
+                await update_hot_scores(db, Blog.id.in_(batch))
+            await db.commit()
+    except Exception:
+        _dirty.update(blog_ids)
+        raise
+    logger.debug("Rescored %d blogs", len(blog_ids))
@@ -1,10 +1,12 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy import (
     CheckConstraint,
     Column,
+    Date,
     DateTime,
+    Double,
     ForeignKey,
     Index,
     Integer,
@@ -17,7 +19,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.blog.types import BlogStatus
+from app.blog.types import BlogStatus, VoteDirection
 from app.models import BaseModel
 
 if TYPE_CHECKING:
@@ -47,8 +49,14 @@ class Blog(BaseModel):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
     subject: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Only the detail and edit paths need the text; they opt in with
+    # undefer_group("body"), anything else that touches it raises.
+    description: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="body", deferred_raiseload=True
+    )
+    content: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="body", deferred_raiseload=True
+    )
     status: Mapped[BlogStatus] = mapped_column(
         SQLEnum(BlogStatus), default=BlogStatus.DRAFT, index=True
     )
@@ -56,8 +64,15 @@ class Blog(BaseModel):
     author_username: Mapped[str] = mapped_column(
         String(50), ForeignKey("user.username"), index=True
     )
+    # Fed from the blog_vote ledger through app.blog.votes.vote_buffer.
     upvotes: Mapped[int] = mapped_column(Integer, default=0)
     downvotes: Mapped[int] = mapped_column(Integer, default=0)
+    # Maintained by the comment services; rebuilt by reconcile_comment_counters.
+    comment_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    positive_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    negative_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Popularity rank, kept current by app.blog.hot in the background.
+    hot_score: Mapped[float] = mapped_column(Double, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=get_current_time, index=True
     )
@@ -76,6 +91,13 @@ class Blog(BaseModel):
         CheckConstraint("upvotes >= 0", name="check_upvotes_non_negative"),
         CheckConstraint("downvotes >= 0", name="check_downvotes_non_negative"),
         Index("idx_blog_status_created", "status", "created_at"),
+        Index("idx_blog_author_created", "author_username", "created_at"),
+        Index("idx_blog_status_updated", "status", "updated_at"),
+        Index("idx_blog_status_subject", "status", "subject"),
+        Index(
+            "idx_blog_status_sentiment", "status", "negative_count", "comment_count"
+        ),
+        Index("idx_blog_status_hot", "status", "hot_score"),
     )
 
 
@@ -95,3 +117,35 @@ class Tag(BaseModel):
     __table_args__ = (
         CheckConstraint("LENGTH(name) > 0", name="check_tag_name_not_empty"),
     )
+
+
+class BlogDailyActivity(BaseModel):
+    """Number of blogs created per day, maintained by the blog services."""
+
+    __tablename__ = "blog_daily_activity"
+
+    activity_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    blog_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        CheckConstraint("blog_count >= 0", name="check_blog_count_non_negative"),
+    )
+
+
+class BlogVote(BaseModel):
+    """One user's current vote on a blog."""
+
+    __tablename__ = "blog_vote"
+
+    blog_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("blog.id", ondelete="CASCADE"), primary_key=True
+    )
+    username: Mapped[str] = mapped_column(
+        String(50), ForeignKey("user.username", ondelete="CASCADE"), primary_key=True
+    )
+    direction: Mapped[VoteDirection] = mapped_column(SQLEnum(VoteDirection))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=get_current_time
+    )
+
+    __table_args__ = (Index("ix_blog_vote_username", "username"),)
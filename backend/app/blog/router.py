@@ -1,6 +1,9 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Annotated, List, Optional, Union
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import Field
 
 from app.auth.dependencies import UserDependency
 from app.blog.dependencies import UserAuthorizedOwnedBlog, UserCanCreateBlogDependency
@@ -10,24 +13,31 @@ from app.blog.schemas import (
     BlogEditRequest,
     BlogResponse,
     BlogSearchResponse,
+    BlogVoteResponse,
     TagOperationRequest,
 )
+from app.blog.export import published_blogs_ndjson
 from app.blog.service import (
     add_tags_to_blog_service,
+    blog_etag,
     create_blog_service,
     delete_blog_service,
     get_blog_activity_dates_service,
+    get_blog_etag_service,
     get_blog_service,
     list_blogs_service,
     publish_or_delist_blog_service,
     remove_tags_from_blog_service,
+    search_blogs_cursor_service,
     search_blogs_service,
     update_blog_service,
+    vote_blog_service,
 )
-from app.blog.types import BlogSortBy, BlogSortOrder
-from app.db.dependencies import DatabaseDependency
+from app.blog.types import BlogSortBy, BlogSortOrder, VoteDirection
+from app.db.dependencies import DatabaseDependency, ReadDatabaseDependency
+from app.http_cache import etag_matches, not_modified, set_cache_headers
 from app.limiter import limiter
-from app.schemas import PaginatedResponse
+from app.schemas import CursorPaginatedResponse, PaginatedResponse, PaginationMode
 
 # For dates
 from datetime import date as DateType
@@ -46,17 +56,32 @@ async def create_blog(
     return await create_blog_service(user, db)
 
 
-@router.get("/", response_model=List[BlogResponse])
+@router.get("/", response_model=CursorPaginatedResponse[BlogResponse])
 @limiter.limit("100/minute")
-async def list_blogs(request: Request, db: DatabaseDependency, user: UserDependency):
-    return await list_blogs_service(user, db)
+async def list_blogs(
+    request: Request,
+    db: DatabaseDependency,
+    user: UserDependency,
+    size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+):
+    return await list_blogs_service(user, db, cursor, size)
 
 
-@router.get("/search", response_model=PaginatedResponse[BlogSearchResponse])
+@router.get(
+    "/search",
+    response_model=Annotated[
+        Union[
+            PaginatedResponse[BlogSearchResponse],
+            CursorPaginatedResponse[BlogSearchResponse],
+        ],
+        Field(discriminator="pagination"),
+    ],
+)
 @limiter.limit("60/minute")
 async def search_blogs(
     request: Request,
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
     search: Optional[str] = Query(None, min_length=2, max_length=100),
     tags: Optional[List[str]] = Query(None),
     tags_match_all: bool = Query(False),
@@ -66,12 +91,63 @@ async def search_blogs(
     sort_order: BlogSortOrder = Query(BlogSortOrder.DESC),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Items per page"),
+    pagination: PaginationMode = Query(
+        PaginationMode.OFFSET, description="Page numbers or opaque cursors"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page (implies cursor pagination)"
+    ),
+    include_total: bool = Query(
+        False, description="Also count all matches in cursor pagination"
+    ),
 ):
+    if cursor is not None or pagination == PaginationMode.CURSOR:
+        return await search_blogs_cursor_service(
+            db, search, tags, tags_match_all, authors, all_positive_comments, sort_by, sort_order, cursor, size, include_total
+        )
     return await search_blogs_service(
         db, search, tags, tags_match_all, authors, all_positive_comments, sort_by, sort_order, page, size
     )
 
 
+@router.get("/hot", response_model=CursorPaginatedResponse[BlogSearchResponse])
+@limiter.limit("120/minute")
+async def hot_blogs(
+    request: Request,
+    db: ReadDatabaseDependency,
+    size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+):
+    """Published blogs by precomputed hot score, read in index order.
+
+    Scores move as blogs are voted and commented on, and the cursor holds
+    the score of the last blog served. A blog whose score crosses it
+    between two requests can appear twice or not at all.
+    """
+    return await search_blogs_cursor_service(
+        db, None, None, False, None, False, BlogSortBy.HOT, BlogSortOrder.DESC, cursor, size
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+@limiter.limit("10/minute")
+async def export_blogs(
+    request: Request,
+    db: ReadDatabaseDependency,
+    updated_since: Optional[datetime] = Query(
+        None, description="Only blogs updated at or after this time"
+    ),
+):
+    """Published blogs as NDJSON in updated_at order, streamed from the database.
+
+    Pass the largest ``updated_at`` already received as ``updated_since`` to
+    pull only what changed since.
+    """
+    return StreamingResponse(
+        published_blogs_ndjson(db, updated_since), media_type="application/x-ndjson"
+    )
+
+
 @router.get("/activity-dates", response_model=BlogActivityDatesResponse)
 @limiter.limit("60/minute")
 async def get_blog_activity_dates(
@@ -88,10 +164,19 @@ async def get_blog_activity_dates(
 @limiter.limit("100/minute")
 async def get_blog(
     request: Request,
+    response: Response,
     blog_id: int,
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
 ):
-    return await get_blog_service(blog_id, db)
+    etag = await get_blog_etag_service(blog_id, db)
+    if etag_matches(request, etag):
+        return not_modified(etag, "blog_detail")
+
+    blog = await get_blog_service(blog_id, db)
+    set_cache_headers(
+        response, blog_etag(blog, blog.upvotes, blog.downvotes), "blog_detail"
+    )
+    return blog
 
 
 @router.post("/{blog_id}/publish", response_model=BlogResponse)
@@ -155,3 +240,36 @@ async def remove_tags_from_blog(
     db: DatabaseDependency,
 ):
     return await remove_tags_from_blog_service(blog.id, tag_request.tags, db)
+
+
+@router.post("/{blog_id}/upvote", response_model=BlogVoteResponse)
+@limiter.limit("120/minute")
+async def upvote_blog(
+    request: Request,
+    blog_id: int,
+    user: UserDependency,
+    db: DatabaseDependency,
+):
+    return await vote_blog_service(blog_id, user, VoteDirection.UP, db)
+
+
+@router.post("/{blog_id}/downvote", response_model=BlogVoteResponse)
+@limiter.limit("120/minute")
+async def downvote_blog(
+    request: Request,
+    blog_id: int,
+    user: UserDependency,
+    db: DatabaseDependency,
+):
+    return await vote_blog_service(blog_id, user, VoteDirection.DOWN, db)
+
+
+@router.delete("/{blog_id}/vote", response_model=BlogVoteResponse)
+@limiter.limit("120/minute")
+async def retract_blog_vote(
+    request: Request,
+    blog_id: int,
+    user: UserDependency,
+    db: DatabaseDependency,
+):
+    return await vote_blog_service(blog_id, user, None, db)
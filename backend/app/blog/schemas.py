@@ -3,6 +3,8 @@ from typing import Any, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from app.blog.types import VoteDirection
+
 
 class BlogEditRequest(BaseModel):
     subject: Optional[str] = Field(None, max_length=100)
@@ -26,8 +28,11 @@ class BlogResponse(BaseModel):
 
 
 class BlogSearchResponse(BlogResponse):
-    subject: str
+    subject: Optional[str] = None
     tags: List[str] = []
+    comment_count: int = 0
+    positive_count: int = 0
+    negative_count: int = 0
 
     @model_validator(mode="before")
     @classmethod
@@ -47,6 +52,9 @@ class BlogSearchResponse(BlogResponse):
                 "created_at": data.created_at,
                 "updated_at": data.updated_at,
                 "tags": tag_names,
+                "comment_count": data.comment_count,
+                "positive_count": data.positive_count,
+                "negative_count": data.negative_count,
             }
             return data_dict
         return data
@@ -57,6 +65,11 @@ class BlogDetailResponse(BlogResponse):
     description: Optional[str] = None
     content: Optional[str] = None
     tags: List[str] = []
+    comment_count: int = 0
+    positive_count: int = 0
+    negative_count: int = 0
+    upvotes: int = 0
+    downvotes: int = 0
 
     @model_validator(mode="before")
     @classmethod
@@ -78,10 +91,22 @@ class BlogDetailResponse(BlogResponse):
                 "description": data.description,
                 "content": data.content,
                 "tags": tag_names,
+                "comment_count": data.comment_count,
+                "positive_count": data.positive_count,
+                "negative_count": data.negative_count,
+                "upvotes": data.upvotes,
+                "downvotes": data.downvotes,
             }
             return data_dict
         return data
 
 
+class BlogVoteResponse(BaseModel):
+    blog_id: int
+    upvotes: int
+    downvotes: int
+    vote: Optional[VoteDirection] = None
+
+
 class BlogActivityDatesResponse(BaseModel):
     dates: List[date]
\ No newline at end of file
@@ -1,24 +1,51 @@
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import Select, delete, func, select, text, and_, case
+from sqlalchemy import Select, delete, func, or_, select, text, and_, case
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import joinedload, selectinload, undefer_group
 
 from app.auth.models import User
-from app.blog.exceptions import BlogNotFoundException, handle_database_error
-from app.blog.models import Blog, Tag, blog_tag_table
-from app.comment.models import Comment, Sentiment
+from app.blog.activity import count_blog_created, count_blog_deleted
+from app.blog.cache import search_cache, search_cache_key
+from app.blog.exceptions import (
+    BlogNotFoundException,
+    InvalidCursorException,
+    InvalidDataException,
+    handle_database_error,
+)
+from app.blog.models import (
+    Blog,
+    BlogDailyActivity,
+    BlogVote,
+    Tag,
+    blog_tag_table,
+    get_current_time,
+)
 from app.blog.schemas import (
     BlogActivityDatesResponse,
     BlogDetailResponse,
     BlogEditRequest,
     BlogResponse,
     BlogSearchResponse,
+    BlogVoteResponse,
+)
+from app.blog.tags import cleanup_orphaned_tags, resolve_tags
+from app.blog.types import BlogSortBy, BlogSortOrder, BlogStatus, VoteDirection
+from app.blog.votes import vote_buffer, vote_deltas
+from app.comment.closure import delete_blog_comments
+from app.events import BlogEvent, emit
+from app.http_cache import make_etag
+from app.schemas import (
+    CursorPaginatedResponse,
+    CursorPaginationMeta,
+    PaginatedResponse,
+    PaginationMeta,
 )
-from app.blog.types import BlogSortBy, BlogSortOrder, BlogStatus
-from app.schemas import PaginatedResponse, PaginationMeta
+from app.search.indexer import search_matches
+from app.timeline.fanout import push_to_followers
+from app.utils.cursor import decode_cursor, encode_cursor
 
 
 async def create_blog_service(
@@ -30,40 +57,57 @@ async def create_blog_service(
             author=user,
         )
         db.add(new_blog)
+        await db.flush()
+        await count_blog_created(db, new_blog.created_at.date())
         await db.commit()
         await db.refresh(new_blog)
 
-        activity = await db.scalar(
-            select(UserDailyActivity).filter_by(
-                username=user.username, activity_date=date.today()
-            )
-        )
-
-        if activity:
-            activity.blogs_made += 1
-            db.add(activity)
-            await db.commit()
-            await db.refresh(activity)
-
         return BlogResponse.model_validate(new_blog)
     except Exception as e:
         await db.rollback()
         handle_database_error(e, "create blog")
 
 
+# The columns BlogResponse needs; the TEXT columns are never read for lists.
+BLOG_LIST_COLUMNS = (
+    Blog.id,
+    Blog.author_username,
+    Blog.status,
+    Blog.created_at,
+    Blog.updated_at,
+)
+
+
 async def list_blogs_service(
     user: User,
     db: AsyncSession,
-) -> list[BlogResponse]:
-    try:
-        result = await db.scalars(
-            select(Blog).where(Blog.author_username == user.username)
+    cursor: Optional[str] = None,
+    size: int = 20,
+) -> CursorPaginatedResponse[BlogResponse]:
+    """The user's blogs, newest first, one keyset page at a time."""
+    query = select(*BLOG_LIST_COLUMNS).where(Blog.author_username == user.username)
+    if cursor:
+        query = blog_apply_cursor(
+            query, BlogSortBy.CREATED_AT, BlogSortOrder.DESC, cursor
         )
-        blogs = result.all()
-        return [BlogResponse.model_validate(blog) for blog in blogs]
+    query = blog_apply_sorting(query, BlogSortBy.CREATED_AT, BlogSortOrder.DESC)
+
+    try:
+        rows = (await db.execute(query.limit(size + 1))).all()
     except Exception as e:
         handle_database_error(e, "list blogs")
 
+    has_next = len(rows) > size
+    rows = rows[:size]
+    next_cursor = None
+    if has_next:
+        next_cursor = encode_cursor([rows[-1].created_at, rows[-1].id])
+
+    return CursorPaginatedResponse(
+        items=[BlogResponse.model_validate(row) for row in rows],
+        meta=CursorPaginationMeta(size=size, next_cursor=next_cursor, has_next=has_next),
+    )
+
 
 async def get_blog_service(
     blog_id: int,
@@ -71,32 +115,224 @@ async def get_blog_service(
 ) -> BlogDetailResponse:
     try:
         result = await db.scalars(
-            select(Blog).where(Blog.id == blog_id).options(selectinload(Blog.tags))
+            select(Blog)
+            .where(Blog.id == blog_id)
+            .options(selectinload(Blog.tags), undefer_group("body"))
         )
         blog = result.one()
-        return BlogDetailResponse.model_validate(blog)
+        return blog_detail_response(blog)
     except NoResultFound:
         raise BlogNotFoundException(blog_id)
     except Exception as e:
         handle_database_error(e, "get blog")
 
 
+def blog_detail_response(blog: Blog) -> BlogDetailResponse:
+    response = BlogDetailResponse.model_validate(blog)
+    response.upvotes, response.downvotes = vote_buffer.merged(
+        blog.id, blog.upvotes, blog.downvotes
+    )
+    return response
+
+
+def blog_etag(blog, upvotes: int, downvotes: int) -> str:
+    # Comment and vote counters are part of the representation but do not
+    # touch updated_at, so they are versioned separately. Votes are passed
+    # in with the buffered deltas applied.
+    return make_etag(
+        blog.id,
+        blog.updated_at,
+        blog.comment_count,
+        blog.positive_count,
+        blog.negative_count,
+        upvotes,
+        downvotes,
+    )
+
+
+async def get_blog_etag_service(blog_id: int, db: AsyncSession) -> str:
+    """ETag of a blog's detail representation, read without its text columns."""
+    try:
+        version = (
+            await db.execute(
+                select(
+                    Blog.id,
+                    Blog.updated_at,
+                    Blog.comment_count,
+                    Blog.positive_count,
+                    Blog.negative_count,
+                    Blog.upvotes,
+                    Blog.downvotes,
+                ).where(Blog.id == blog_id)
+            )
+        ).first()
+    except Exception as e:
+        handle_database_error(e, "get blog")
+
+    if version is None:
+        raise BlogNotFoundException(blog_id)
+    return blog_etag(
+        version, *vote_buffer.merged(version.id, version.upvotes, version.downvotes)
+    )
+
+
+BLOG_SORT_COLUMNS = {
+    BlogSortBy.CREATED_AT: Blog.created_at,
+    BlogSortBy.UPDATED_AT: Blog.updated_at,
+    BlogSortBy.SUBJECT: Blog.subject,
+    BlogSortBy.HOT: Blog.hot_score,
+}
+
+
 def blog_apply_sorting(
     query: Select, sort: BlogSortBy, sort_order: BlogSortOrder
 ) -> Select:
-    sort_column = {
-        BlogSortBy.CREATED_AT: Blog.created_at,
-        BlogSortBy.UPDATED_AT: Blog.updated_at,
-        BlogSortBy.SUBJECT: Blog.subject,
-    }[sort]
+    sort_column = BLOG_SORT_COLUMNS[sort]
 
     if sort_order == BlogSortOrder.ASC:
-        query = query.order_by(sort_column.asc())
+        query = query.order_by(sort_column.asc(), Blog.id.asc())
     else:
-        query = query.order_by(sort_column.desc())
+        query = query.order_by(sort_column.desc(), Blog.id.desc())
 
     return query
 
+
+def blog_apply_cursor(
+    query: Select, sort: BlogSortBy, sort_order: BlogSortOrder, cursor: str
+) -> Select:
+    """Rows after the cursor in (sort column, id) order.
+
+    NULL sort values, possible for subject, sort first ascending and last
+    descending; they get their own branches, since a comparison with NULL
+    matches nothing. Hot scores change as blogs are voted and commented
+    on, so /blog/hot pages can repeat or skip a blog whose score moved
+    across the cursor between requests.
+    """
+    try:
+        sort_value, blog_id = decode_cursor(cursor, 2)
+    except ValueError as e:
+        raise InvalidCursorException(str(e))
+
+    sort_column = BLOG_SORT_COLUMNS[sort]
+    if sort_order == BlogSortOrder.ASC:
+        if sort_value is None:
+            return query.where(
+                or_(
+                    sort_column.is_not(None),
+                    and_(sort_column.is_(None), Blog.id > blog_id),
+                )
+            )
+        return query.where(
+            or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, Blog.id > blog_id),
+            )
+        )
+
+    if sort_value is None:
+        return query.where(sort_column.is_(None), Blog.id < blog_id)
+    after = or_(
+        sort_column < sort_value,
+        and_(sort_column == sort_value, Blog.id < blog_id),
+    )
+    if sort_column.nullable:
+        after = or_(after, sort_column.is_(None))
+    return query.where(after)
+
+
+def boolean_search_term(search: Optional[str]) -> Optional[str]:
+    if not search:
+        return None
+    search_words = search.strip().split()
+    return " ".join(f"{word}*" for word in search_words)
+
+
+def build_blog_search_query(
+    search: Optional[str],
+    tag_names: Optional[List[str]],
+    tag_match_all: bool,
+    authors: Optional[List[str]],
+    all_positive_comments: bool,
+    matched_ids: Optional[List[int]] = None,
+) -> Select:
+    boolean_search = boolean_search_term(search)
+
+    base_query = select(Blog).where(Blog.status == BlogStatus.PUBLISHED)
+
+    if search and matched_ids is not None:
+        base_query = base_query.where(Blog.id.in_(matched_ids))
+    elif search:
+        base_query = base_query.where(
+            text(
+                "MATCH(subject, description, content) AGAINST(:search_term IN BOOLEAN MODE)"
+            ).bindparams(search_term=boolean_search)
+        )
+
+    if tag_names:
+        base_query = base_query.join(Blog.tags).where(Tag.name.in_(tag_names))
+        if tag_match_all:
+            base_query = base_query.group_by(Blog.id).having(
+                func.count(Tag.id.distinct()) == len(tag_names)
+            )
+        else:
+            base_query = base_query.distinct()
+
+    if authors:
+        base_query = base_query.where(Blog.author_username.in_(authors))
+
+    if all_positive_comments:
+        base_query = base_query.where(
+            Blog.negative_count == 0, Blog.comment_count > 0
+        )
+
+    return base_query
+
+
+def build_blog_search_count_query(base_query: Select) -> Select:
+    # Counted over ids alone; the entity subquery would select every column,
+    # deferred ones included. Tag filters already leave one row per blog.
+    return select(func.count()).select_from(
+        base_query.with_only_columns(Blog.id).subquery()
+    )
+
+
+def matched_ids(matches: Optional[List[Tuple[int, float]]]) -> Optional[List[int]]:
+    if matches is None:
+        return None
+    return [blog_id for blog_id, _ in matches]
+
+
+async def ranked_search_page(
+    db: AsyncSession,
+    base_query: Select,
+    matches: List[Tuple[int, float]],
+    offset: int,
+    size: int,
+    filtered: bool,
+) -> Tuple[List[Blog], int]:
+    """Page through index matches in score order, keeping only ids the filters allow.
+
+    The index only returns its SEARCH_BM25_MAX_RESULTS best matches, so the
+    total is capped there too; nobody pages that deep in relevance order.
+    Without filters every indexed blog is allowed and the id list is not
+    sent to the database at all.
+    """
+    ranked = [blog_id for blog_id, _ in matches]
+    if filtered:
+        allowed = set(await db.scalars(base_query.with_only_columns(Blog.id)))
+        ranked = [blog_id for blog_id in ranked if blog_id in allowed]
+    page_ids = ranked[offset : offset + size]
+
+    result = await db.scalars(
+        select(Blog)
+        # Blogs delisted by another worker stay indexed until its next refresh.
+        .where(Blog.id.in_(page_ids), Blog.status == BlogStatus.PUBLISHED)
+        .options(selectinload(Blog.tags))
+    )
+    blogs_by_id = {blog.id: blog for blog in result.all()}
+    return [blogs_by_id[blog_id] for blog_id in page_ids if blog_id in blogs_by_id], len(ranked)
+
+
 async def search_blogs_service(
     db: AsyncSession,
     search: str,
@@ -109,95 +345,68 @@ async def search_blogs_service(
     page: int = 1,
     size: int = 20,
 ) -> PaginatedResponse[BlogSearchResponse]:
-    try:
-        boolean_search = None
-        if search:
-            search_words = search.strip().split()
-            boolean_search = " ".join(f"{word}*" for word in search_words)
-
-        base_query = select(Blog).where(Blog.status == BlogStatus.PUBLISHED)
-
-        if search:
-            base_query = base_query.where(
-                text(
-                    "MATCH(subject, description, content) AGAINST(:search_term IN BOOLEAN MODE)"
-                ).bindparams(search_term=boolean_search)
-            )
-
-        if tag_names:
-            base_query = base_query.join(Blog.tags).where(Tag.name.in_(tag_names))
-            if tag_match_all:
-                base_query = base_query.group_by(Blog.id).having(
-                    func.count(Tag.id.distinct()) == len(tag_names)
-                )
-            else:
-                base_query = base_query.distinct()
-
-        if authors:
-            base_query = base_query.where(Blog.author_username.in_(authors))
-
-        if all_positive_comments:
-            blogs_with_negative_comments = (
-                select(Comment.blog_id)
-                .where(Comment.sentiment != Sentiment.POSITIVE)
-                .distinct()
-            )
+    cache_key = search_cache_key(
+        search, tag_names, tag_match_all, authors, all_positive_comments,
+        sort_by, sort_order, page, size,
+    )
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-            blogs_with_comments = (
-                select(Comment.blog_id).distinct()
-            )
-            
-            base_query = base_query.where(
-                and_(
-                    Blog.id.in_(blogs_with_comments),
-                    Blog.id.notin_(blogs_with_negative_comments)
-                )
-            )
+    try:
+        boolean_search = boolean_search_term(search)
+        # The index only ranks; other sorts page and count through FULLTEXT,
+        # which sees every match rather than the index's best few thousand.
+        matches = search_matches(search) if sort_by == BlogSortBy.RELEVANCE else None
+        fulltext = bool(search) and matches is None
+        base_query = build_blog_search_query(
+            search, tag_names, tag_match_all, authors, all_positive_comments,
+            matched_ids=matched_ids(matches),
+        )
+        offset = (page - 1) * size
 
-        if tag_names and tag_match_all:
-            count_query = select(func.count(func.distinct(Blog.id))).select_from(
-                base_query.alias()
+        if matches is not None and sort_by == BlogSortBy.RELEVANCE:
+            blogs, total = await ranked_search_page(
+                db, base_query, matches, offset, size,
+                filtered=bool(tag_names or authors or all_positive_comments),
             )
         else:
-            count_query = select(func.count()).select_from(base_query.alias())
+            count_query = build_blog_search_count_query(base_query)
 
-        main_query = base_query
+            main_query = base_query
 
-        if search and sort_by == BlogSortBy.RELEVANCE:
-            main_query = main_query.add_columns(
-                text(
-                    "MATCH(subject, description, content) AGAINST(:search_term IN BOOLEAN MODE) AS relevance"
-                ).bindparams(search_term=boolean_search)
-            )
-            main_query = main_query.order_by(text("relevance DESC"))
-            main_query = main_query.options(selectinload(Blog.tags))
-        elif search:
-            main_query = main_query.add_columns(
-                text(
-                    "MATCH(subject, description, content) AGAINST(:search_term IN BOOLEAN MODE) AS relevance"
-                ).bindparams(search_term=boolean_search)
-            )
-            main_query = blog_apply_sorting(main_query, sort_by, sort_order)
-            main_query = main_query.options(selectinload(Blog.tags))
-        else:
-            if sort_by == BlogSortBy.RELEVANCE:
-                main_query = blog_apply_sorting(main_query, BlogSortBy.CREATED_AT, BlogSortOrder.DESC)
-            else:
+            if fulltext and sort_by == BlogSortBy.RELEVANCE:
+                main_query = main_query.add_columns(
+                    text(
+                        "MATCH(subject, description, content) AGAINST(:search_term IN BOOLEAN MODE) AS relevance"
+                    ).bindparams(search_term=boolean_search)
+                )
+                main_query = main_query.order_by(text("relevance DESC"))
+                main_query = main_query.options(selectinload(Blog.tags))
+            elif fulltext:
+                main_query = main_query.add_columns(
+                    text(
+                        "MATCH(subject, description, content) AGAINST(:search_term IN BOOLEAN MODE) AS relevance"
+                    ).bindparams(search_term=boolean_search)
+                )
                 main_query = blog_apply_sorting(main_query, sort_by, sort_order)
-            main_query = main_query.options(joinedload(Blog.tags))
+                main_query = main_query.options(selectinload(Blog.tags))
+            else:
+                if sort_by == BlogSortBy.RELEVANCE:
+                    main_query = blog_apply_sorting(main_query, BlogSortBy.CREATED_AT, BlogSortOrder.DESC)
+                else:
+                    main_query = blog_apply_sorting(main_query, sort_by, sort_order)
+                main_query = main_query.options(joinedload(Blog.tags))
 
-        offset = (page - 1) * size
-        main_query = main_query.offset(offset).limit(size)
+            main_query = main_query.offset(offset).limit(size)
 
-        total = await db.scalar(count_query) or 0
-        result = await db.execute(main_query)
+            total = await db.scalar(count_query) or 0
+            result = await db.execute(main_query)
 
-        if search and sort_by == BlogSortBy.RELEVANCE:
-            blogs = [row[0] for row in result.all()]
-        elif search:
-            blogs = [row[0] for row in result.all()]
-        else:
-            blogs = result.scalars().unique().all()
+            if fulltext:
+                blogs = [row[0] for row in result.all()]
+            else:
+                blogs = result.scalars().unique().all()
 
         items = [BlogSearchResponse.model_validate(blog) for blog in blogs]
 
@@ -212,7 +421,68 @@ async def search_blogs_service(
             has_prev=page > 1,
         )
 
-        return PaginatedResponse(items=items, meta=meta)
+        response = PaginatedResponse(items=items, meta=meta)
+        search_cache.set(cache_key, response)
+        return response
+    except Exception as e:
+        handle_database_error(e, "search blogs")
+
+
+async def search_blogs_cursor_service(
+    db: AsyncSession,
+    search: Optional[str],
+    tag_names: Optional[List[str]],
+    tag_match_all: bool,
+    authors: Optional[List[str]],
+    all_positive_comments: bool,
+    sort_by: BlogSortBy,
+    sort_order: BlogSortOrder,
+    cursor: Optional[str] = None,
+    size: int = 20,
+    include_total: bool = False,
+) -> CursorPaginatedResponse[BlogSearchResponse]:
+    if sort_by == BlogSortBy.RELEVANCE:
+        if search:
+            raise InvalidDataException(
+                detail="Cursor pagination cannot be combined with relevance sorting"
+            )
+        sort_by, sort_order = BlogSortBy.CREATED_AT, BlogSortOrder.DESC
+
+    try:
+        base_query = build_blog_search_query(
+            search, tag_names, tag_match_all, authors, all_positive_comments
+        )
+
+        main_query = base_query
+        if cursor:
+            main_query = blog_apply_cursor(main_query, sort_by, sort_order, cursor)
+        main_query = blog_apply_sorting(main_query, sort_by, sort_order)
+        main_query = main_query.options(selectinload(Blog.tags)).limit(size + 1)
+
+        result = await db.scalars(main_query)
+        blogs = result.unique().all()
+
+        has_next = len(blogs) > size
+        blogs = blogs[:size]
+
+        next_cursor = None
+        if has_next:
+            last = blogs[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, BLOG_SORT_COLUMNS[sort_by].key), last.id]
+            )
+
+        total = None
+        if include_total:
+            count_query = build_blog_search_count_query(base_query)
+            total = await db.scalar(count_query) or 0
+
+        items = [BlogSearchResponse.model_validate(blog) for blog in blogs]
+        meta = CursorPaginationMeta(
+            size=size, next_cursor=next_cursor, has_next=has_next, total=total
+        )
+
+        return CursorPaginatedResponse(items=items, meta=meta)
     except Exception as e:
         handle_database_error(e, "search blogs")
 
@@ -225,11 +495,13 @@ async def publish_or_delist_blog_service(
         blog = result.one()
         if publish:
             blog.status = BlogStatus.PUBLISHED
+            await push_to_followers(db, blog)
         else:
             blog.status = BlogStatus.DRAFT
         db.add(blog)
         await db.commit()
         await db.refresh(blog)
+        await emit(BlogEvent.PUBLISHED if publish else BlogEvent.DELISTED, blog_id)
         return BlogResponse.model_validate(blog)
     except NoResultFound:
         await db.rollback()
@@ -239,32 +511,6 @@ async def publish_or_delist_blog_service(
         handle_database_error(e, publish and "publish blog" or "delist blog")
 
 
-async def get_or_create_tag(tag_name: str, db: AsyncSession) -> Tag:
-    result = await db.scalars(select(Tag).where(Tag.name == tag_name))
-    tag = result.first()
-
-    if not tag:
-        tag = Tag(name=tag_name)
-        db.add(tag)
-        await db.flush()
-
-    return tag
-
-
-async def cleanup_orphaned_tags(db: AsyncSession) -> None:
-    orphaned_tags_query = (
-        select(Tag.id)
-        .outerjoin(blog_tag_table, Tag.id == blog_tag_table.c.tag_id)
-        .where(blog_tag_table.c.blog_id.is_(None))
-    )
-
-    result = await db.scalars(orphaned_tags_query)
-    orphaned_tag_ids = result.all()
-
-    if orphaned_tag_ids:
-        await db.execute(delete(Tag).where(Tag.id.in_(orphaned_tag_ids)))
-
-
 async def update_blog_service(
     blog_id: int,
     blog_edit: BlogEditRequest,
@@ -272,7 +518,9 @@ async def update_blog_service(
 ) -> BlogDetailResponse:
     try:
         result = await db.scalars(
-            select(Blog).where(Blog.id == blog_id).options(selectinload(Blog.tags))
+            select(Blog)
+            .where(Blog.id == blog_id)
+            .options(selectinload(Blog.tags), undefer_group("body"))
         )
         blog = result.one()
 
@@ -281,23 +529,23 @@ async def update_blog_service(
         blog.content = blog_edit.content or blog.content
 
         if blog_edit.tags is not None:
-            new_tags = []
-            for tag_name in blog_edit.tags:
-                tag = await get_or_create_tag(tag_name, db)
-                new_tags.append(tag)
-
-            blog.tags = new_tags
+            old_tag_ids = {tag.id for tag in blog.tags}
+            blog.tags = await resolve_tags(db, blog_edit.tags)
+            # Tag links live in blog_tag; touch the row so the blog's
+            # version (and ETag) moves with them.
+            blog.updated_at = get_current_time()
+            await db.flush()
+            await cleanup_orphaned_tags(
+                db, old_tag_ids - {tag.id for tag in blog.tags}
+            )
 
         db.add(blog)
         await db.commit()
 
-        if blog_edit.tags is not None:
-            await cleanup_orphaned_tags(db)
-            await db.commit()
-
         await db.refresh(blog, attribute_names=["tags"])
+        await emit(BlogEvent.EDITED, blog_id)
 
-        return BlogDetailResponse.model_validate(blog)
+        return blog_detail_response(blog)
     except NoResultFound:
         await db.rollback()
         raise BlogNotFoundException(blog_id)
@@ -311,9 +559,22 @@ async def delete_blog_service(
     db: AsyncSession,
 ):
     try:
-        await remove_tags_from_blog_service(blog.id, [], db)
-        await db.delete(blog)
+        blog_id = blog.id
+        tag_ids = set(
+            await db.scalars(
+                select(blog_tag_table.c.tag_id).where(
+                    blog_tag_table.c.blog_id == blog_id
+                )
+            )
+        )
+        # Comments are deleted deepest first; tag links go with the blog
+        # through ON DELETE CASCADE, so nothing has to be loaded to delete it.
+        await delete_blog_comments(db, blog_id)
+        await db.execute(delete(Blog).where(Blog.id == blog_id))
+        await count_blog_deleted(db, blog.created_at.date())
+        await cleanup_orphaned_tags(db, tag_ids)
         await db.commit()
+        await emit(BlogEvent.DELETED, blog_id)
     except Exception as e:
         await db.rollback()
         raise e
@@ -326,22 +587,26 @@ async def add_tags_to_blog_service(
 ) -> BlogDetailResponse:
     try:
         result = await db.scalars(
-            select(Blog).where(Blog.id == blog_id).options(selectinload(Blog.tags))
+            select(Blog)
+            .where(Blog.id == blog_id)
+            .options(selectinload(Blog.tags), undefer_group("body"))
         )
         blog = result.one()
 
-        existing_tag_names = {tag.name for tag in blog.tags}
-
-        for tag_name in tag_names:
-            if tag_name not in existing_tag_names:
-                tag = await get_or_create_tag(tag_name, db)
-                blog.tags.append(tag)
+        existing_tag_ids = {tag.id for tag in blog.tags}
+        blog.tags += [
+            tag
+            for tag in await resolve_tags(db, tag_names)
+            if tag.id not in existing_tag_ids
+        ]
+        blog.updated_at = get_current_time()
 
         db.add(blog)
         await db.commit()
         await db.refresh(blog, attribute_names=["tags"])
+        await emit(BlogEvent.RETAGGED, blog_id)
 
-        return BlogDetailResponse.model_validate(blog)
+        return blog_detail_response(blog)
     except NoResultFound:
         await db.rollback()
         raise BlogNotFoundException(blog_id)
@@ -357,22 +622,26 @@ async def remove_tags_from_blog_service(
 ) -> BlogDetailResponse:
     try:
         result = await db.scalars(
-            select(Blog).where(Blog.id == blog_id).options(selectinload(Blog.tags))
+            select(Blog)
+            .where(Blog.id == blog_id)
+            .options(selectinload(Blog.tags), undefer_group("body"))
         )
         blog = result.one()
 
         tag_names_set = set(tag_names)
+        removed_tag_ids = {tag.id for tag in blog.tags if tag.name in tag_names_set}
         blog.tags = [tag for tag in blog.tags if tag.name not in tag_names_set]
+        blog.updated_at = get_current_time()
 
         db.add(blog)
-        await db.commit()
-
-        await cleanup_orphaned_tags(db)
+        await db.flush()
+        await cleanup_orphaned_tags(db, removed_tag_ids)
         await db.commit()
 
         await db.refresh(blog, attribute_names=["tags"])
+        await emit(BlogEvent.RETAGGED, blog_id)
 
-        return BlogDetailResponse.model_validate(blog)
+        return blog_detail_response(blog)
     except NoResultFound:
         await db.rollback()
         raise BlogNotFoundException(blog_id)
@@ -381,6 +650,52 @@ async def remove_tags_from_blog_service(
         handle_database_error(e, "remove tags from blog")
 
 
+async def vote_blog_service(
+    blog_id: int,
+    user: User,
+    direction: Optional[VoteDirection],
+    db: AsyncSession,
+) -> BlogVoteResponse:
+    """Set (or with ``direction=None`` retract) the user's vote on a blog.
+
+    Only published blogs take votes; drafts and delisted blogs are not
+    found, as in the listings. Only the user's ledger row is written here;
+    the blog's counters are shifted through the vote buffer once the
+    ledger change is committed.
+    """
+    try:
+        counts = (
+            await db.execute(
+                select(Blog.upvotes, Blog.downvotes).where(
+                    Blog.id == blog_id, Blog.status == BlogStatus.PUBLISHED
+                )
+            )
+        ).one()
+        vote = await db.get(
+            BlogVote, (blog_id, user.username), with_for_update=True
+        )
+        previous = vote.direction if vote else None
+        if direction is None and vote:
+            await db.delete(vote)
+        elif direction is not None and vote:
+            vote.direction = direction
+        elif direction is not None:
+            db.add(BlogVote(blog_id=blog_id, username=user.username, direction=direction))
+        await db.commit()
+    except NoResultFound:
+        await db.rollback()
+        raise BlogNotFoundException(blog_id)
+    except Exception as e:
+        await db.rollback()
+        handle_database_error(e, "vote on blog")
+
+    vote_buffer.add(blog_id, *vote_deltas(previous, direction))
+    upvotes, downvotes = vote_buffer.merged(blog_id, counts.upvotes, counts.downvotes)
+    return BlogVoteResponse(
+        blog_id=blog_id, upvotes=upvotes, downvotes=downvotes, vote=direction
+    )
+
+
 async def get_blog_activity_dates_service(
     start_date: date,
     end_date: date,
@@ -389,13 +704,13 @@ async def get_blog_activity_dates_service(
     """Get all dates within the range that have at least one blog created."""
     try:
         result = await db.execute(
-            select(func.date(Blog.created_at).label("activity_date"))
+            select(BlogDailyActivity.activity_date.label("activity_date"))
             .where(
-                func.date(Blog.created_at) >= start_date,
-                func.date(Blog.created_at) <= end_date,
+                BlogDailyActivity.activity_date >= start_date,
+                BlogDailyActivity.activity_date <= end_date,
+                BlogDailyActivity.blog_count > 0,
             )
-            .distinct()
-            .order_by(func.date(Blog.created_at))
+            .order_by(BlogDailyActivity.activity_date)
         )
         dates = [row.activity_date for row in result.all()]
         return BlogActivityDatesResponse(dates=dates)
@@ -0,0 +1,89 @@
+import logging
+from datetime import datetime
+from typing import Collection, Iterable, List, Optional
+
+from sqlalchemy import delete, exists, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.blog.models import Tag, blog_tag_table, get_current_time
+
+logger = logging.getLogger(__name__)
+
+_tag_unused = ~exists().where(blog_tag_table.c.tag_id == Tag.id)
+
+
+async def resolve_tags(
+    db: AsyncSession,
+    tag_names: Iterable[str],
+    created_at: Optional[datetime] = None,
+) -> List[Tag]:
+    """Tags for the given names, inserting the ones that do not exist yet.
+
+    Costs at most three statements however many names are given: a SELECT
+    of the existing names, one multi-row INSERT of the missing names and a
+    SELECT of the inserted rows. A name that already exists, whether created
+    concurrently or equal under the column collation, leaves the stored row
+    alone, so each tag is returned once.
+    """
+    names = list(dict.fromkeys(tag_names))
+    if not names:
+        return []
+
+    tags = list(await db.scalars(select(Tag).where(Tag.name.in_(names))))
+    found = {tag.name.casefold() for tag in tags}
+    missing = [name for name in names if name.casefold() not in found]
+
+    if missing:
+        created_at = created_at or get_current_time()
+        statement = insert(Tag).values(
+            [{"name": name, "created_at": created_at} for name in missing]
+        )
+        # A no-op update rather than INSERT IGNORE, which would also hide
+        # CHECK and length violations.
+        await db.execute(statement.on_duplicate_key_update(id=Tag.id))
+        tags += await db.scalars(select(Tag).where(Tag.name.in_(missing)))
+
+    return list({tag.id: tag for tag in tags}.values())
+
+
+async def cleanup_orphaned_tags(db: AsyncSession, tag_ids: Collection[int]) -> None:
+    """Delete those of the given tags that no blog uses any more.
+
+    Only the tags an edit detached can have become orphans, so the check is
+    bounded by the size of the edit. Orphans left by other paths, such as
+    cascading user deletes, are collected by ``sweep_orphaned_tags``.
+    """
+    if tag_ids:
+        await db.execute(delete(Tag).where(Tag.id.in_(tag_ids), _tag_unused))
+
+
+async def sweep_orphaned_tags(
+    session_maker: async_sessionmaker[AsyncSession], batch_size: int
+) -> None:
+    """Delete every unused tag, walking the tag table one batch at a time."""
+    last_id = 0
+    deleted = 0
+    while True:
+        async with session_maker() as db:
+            batch = list(
+                await db.scalars(
+                    select(Tag.id)
+                    .where(Tag.id > last_id, _tag_unused)
+                    .order_by(Tag.id)
+                    .limit(batch_size)
+                )
+            )
+            if not batch:
+                break
+            # Re-checked on delete in case a tag was reused since the select.
+            result = await db.execute(delete(Tag).where(Tag.id.in_(batch), _tag_unused))
+            await db.commit()
+
+        deleted += result.rowcount
+        last_id = batch[-1]
+        if len(batch) < batch_size:
+            break
+
+    if deleted:
+        logger.info("Deleted %d orphaned tags", deleted)
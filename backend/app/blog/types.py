@@ -11,8 +11,14 @@ class BlogSortBy(str, Enum):
     UPDATED_AT = "updated_at"
     SUBJECT = "subject"
     RELEVANCE = "relevance"
+    HOT = "hot"
 
 
 class BlogSortOrder(str, Enum):
     ASC = "asc"
     DESC = "desc"
+
+
+class VoteDirection(str, Enum):
+    UP = "up"
+    DOWN = "down"
@@ -0,0 +1,136 @@
+import logging
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.blog.models import Blog, BlogVote
+from app.blog.types import VoteDirection
+from app.events import BlogEvent, emit
+
+logger = logging.getLogger(__name__)
+
+
+def vote_deltas(
+    previous: Optional[VoteDirection], current: Optional[VoteDirection]
+) -> Tuple[int, int]:
+    """(upvotes, downvotes) change when a user's vote goes from previous to current."""
+    upvotes = (current == VoteDirection.UP) - (previous == VoteDirection.UP)
+    downvotes = (current == VoteDirection.DOWN) - (previous == VoteDirection.DOWN)
+    return upvotes, downvotes
+
+
+class VoteBuffer:
+    """Vote count deltas committed to the ledger but not yet on the blog rows.
+
+    Each vote writes only its own ledger row. The shared counters on a
+    popular blog row would otherwise take one locking UPDATE per vote, so
+    the deltas are coalesced here per blog and applied in one batch per
+    flush. Readers add the pending deltas to what they read from the row.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[int, Tuple[int, int]] = {}
+        self._flushing: Dict[int, Tuple[int, int]] = {}
+
+    def add(self, blog_id: int, upvotes: int, downvotes: int) -> None:
+        if not (upvotes or downvotes):
+            return
+        pending_up, pending_down = self._pending.get(blog_id, (0, 0))
+        self._pending[blog_id] = (pending_up + upvotes, pending_down + downvotes)
+
+    def pending(self, blog_id: int) -> Tuple[int, int]:
+        pending_up, pending_down = self._pending.get(blog_id, (0, 0))
+        flushing_up, flushing_down = self._flushing.get(blog_id, (0, 0))
+        return pending_up + flushing_up, pending_down + flushing_down
+
+    def merged(self, blog_id: int, upvotes: int, downvotes: int) -> Tuple[int, int]:
+        """Stored counts of a blog with its pending deltas applied."""
+        pending_up, pending_down = self.pending(blog_id)
+        return max(upvotes + pending_up, 0), max(downvotes + pending_down, 0)
+
+    def _requeue_flushing(self) -> None:
+        for blog_id, (up, down) in self._flushing.items():
+            self.add(blog_id, up, down)
+
+    async def flush(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        """Apply every pending delta in one transaction.
+
+        Deltas of a failed or cancelled flush are put back and retried on
+        the next one.
+        Blogs whose counters moved are announced with ``BlogEvent.VOTED``.
+        """
+        if not self._pending or self._flushing:
+            return
+        self._flushing, self._pending = self._pending, {}
+
+        blogs = Blog.__table__
+        # Clamped at zero: a retraction can be flushed by another worker
+        # before the vote it cancels; reconcile_vote_counters repairs that.
+        statement = (
+            update(blogs)
+            .where(blogs.c.id == bindparam("blog_id"))
+            .values(
+                upvotes=func.greatest(blogs.c.upvotes + bindparam("up"), 0),
+                downvotes=func.greatest(blogs.c.downvotes + bindparam("down"), 0),
+                updated_at=blogs.c.updated_at,
+            )
+        )
+        rows = [
+            {"blog_id": blog_id, "up": up, "down": down}
+            for blog_id, (up, down) in self._flushing.items()
+        ]
+        try:
+            async with session_maker() as db:
+                await db.execute(statement, rows)
+                await db.commit()
+        except Exception:
+            logger.exception("Failed to flush votes for %d blogs", len(rows))
+            self._requeue_flushing()
+            return
+        except BaseException:
+            # Cancelled, as the periodic flush is at shutdown: nothing was
+            # committed, so the final flush has to apply these deltas.
+            self._requeue_flushing()
+            raise
+        finally:
+            self._flushing = {}
+
+        for row in rows:
+            await emit(BlogEvent.VOTED, row["blog_id"])
+
+
+vote_buffer = VoteBuffer()
+
+
+async def reconcile_vote_counters(
+    db: AsyncSession, first_id: int = 0, last_id: Optional[int] = None
+) -> int:
+    """Recount the vote counters of blogs with ids in [first_id, last_id] from the ledger.
+
+    Deltas still buffered by running workers are added again when they are
+    flushed, so run it while the application is stopped.
+    """
+
+    def counted(direction: VoteDirection):
+        return (
+            select(func.count())
+            .where(BlogVote.blog_id == Blog.id, BlogVote.direction == direction)
+            .scalar_subquery()
+        )
+
+    statement = (
+        update(Blog)
+        .where(Blog.id >= first_id)
+        .values(
+            upvotes=counted(VoteDirection.UP),
+            downvotes=counted(VoteDirection.DOWN),
+            updated_at=Blog.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if last_id is not None:
+        statement = statement.where(Blog.id <= last_id)
+
+    result = await db.execute(statement)
+    return result.rowcount
@@ -0,0 +1,77 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_registry: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache(Generic[K, V]):
+    """In-process LRU cache whose entries also expire after a fixed TTL."""
+
+    def __init__(self, name: str, max_size: int, ttl_seconds: float):
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        _registry[name] = self
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[K, V], bool]) -> None:
+        stale = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def get_cache_stats() -> list[dict]:
+    return [cache.stats() for cache in _registry.values()]
@@ -0,0 +1,127 @@
+"""Closure table of the comment reply trees.
+
+Every comment has a ``comment_closure`` row for itself (depth 0) and one
+for each of its ancestors, so the replies below a comment, at any depth,
+are one primary key range. Rows are written with the comment and removed
+by the foreign key cascades when it is deleted.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable
+
+from sqlalchemy import bindparam, delete, insert, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.comment.counters import adjust_comment_counters, sentiment_deltas
+from app.comment.models import Comment, CommentClosure
+
+_CLOSURE_COLUMNS = ["ancestor_id", "descendant_id", "depth"]
+
+# Replies always have larger ids than the comments they answer, so in
+# descending id order every reply goes before its parent and no row is
+# left for the parent_comment_id cascade, which InnoDB stops after 15
+# nested levels.
+_DELETE_DEEPEST_FIRST = text(
+    "DELETE FROM comment WHERE id IN :ids ORDER BY id DESC"
+).bindparams(bindparam("ids", expanding=True))
+_DELETE_BLOG_COMMENTS = text(
+    "DELETE FROM comment WHERE blog_id = :blog_id ORDER BY id DESC"
+)
+
+
+async def add_comment_to_closure(
+    db: AsyncSession, comment_id: int, parent_comment_id: int | None
+) -> None:
+    """Insert the rows of a new comment: itself plus a copy of its parent's ancestors."""
+    rows = select(literal(comment_id), literal(comment_id), literal(0))
+    if parent_comment_id is not None:
+        rows = rows.union_all(
+            select(
+                CommentClosure.ancestor_id,
+                literal(comment_id),
+                CommentClosure.depth + 1,
+            ).where(CommentClosure.descendant_id == parent_comment_id)
+        )
+    await db.execute(insert(CommentClosure).from_select(_CLOSURE_COLUMNS, rows))
+
+
+async def delete_comment_subtrees(
+    db: AsyncSession, comment_ids: Iterable[int]
+) -> Dict[int, int]:
+    """Delete the given comments with all their replies and adjust the
+    counters of their blogs.
+
+    One SELECT reads the subtrees from the closure table and one DELETE
+    removes them, whatever their depth. Returns the number of comments
+    removed per blog; the caller commits.
+    """
+    comment_ids = list(comment_ids)
+    if not comment_ids:
+        return {}
+    rows = (
+        await db.execute(
+            select(Comment.id, Comment.blog_id, Comment.sentiment)
+            .join(CommentClosure, CommentClosure.descendant_id == Comment.id)
+            .where(CommentClosure.ancestor_id.in_(comment_ids))
+            .distinct()
+        )
+    ).all()
+    if not rows:
+        return {}
+
+    removed: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for row in rows:
+        counts = removed[row.blog_id]
+        counts["comments"] += 1
+        for name, delta in sentiment_deltas(row.sentiment).items():
+            counts[name] += delta
+    for blog_id, counts in removed.items():
+        await adjust_comment_counters(
+            db,
+            blog_id,
+            comments=-counts["comments"],
+            positive=-counts["positive"],
+            negative=-counts["negative"],
+        )
+
+    await db.execute(
+        _DELETE_DEEPEST_FIRST, {"ids": sorted((row.id for row in rows), reverse=True)}
+    )
+    return {blog_id: counts["comments"] for blog_id, counts in removed.items()}
+
+
+async def delete_blog_comments(db: AsyncSession, blog_id: int) -> None:
+    """Delete every comment of a blog, replies before the comments they answer.
+
+    Run before deleting the blog: its ON DELETE CASCADE would go down each
+    reply chain as nested cascades and fail on chains deeper than 15.
+    The blog's counters are left alone, since the blog goes too.
+    """
+    await db.execute(_DELETE_BLOG_COMMENTS, {"blog_id": blog_id})
+
+
+async def rebuild_comment_closure(db: AsyncSession) -> int:
+    """Recreate the closure table from the parent_comment_id links.
+
+    Needed after comments are inserted without the comment service, such
+    as bulk imports; walks every reply chain, so run it from maintenance
+    jobs rather than requests.
+    """
+    comments = Comment.__table__
+    paths = (
+        select(
+            comments.c.id.label("ancestor_id"),
+            comments.c.id.label("descendant_id"),
+            literal(0).label("depth"),
+        ).cte("comment_paths", recursive=True)
+    )
+    paths = paths.union_all(
+        select(paths.c.ancestor_id, comments.c.id, paths.c.depth + 1).join(
+            comments, comments.c.parent_comment_id == paths.c.descendant_id
+        )
+    )
+    await db.execute(delete(CommentClosure))
+    result = await db.execute(
+        insert(CommentClosure).from_select(_CLOSURE_COLUMNS, select(paths))
+    )
+    return result.rowcount
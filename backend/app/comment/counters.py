@@ -0,0 +1,91 @@
+from typing import Optional
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.blog.models import Blog
+from app.comment.models import Comment, CommentClosure, Sentiment
+
+
+def sentiment_deltas(sentiment: Sentiment) -> dict:
+    if sentiment == Sentiment.POSITIVE:
+        return {"positive": 1}
+    return {"negative": 1}
+
+
+async def adjust_comment_counters(
+    db: AsyncSession,
+    blog_id: int,
+    comments: int = 0,
+    positive: int = 0,
+    negative: int = 0,
+) -> None:
+    """Atomically shift a blog's comment counters by the given deltas.
+
+    ``updated_at`` is assigned to itself so neither the ORM ``onupdate`` nor
+    MySQL's ``ON UPDATE CURRENT_TIMESTAMP`` treats a comment as a blog edit.
+    """
+    await db.execute(
+        update(Blog)
+        .where(Blog.id == blog_id)
+        .values(
+            comment_count=Blog.comment_count + comments,
+            positive_count=Blog.positive_count + positive,
+            negative_count=Blog.negative_count + negative,
+            updated_at=Blog.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def count_comment_subtree(db: AsyncSession, comment_id: int) -> dict:
+    """Comment and sentiment totals of a comment together with all its replies."""
+
+    def counted(sentiment: Sentiment):
+        return func.coalesce(
+            func.sum(case((Comment.sentiment == sentiment, 1), else_=0)), 0
+        )
+
+    row = (
+        await db.execute(
+            select(
+                func.count(),
+                counted(Sentiment.POSITIVE),
+                counted(Sentiment.NEGATIVE),
+            )
+            .select_from(CommentClosure)
+            .join(Comment, Comment.id == CommentClosure.descendant_id)
+            .where(CommentClosure.ancestor_id == comment_id)
+        )
+    ).one()
+    return {"comments": row[0], "positive": row[1], "negative": row[2]}
+
+
+async def reconcile_comment_counters(
+    db: AsyncSession, first_id: int = 0, last_id: Optional[int] = None
+) -> int:
+    """Recount the counters of blogs with ids in [first_id, last_id] from comments."""
+
+    def counted(*criteria):
+        return (
+            select(func.count())
+            .where(Comment.blog_id == Blog.id, *criteria)
+            .scalar_subquery()
+        )
+
+    statement = (
+        update(Blog)
+        .where(Blog.id >= first_id)
+        .values(
+            comment_count=counted(),
+            positive_count=counted(Comment.sentiment == Sentiment.POSITIVE),
+            negative_count=counted(Comment.sentiment == Sentiment.NEGATIVE),
+            updated_at=Blog.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if last_id is not None:
+        statement = statement.where(Blog.id <= last_id)
+
+    result = await db.execute(statement)
+    return result.rowcount
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import Enum as SqlEnum
 
@@ -54,3 +54,31 @@ class Comment(BaseModel):
     replies: Mapped[List["Comment"]] = relationship(
         "Comment", back_populates="parent_comment", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        Index(
+            "ix_comment_blog_parent_created", "blog_id", "parent_comment_id", "created_at"
+        ),
+        Index("ix_comment_parent_comment_id", "parent_comment_id"),
+        Index("ix_comment_author_created", "author_username", "created_at"),
+    )
+
+
+class CommentClosure(BaseModel):
+    """A comment paired with each of its ancestors, and with itself at depth 0.
+
+    Maintained by app.comment.closure; reads and deletes of a whole
+    subtree go through the ancestor_id side of the primary key.
+    """
+
+    __tablename__ = "comment_closure"
+
+    ancestor_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("comment.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("comment.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer)
+
+    __table_args__ = (Index("ix_comment_closure_descendant", "descendant_id"),)
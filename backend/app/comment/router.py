@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional, Union
 from fastapi import APIRouter, Query, Request
 
 from app.auth.dependencies import UserDependency
@@ -7,15 +7,19 @@ from app.comment.schemas import (
     CommentCreateRequest,
     CommentUpdateRequest,
     CommentResponse,
+    CommentThreadResponse,
 )
 from app.comment.service import (
     create_comment_service,
     list_blog_comments_service,
+    list_comment_thread_service,
     update_comment_service,
     delete_comment_service,
 )
-from app.db.dependencies import DatabaseDependency
+from app.config import settings
+from app.db.dependencies import DatabaseDependency, ReadDatabaseDependency
 from app.limiter import limiter
+from app.schemas import CursorPaginatedResponse
 
 
 router = APIRouter()
@@ -40,19 +44,43 @@ async def create_comment(
 
 @router.get(
     "/{blog_id}/comments",
-    response_model=List[CommentResponse],
+    response_model=Union[
+        CursorPaginatedResponse[CommentThreadResponse],
+        CursorPaginatedResponse[CommentResponse],
+    ],
 )
 @limiter.limit("100/minute")
 async def list_blog_comments(
     request: Request,
     blog_id: int,
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
     parent_comment_id: Optional[int] = Query(
         None,
         description="Parent comment ID to load replies for. If None, loads root comments.",
     ),
+    depth: Optional[int] = Query(
+        None,
+        ge=1,
+        le=settings.COMMENT_THREAD_MAX_DEPTH,
+        description=(
+            "Load this many levels of replies in one request, as a depth-first "
+            "list in which every comment carries its depth."
+        ),
+    ),
+    size: int = Query(
+        settings.COMMENT_PAGE_SIZE,
+        ge=1,
+        le=settings.COMMENT_PAGE_MAX_SIZE,
+        description="Comments per page; with depth, replies count towards the page too",
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
 ):
-    return await list_blog_comments_service(blog_id, db, parent_comment_id)
+    """Comments oldest first, one page at a time."""
+    if depth is not None:
+        return await list_comment_thread_service(
+            blog_id, db, parent_comment_id, depth, cursor, size
+        )
+    return await list_blog_comments_service(blog_id, db, parent_comment_id, cursor, size)
 
 
 @router.patch(
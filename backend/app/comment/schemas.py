@@ -28,3 +28,8 @@ class CommentResponse(BaseModel):
     parent_comment_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
+
+
+class CommentThreadResponse(CommentResponse):
+    # 1 for the comments directly under the requested parent.
+    depth: int
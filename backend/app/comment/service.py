@@ -1,20 +1,42 @@
-from datetime import date
-from typing import List
+from datetime import datetime
+from typing import Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    String,
+    and_,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.auth.models import User
-from app.blog.exceptions import BlogNotFoundException, handle_database_error
+from app.blog.exceptions import (
+    BlogNotFoundException,
+    InvalidCursorException,
+    handle_database_error,
+)
 from app.blog.models import Blog
-from app.comment.models import Comment
+from app.comment.closure import add_comment_to_closure, delete_comment_subtrees
+from app.comment.counters import adjust_comment_counters, sentiment_deltas
+from app.comment.models import Comment, Sentiment
 from app.comment.schemas import (
     CommentCreateRequest,
     CommentResponse,
+    CommentThreadResponse,
     CommentUpdateRequest,
 )
-from app.user.models import UserDailyActivity
+from app.config import settings
+from app.events import BlogEvent, emit
+from app.schemas import CursorPaginatedResponse, CursorPaginationMeta
+from app.utils.cursor import decode_cursor, encode_cursor
 
 
 class CommentNotFoundException(HTTPException):
@@ -25,56 +47,86 @@ class CommentNotFoundException(HTTPException):
         )
 
 
-async def create_comment_service(
+async def check_new_comment(
     blog_id: int,
-    comment_data: CommentCreateRequest,
+    parent_comment_id: int | None,
     user: User,
     db: AsyncSession,
-) -> CommentResponse:
-    try:
-        blog = await db.get(Blog, blog_id)
-        if not blog:
-            raise BlogNotFoundException(blog_id)
-
-        if (
-            blog.author_username == user.username
-            and comment_data.parent_comment_id is None
-        ):
+) -> None:
+    """Validate a new comment against its blog and parent in one SELECT.
+
+    The blog row is locked here rather than by the counter UPDATE that
+    follows in the same transaction, so comment creations on a blog are
+    validated one at a time. The root comment check is a locking read as
+    well: it sees comments committed after this transaction's snapshot
+    was taken, such as a concurrent request's root comment.
+    """
+    query = select(Blog.author_username).where(Blog.id == blog_id)
+    if parent_comment_id is None:
+        query = query.add_columns(
+            select(literal(1))
+            .where(
+                Comment.blog_id == blog_id,
+                Comment.author_username == user.username,
+                Comment.parent_comment_id.is_(None),
+            )
+            .with_for_update(read=True)
+            .exists()
+            .label("has_root_comment")
+        )
+    else:
+        parent = aliased(Comment)
+        query = query.add_columns(
+            parent.blog_id.label("parent_blog_id"),
+            parent.author_username.label("parent_author"),
+        ).outerjoin(parent, parent.id == parent_comment_id)
+    row = (await db.execute(query.with_for_update())).first()
+    if row is None:
+        raise BlogNotFoundException(blog_id)
+
+    if parent_comment_id is None:
+        if row.author_username == user.username:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You cannot create root-level comments on your own blog. However, you can reply to existing comments.",
             )
-        # Editing service to make sure that users can comment "at most one time" on each blog- this only applies
-        # to root-level comments, no restrictions on replies
-        if comment_data.parent_comment_id is None:
-            existing_comment = await db.scalar(
-                select(Comment)
-                .where(Comment.blog_id == blog_id)
-                .where(Comment.author_username == user.username)
-                .where(Comment.parent_comment_id.is_(None))
+        # Users can comment "at most one time" on each blog; this only
+        # applies to root-level comments, there is no limit on replies.
+        if row.has_root_comment:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You have already commented on this blog. You can only make one root-level comment, but you can still post replies."
             )
+        return
+
+    if row.parent_blog_id is None:
+        raise CommentNotFoundException(parent_comment_id)
+    if row.parent_blog_id != blog_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Parent comment does not belong to this blog",
+        )
+    if row.parent_author == user.username:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You cannot reply to your own comment",
+        )
+
+
+async def create_comment_service(
+    blog_id: int,
+    comment_data: CommentCreateRequest,
+    user: User,
+    db: AsyncSession,
+) -> CommentResponse:
+    """Insert a comment in the transaction that took its daily quota.
 
-            if existing_comment:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="You have already commented on this blog. You can only make one root-level comment, but you can still post replies."
-                )
-        # end of new stuff for limiting comments to 1 per blog
-
-        if comment_data.parent_comment_id:
-            parent_comment = await db.get(Comment, comment_data.parent_comment_id)
-            if not parent_comment:
-                raise CommentNotFoundException(comment_data.parent_comment_id)
-            if parent_comment.blog_id != blog_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Parent comment does not belong to this blog",
-                )
-            if parent_comment.author_username == user.username:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="You cannot reply to your own comment",
-                )
+    The quota update (see ``can_create_comment``), one validation SELECT,
+    the INSERTs of the comment and its closure rows and the blog counter
+    UPDATE share a single commit.
+    """
+    try:
+        await check_new_comment(blog_id, comment_data.parent_comment_id, user, db)
 
         new_comment = Comment(
             content=comment_data.content,
@@ -84,20 +136,13 @@ async def create_comment_service(
             parent_comment_id=comment_data.parent_comment_id,
         )
         db.add(new_comment)
-        await db.commit()
-        await db.refresh(new_comment)
-
-        activity = await db.scalar(
-            select(UserDailyActivity).filter_by(
-                username=user.username, activity_date=date.today()
-            )
+        await db.flush()
+        await add_comment_to_closure(db, new_comment.id, new_comment.parent_comment_id)
+        await adjust_comment_counters(
+            db, blog_id, comments=1, **sentiment_deltas(new_comment.sentiment)
         )
-
-        if activity:
-            activity.comments_made += 1
-            db.add(activity)
-            await db.commit()
-            await db.refresh(activity)
+        await db.commit()
+        await emit(BlogEvent.COMMENTS_CHANGED, blog_id)
 
         return CommentResponse.model_validate(new_comment)
     except HTTPException:
@@ -108,44 +153,217 @@ async def create_comment_service(
         handle_database_error(e, "create comment")
 
 
+async def check_comment_parent(
+    blog_id: int, db: AsyncSession, parent_comment_id: int | None = None
+) -> None:
+    """Raise unless the blog exists and the parent, if any, is one of its comments."""
+    blog = await db.get(Blog, blog_id)
+    if not blog:
+        raise BlogNotFoundException(blog_id)
+
+    if parent_comment_id is not None:
+        parent_comment = await db.get(Comment, parent_comment_id)
+        if not parent_comment:
+            raise CommentNotFoundException(parent_comment_id)
+        if parent_comment.blog_id != blog_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Parent comment does not belong to this blog",
+            )
+
+
+def comment_top_level(parent_comment_id: int | None):
+    if parent_comment_id is None:
+        return Comment.parent_comment_id.is_(None)
+    return Comment.parent_comment_id == parent_comment_id
+
+
+def comment_after_cursor(cursor: str):
+    """Comments after the cursor position in (created_at, id) order."""
+    try:
+        created_at, comment_id = decode_cursor(cursor, 2)
+    except ValueError as e:
+        raise InvalidCursorException(str(e))
+    return or_(
+        Comment.created_at > created_at,
+        and_(Comment.created_at == created_at, Comment.id > comment_id),
+    )
+
+
+def comment_cursor(comment: CommentResponse) -> str:
+    return encode_cursor([comment.created_at, comment.id])
+
+
 async def list_blog_comments_service(
     blog_id: int,
     db: AsyncSession,
     parent_comment_id: int | None = None,
-) -> List[CommentResponse]:
+    cursor: str | None = None,
+    size: int | None = None,
+) -> CursorPaginatedResponse[CommentResponse]:
+    """One page of root comments, or of replies to a comment, oldest first."""
+    size = size or settings.COMMENT_PAGE_SIZE
+    query = select(Comment).where(
+        Comment.blog_id == blog_id, comment_top_level(parent_comment_id)
+    )
+    if cursor:
+        query = query.where(comment_after_cursor(cursor))
+    query = query.order_by(Comment.created_at, Comment.id).limit(size + 1)
+
     try:
-        blog = await db.get(Blog, blog_id)
-        if not blog:
-            raise BlogNotFoundException(blog_id)
-
-        if parent_comment_id is None:
-            result = await db.scalars(
-                select(Comment)
-                .where(Comment.blog_id == blog_id)
-                .where(Comment.parent_comment_id.is_(None))
-            )
-        else:
-            parent_comment = await db.get(Comment, parent_comment_id)
-            if not parent_comment:
-                raise CommentNotFoundException(parent_comment_id)
-            if parent_comment.blog_id != blog_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Parent comment does not belong to this blog",
-                )
-
-            result = await db.scalars(
-                select(Comment)
-                .where(Comment.blog_id == blog_id)
-                .where(Comment.parent_comment_id == parent_comment_id)
+        await check_comment_parent(blog_id, db, parent_comment_id)
+        comments = (await db.scalars(query)).all()
+    except HTTPException:
+        raise
+    except Exception as e:
+        handle_database_error(e, "list blog comments")
+
+    has_next = len(comments) > size
+    items = [CommentResponse.model_validate(comment) for comment in comments[:size]]
+    return CursorPaginatedResponse(
+        items=items,
+        meta=CursorPaginationMeta(
+            size=size,
+            next_cursor=comment_cursor(items[-1]) if has_next else None,
+            has_next=has_next,
+        ),
+    )
+
+
+# Fixed width sort key of one comment: created_at as text plus the
+# zero-padded id, so comparing keys as strings compares (created_at, id).
+_THREAD_KEY_WIDTH = 36
+
+
+def comment_thread_key(comment) -> ColumnElement[str]:
+    return cast(comment.created_at, String) + func.lpad(
+        comment.id, 10, "0", type_=String
+    )
+
+
+def decode_thread_cursor(cursor: str) -> Tuple[datetime, int, str]:
+    """The top-level comment of the last row served, and that row's path."""
+    try:
+        created_at, comment_id, path = decode_cursor(cursor, 3)
+    except ValueError as e:
+        raise InvalidCursorException(str(e))
+    if not isinstance(created_at, datetime) or not isinstance(path, str):
+        raise InvalidCursorException(f"Malformed cursor: {cursor}")
+    return created_at, comment_id, path
+
+
+def build_comment_thread_query(
+    blog_id: int,
+    parent_comment_id: int | None,
+    depth: int,
+    cursor: str | None,
+    size: int,
+) -> Select:
+    """Up to ``size + 1`` comments below the parent, depth-first, with at
+    most ``depth`` levels; each row carries its level and its path.
+
+    A recursive CTE walks the (blog_id, parent_comment_id, created_at)
+    index down from the page's top-level comments and concatenates the
+    sort keys of every comment's ancestors into its path, so ordering by
+    path is depth-first order and the limit caps the whole page, replies
+    included. A cursor holds the last path served and resumes inside its
+    subtree.
+    """
+    position = decode_thread_cursor(cursor) if cursor else None
+
+    page = select(Comment.id, comment_thread_key(Comment).label("thread_key")).where(
+        Comment.blog_id == blog_id, comment_top_level(parent_comment_id)
+    )
+    if position:
+        created_at, comment_id, _ = position
+        # From the top-level comment the last page ended in, which may
+        # have replies left.
+        page = page.where(
+            or_(
+                Comment.created_at > created_at,
+                and_(Comment.created_at == created_at, Comment.id >= comment_id),
             )
+        )
+    # A page of size + 1 rows spans at most size + 2 top-level comments:
+    # the cursor's own may have nothing left.
+    page = (
+        page.order_by(Comment.created_at, Comment.id)
+        .limit(size + 2)
+        .subquery("thread_page")
+    )
+
+    thread = select(
+        page.c.id,
+        literal(1).label("level"),
+        cast(page.c.thread_key, String(_THREAD_KEY_WIDTH * depth)).label("path"),
+    ).cte("comment_thread", recursive=True)
+    reply = aliased(Comment)
+    thread = thread.union_all(
+        select(
+            reply.id, thread.c.level + 1, thread.c.path + comment_thread_key(reply)
+        ).where(
+            reply.blog_id == blog_id,
+            reply.parent_comment_id == thread.c.id,
+            thread.c.level < depth,
+        )
+    )
 
-        comments = result.all()
-        return [CommentResponse.model_validate(comment) for comment in comments]
+    query = select(Comment, thread.c.level, thread.c.path).join(
+        thread, thread.c.id == Comment.id
+    )
+    if position:
+        query = query.where(thread.c.path > position[2])
+    return query.order_by(thread.c.path).limit(size + 1)
+
+
+async def list_comment_thread_service(
+    blog_id: int,
+    db: AsyncSession,
+    parent_comment_id: int | None = None,
+    depth: int = 1,
+    cursor: str | None = None,
+    size: int | None = None,
+) -> CursorPaginatedResponse[CommentThreadResponse]:
+    """A page of ``size`` comments with up to ``depth`` levels of replies,
+    every reply right after its parent, from a single query. Pages are
+    counted in rows of any level, so a long reply chain spreads over
+    several pages.
+    """
+    size = size or settings.COMMENT_PAGE_SIZE
+    query = build_comment_thread_query(blog_id, parent_comment_id, depth, cursor, size)
+    try:
+        rows = (await db.execute(query)).tuples().all()
+        if not rows:
+            # Only an empty result needs the lookups that tell a missing
+            # blog or parent apart from a thread with no comments.
+            await check_comment_parent(blog_id, db, parent_comment_id)
     except HTTPException:
         raise
     except Exception as e:
-        handle_database_error(e, "list blog comments")
+        handle_database_error(e, "list comment thread")
+
+    has_next = len(rows) > size
+    rows = rows[:size]
+
+    next_cursor = None
+    if has_next:
+        # The top-level comment of the last row is the last level 1 row,
+        # or the one the previous page already ended in.
+        top_level = decode_thread_cursor(cursor)[:2] if cursor else None
+        for comment, level, _ in rows:
+            if level == 1:
+                top_level = (comment.created_at, comment.id)
+        next_cursor = encode_cursor([*top_level, rows[-1][2]])
+
+    return CursorPaginatedResponse(
+        items=[
+            CommentThreadResponse(
+                **CommentResponse.model_validate(comment).model_dump(), depth=level
+            )
+            for comment, level, _ in rows
+        ],
+        meta=CursorPaginationMeta(size=size, next_cursor=next_cursor, has_next=has_next),
+    )
 
 
 async def update_comment_service(
@@ -158,11 +376,32 @@ async def update_comment_service(
         if not comment:
             raise CommentNotFoundException(comment_id)
 
+        # Decided by the row itself rather than the copy in the session:
+        # of two concurrent flips only one changes the row, so only that
+        # one moves the comment from one sentiment counter to the other.
+        # With the sentiment in the WHERE clause, matched rows are changed
+        # rows, so the driver's FOUND_ROWS flag does not affect rowcount.
+        flipped = await db.execute(
+            update(Comment)
+            .where(
+                Comment.id == comment_id,
+                Comment.sentiment != comment_data.sentiment,
+            )
+            .values(sentiment=comment_data.sentiment)
+            .execution_options(synchronize_session=False)
+        )
+        if flipped.rowcount == 1:
+            shift = 1 if comment_data.sentiment == Sentiment.POSITIVE else -1
+            await adjust_comment_counters(
+                db, comment.blog_id, positive=shift, negative=-shift
+            )
+
         comment.content = comment_data.content
         comment.sentiment = comment_data.sentiment
         db.add(comment)
         await db.commit()
         await db.refresh(comment)
+        await emit(BlogEvent.COMMENTS_CHANGED, comment.blog_id)
 
         return CommentResponse.model_validate(comment)
     except HTTPException:
@@ -182,8 +421,11 @@ async def delete_comment_service(
         if not comment:
             raise CommentNotFoundException(comment_id)
 
-        await db.delete(comment)
+        blog_id = comment.blog_id
+        # Replies are deleted with the comment, so they leave the counts too.
+        await delete_comment_subtrees(db, [comment_id])
         await db.commit()
+        await emit(BlogEvent.COMMENTS_CHANGED, blog_id)
     except HTTPException:
         await db.rollback()
         raise
@@ -1,3 +1,5 @@
+from typing import Dict, Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,6 +14,18 @@ class Settings(BaseSettings):
     MYSQL_PASSWORD: str
 
     DB_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_PREWARM: int = 0
+
+    DB_REPLICA_URL: Optional[str] = None
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
+
+    SQL_INSTRUMENTATION: bool = True
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = 3
 
     DEBUG: bool = False
 
@@ -19,6 +33,51 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
 
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+
+    USER_LIMITS_CACHE_TTL_SECONDS: int = 300
+    USER_LIMITS_CACHE_MAX_SIZE: int = 10_000
+
+    SEARCH_CACHE_TTL_SECONDS: int = 30
+    SEARCH_CACHE_MAX_SIZE: int = 1_000
+
+    SEARCH_BACKEND: Literal["mysql", "bm25"] = "mysql"
+    SEARCH_BM25_MAX_RESULTS: int = 10_000
+    SEARCH_SNAPSHOT_PATH: str = "data/search_index.pickle"
+    SEARCH_SNAPSHOT_INTERVAL_SECONDS: int = 300
+    SEARCH_INDEX_REFRESH_SECONDS: int = 30
+
+    # Cache-Control per route policy; "no-cache" lets clients keep a copy but
+    # revalidate it with If-None-Match on every use.
+    CACHE_CONTROL_POLICIES: Dict[str, str] = {
+        "blog_detail": "no-cache",
+        "user_profile": "no-cache",
+    }
+
+    TAG_GC_INTERVAL_SECONDS: int = 3600
+    TAG_GC_BATCH_SIZE: int = 500
+
+    BLOG_EXPORT_BATCH_SIZE: int = 500
+
+    COMMENT_PAGE_SIZE: int = 50
+    COMMENT_PAGE_MAX_SIZE: int = 200
+    COMMENT_THREAD_MAX_DEPTH: int = 50
+
+    VOTE_FLUSH_INTERVAL_SECONDS: int = 5
+    HOT_SCORE_REFRESH_SECONDS: int = 15
+
+    TIMELINE_FANOUT_MAX_FOLLOWERS: int = 1000
+    TIMELINE_MAX_ENTRIES: int = 800
+    TIMELINE_PULL_AUTHORS_TTL_SECONDS: int = 60
+    TIMELINE_PULL_AUTHORS_REFRESH_SECONDS: int = 60
+    TIMELINE_TRIM_INTERVAL_SECONDS: int = 3600
+    TIMELINE_TRIM_BATCH_SIZE: int = 500
+
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 5.0
+
     DEFAULT_COMMENT_LIMIT: int
     DEFAULT_BLOG_LIMIT: int
 
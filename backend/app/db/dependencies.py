@@ -1,13 +1,49 @@
 from collections.abc import AsyncGenerator
 
 from fastapi import Depends, Request
+from slowapi.util import get_remote_address
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
+from app.cache import TTLCache
+from app.config import settings
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Clients that wrote recently keep reading from the primary until replication
+# has had a chance to catch up with their own writes.
+recent_writers: TTLCache[str, bool] = TTLCache(
+    "read_your_writes",
+    max_size=100_000,
+    ttl_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+)
+
+
+def client_key(request: Request) -> str:
+    return request.headers.get("authorization") or get_remote_address(request)
+
 
 async def db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    writer = request.method not in SAFE_METHODS
+    if writer:
+        recent_writers.set(client_key(request), True)
+
     async with request.app.state.db_session() as async_session:
         yield async_session
 
+    if writer:
+        recent_writers.set(client_key(request), True)
+
+
+async def db_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    if recent_writers.get(client_key(request)):
+        session_factory = request.app.state.db_session
+    else:
+        session_factory = request.app.state.db_read_session
+
+    async with session_factory() as async_session:
+        yield async_session
+
 
 DatabaseDependency = Annotated[AsyncSession, Depends(db_session)]
+ReadDatabaseDependency = Annotated[AsyncSession, Depends(db_read_session)]
@@ -0,0 +1,108 @@
+import asyncio
+import time
+from collections import deque
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.config import settings
+
+
+class PoolMetrics:
+    def __init__(self, sample_size: int = 1024):
+        self.waiting = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.max_checkout_ms = 0.0
+        self._samples: deque[float] = deque(maxlen=sample_size)
+
+    def record(self, elapsed_ms: float) -> None:
+        self.checkouts += 1
+        self.max_checkout_ms = max(self.max_checkout_ms, elapsed_ms)
+        self._samples.append(elapsed_ms)
+
+    def percentile(self, pct: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that tracks waiters and how long each checkout takes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _exhausted(self) -> bool:
+        return (
+            self._max_overflow > -1
+            and self.checkedout() >= self.size() + self._max_overflow
+        )
+
+    def _do_get(self):
+        # Only a checkout that finds every connection in use queues for one;
+        # the others are handed a pooled or new overflow connection.
+        waiting = self._exhausted()
+        if waiting:
+            self.metrics.waiting += 1
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            if waiting:
+                self.metrics.waiting -= 1
+
+        self.metrics.record((time.perf_counter() - start) * 1000)
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def create_db_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+async def prewarm_pool(engine: AsyncEngine, connections: int) -> None:
+    if connections <= 0:
+        return
+
+    opened = await asyncio.gather(*(engine.connect() for _ in range(connections)))
+    for connection in opened:
+        await connection.close()
+
+
+def pool_status(engine: AsyncEngine) -> dict:
+    pool = engine.pool
+    metrics: PoolMetrics = pool.metrics
+    return {
+        "size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "waiting": metrics.waiting,
+        "checkouts": metrics.checkouts,
+        "timeouts": metrics.timeouts,
+        "checkout_ms_p50": metrics.percentile(50),
+        "checkout_ms_p99": metrics.percentile(99),
+        "checkout_ms_max": metrics.max_checkout_ms,
+    }
@@ -0,0 +1,104 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.statements[statement] += 1
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+# The start time lives on the execution context, which is discarded with
+# its statement; a statement that raises leaves nothing behind on the
+# pooled connection.
+_QUERY_START = "_query_stats_start"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    setattr(context, _QUERY_START, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, _QUERY_START, None)
+    stats = _current_stats.get()
+    if stats is not None and start is not None:
+        stats.record(statement, (time.perf_counter() - start) * 1000)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+async def query_stats_middleware(request: Request, call_next):
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        _current_stats.reset(token)
+
+    response.headers["X-DB-Query-Count"] = str(stats.count)
+    response.headers["X-DB-Query-Time-Ms"] = f"{stats.total_ms:.2f}"
+
+    if stats.count:
+        logger.debug(
+            "%s %s ran %d statements in %.2fms; slowest %.2fms: %s",
+            request.method,
+            request.url.path,
+            stats.count,
+            stats.total_ms,
+            stats.slowest_ms,
+            stats.slowest_statement,
+        )
+
+    if settings.DEBUG:
+        threshold = settings.SQL_REPEATED_STATEMENT_THRESHOLD
+        for statement, count in stats.repeated_statements(threshold):
+            logger.warning(
+                "Possible N+1 in %s %s: statement executed %d times: %s",
+                request.method,
+                request.url.path,
+                count,
+                statement,
+            )
+
+    return response
@@ -0,0 +1,84 @@
+"""Apply versioned SQL migrations from app/db/migrations.
+
+Every migration must also be reflected in init.sql (which records it in
+schema_migrations) and in the ORM models, so fresh and migrated databases end
+up with the same schema.
+
+    python -m app.db.migrate            # apply pending migrations
+    python -m app.db.migrate --status   # list applied and pending migrations
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.config import settings
+from app.db.engine import create_db_engine
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+CREATE_MIGRATIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS `schema_migrations` (
+    version VARCHAR(255) PRIMARY KEY,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def discover_migrations() -> list[Path]:
+    return sorted(MIGRATIONS_DIR.glob("[0-9][0-9][0-9][0-9]_*.sql"))
+
+
+def split_statements(sql: str) -> list[str]:
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [
+        statement.strip()
+        for statement in "\n".join(lines).split(";")
+        if statement.strip()
+    ]
+
+
+async def applied_versions(conn: AsyncConnection) -> set[str]:
+    await conn.execute(text(CREATE_MIGRATIONS_TABLE))
+    result = await conn.execute(text("SELECT version FROM schema_migrations"))
+    return set(result.scalars().all())
+
+
+async def migrate(status_only: bool = False) -> None:
+    engine = create_db_engine(str(settings.DB_URL))
+
+    try:
+        async with engine.connect() as conn:
+            applied = await applied_versions(conn)
+            await conn.commit()
+
+            for path in discover_migrations():
+                version = path.stem
+                if version in applied:
+                    print(f"  applied  {version}")
+                    continue
+
+                if status_only:
+                    print(f"  pending  {version}")
+                    continue
+
+                print(f"  applying {version}")
+                for statement in split_statements(path.read_text(encoding="utf-8")):
+                    await conn.execute(text(statement))
+                await conn.execute(
+                    text("INSERT INTO schema_migrations (version) VALUES (:version)"),
+                    {"version": version},
+                )
+                await conn.commit()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply database migrations")
+    parser.add_argument("--status", action="store_true", help="only list migrations")
+    args = parser.parse_args()
+    asyncio.run(migrate(status_only=args.status))
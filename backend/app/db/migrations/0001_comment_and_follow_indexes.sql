@@ -0,0 +1,8 @@
+-- Comment listings filter on (blog_id, parent_comment_id); user comment
+-- history filters on author and sorts by creation time.
+CREATE INDEX `ix_comment_blog_parent` ON `comment` (blog_id, parent_comment_id);
+CREATE INDEX `ix_comment_parent_comment_id` ON `comment` (parent_comment_id);
+CREATE INDEX `ix_comment_author_created` ON `comment` (author_username, created_at);
+
+-- Follower listings filter on the followed user and sort by follow time.
+CREATE INDEX `ix_user_follow_following_created` ON `user_follow` (following_username, created_at);
@@ -0,0 +1,4 @@
+-- Keyset pagination on blog search seeks on (status, sort column) for the
+-- updated_at and subject sorts; created_at is already covered.
+CREATE INDEX `idx_blog_status_updated` ON `blog` (status, updated_at);
+CREATE INDEX `idx_blog_status_subject` ON `blog` (status, subject);
@@ -0,0 +1,23 @@
+-- Per-blog comment counters, maintained by the comment services so the
+-- all-positive-comments search filter becomes an indexed predicate.
+ALTER TABLE `blog`
+    ADD COLUMN comment_count INT NOT NULL DEFAULT 0,
+    ADD COLUMN positive_count INT NOT NULL DEFAULT 0,
+    ADD COLUMN negative_count INT NOT NULL DEFAULT 0;
+
+-- Keep updated_at as it is; counting comments is not an edit of the blog.
+UPDATE `blog` b
+JOIN (
+    SELECT blog_id,
+           COUNT(*) AS comment_count,
+           SUM(sentiment = 'POSITIVE') AS positive_count,
+           SUM(sentiment = 'NEGATIVE') AS negative_count
+    FROM `comment`
+    GROUP BY blog_id
+) c ON c.blog_id = b.id
+SET b.comment_count = c.comment_count,
+    b.positive_count = c.positive_count,
+    b.negative_count = c.negative_count,
+    b.updated_at = b.updated_at;
+
+CREATE INDEX `idx_blog_status_sentiment` ON `blog` (status, negative_count, comment_count);
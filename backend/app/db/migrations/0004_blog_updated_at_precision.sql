@@ -0,0 +1,4 @@
+-- blog.updated_at versions the blog for ETags; with whole seconds two edits
+-- in the same second would share a tag.
+ALTER TABLE `blog`
+    MODIFY updated_at TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
@@ -0,0 +1,14 @@
+-- Per-day blog counts for /blog/activity-dates. Filtering on
+-- DATE(blog.created_at) cannot use ix_blog_created_at, so the calendar
+-- reads this rollup by primary key instead.
+CREATE TABLE IF NOT EXISTS `blog_daily_activity` (
+    activity_date DATE PRIMARY KEY,
+    blog_count INT NOT NULL DEFAULT 0,
+    CHECK (blog_count >= 0)
+);
+
+INSERT INTO `blog_daily_activity` (activity_date, blog_count)
+SELECT DATE(created_at), COUNT(*)
+FROM `blog`
+GROUP BY DATE(created_at)
+ON DUPLICATE KEY UPDATE blog_count = VALUES(blog_count);
@@ -0,0 +1,2 @@
+-- The author dashboard pages through a user's blogs newest first.
+CREATE INDEX `idx_blog_author_created` ON `blog` (author_username, created_at);
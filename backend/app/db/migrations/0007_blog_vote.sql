@@ -0,0 +1,13 @@
+-- Per-user vote ledger. It deduplicates votes and is the source of truth
+-- for blog.upvotes and blog.downvotes, which are updated in batches.
+CREATE TABLE IF NOT EXISTS `blog_vote` (
+    blog_id INT NOT NULL,
+    username VARCHAR(50) NOT NULL,
+    direction VARCHAR(10) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (blog_id, username),
+    FOREIGN KEY (blog_id) REFERENCES `blog`(id) ON DELETE CASCADE,
+    FOREIGN KEY (username) REFERENCES `user`(username) ON DELETE CASCADE,
+    CHECK (direction IN ('UP', 'DOWN')),
+    INDEX `ix_blog_vote_username` (username)
+);
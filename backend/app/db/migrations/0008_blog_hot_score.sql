@@ -0,0 +1,14 @@
+-- Precomputed popularity for the hot feed, read in (status, hot_score)
+-- index order. Same formula as app.blog.hot.hot_score.
+ALTER TABLE `blog` ADD COLUMN hot_score DOUBLE NOT NULL DEFAULT 0;
+
+UPDATE `blog`
+SET hot_score = ROUND(
+        SIGN(upvotes - downvotes + 0.5 * comment_count)
+        * LOG10(GREATEST(ABS(upvotes - downvotes + 0.5 * comment_count), 1))
+        + TIMESTAMPDIFF(SECOND, '2024-01-01 00:00:00', created_at) / 45000,
+        7
+    ),
+    updated_at = updated_at;
+
+CREATE INDEX `idx_blog_status_hot` ON `blog` (status, hot_score);
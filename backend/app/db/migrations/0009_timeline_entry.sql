@@ -0,0 +1,27 @@
+-- Home timeline entries pushed to followers of authors below
+-- TIMELINE_FANOUT_MAX_FOLLOWERS (default 1000) when a blog is published.
+CREATE TABLE IF NOT EXISTS `timeline_entry` (
+    username VARCHAR(50) NOT NULL,
+    blog_id INT NOT NULL,
+    author_username VARCHAR(50) NOT NULL,
+    blog_created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (username, blog_id),
+    FOREIGN KEY (username) REFERENCES `user`(username) ON DELETE CASCADE,
+    FOREIGN KEY (blog_id) REFERENCES `blog`(id) ON DELETE CASCADE,
+    INDEX `ix_timeline_entry_user_created` (username, blog_created_at, blog_id),
+    INDEX `ix_timeline_entry_blog_id` (blog_id)
+);
+
+-- Backfill with the default threshold; the periodic trim cuts each
+-- timeline down to TIMELINE_MAX_ENTRIES afterwards.
+INSERT IGNORE INTO `timeline_entry` (username, blog_id, author_username, blog_created_at)
+SELECT f.follower_username, b.id, b.author_username, b.created_at
+FROM `user_follow` f
+JOIN `blog` b ON b.author_username = f.following_username
+WHERE b.status = 'PUBLISHED'
+  AND f.following_username IN (
+      SELECT following_username
+      FROM `user_follow`
+      GROUP BY following_username
+      HAVING COUNT(*) <= 1000
+  );
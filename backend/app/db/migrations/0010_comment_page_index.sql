@@ -0,0 +1,5 @@
+-- Comment pages are read in (created_at, id) order per blog and parent.
+-- The new index covers every lookup of the one it replaces.
+CREATE INDEX `ix_comment_blog_parent_created` ON `comment` (blog_id, parent_comment_id, created_at);
+
+DROP INDEX `ix_comment_blog_parent` ON `comment`;
@@ -0,0 +1,23 @@
+-- Closure table of the comment reply trees: one row per comment and each
+-- of its ancestors, plus one for the comment itself at depth 0.
+CREATE TABLE IF NOT EXISTS `comment_closure` (
+    ancestor_id INT NOT NULL,
+    descendant_id INT NOT NULL,
+    depth INT NOT NULL,
+    PRIMARY KEY (ancestor_id, descendant_id),
+    FOREIGN KEY (ancestor_id) REFERENCES `comment`(id) ON DELETE CASCADE,
+    FOREIGN KEY (descendant_id) REFERENCES `comment`(id) ON DELETE CASCADE,
+    INDEX `ix_comment_closure_descendant` (descendant_id)
+);
+
+-- Backfill from the parent links. Same as
+-- app.comment.closure.rebuild_comment_closure.
+INSERT INTO `comment_closure` (ancestor_id, descendant_id, depth)
+WITH RECURSIVE comment_paths (ancestor_id, descendant_id, depth) AS (
+    SELECT id, id, 0 FROM `comment`
+    UNION ALL
+    SELECT p.ancestor_id, c.id, p.depth + 1
+    FROM comment_paths p
+    JOIN `comment` c ON c.parent_comment_id = p.descendant_id
+)
+SELECT ancestor_id, descendant_id, depth FROM comment_paths;
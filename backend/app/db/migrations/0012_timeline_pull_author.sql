@@ -0,0 +1,15 @@
+-- Authors above TIMELINE_FANOUT_MAX_FOLLOWERS (default 1000), whose blogs
+-- are merged into home timelines at read time. Maintained by the periodic
+-- pull author refresh instead of a follower count on every request.
+CREATE TABLE IF NOT EXISTS `timeline_pull_author` (
+    username VARCHAR(50) NOT NULL PRIMARY KEY,
+    leaving_since TIMESTAMP NULL,
+    FOREIGN KEY (username) REFERENCES `user`(username) ON DELETE CASCADE
+);
+
+-- Seed with the default threshold, matching the 0009 backfill.
+INSERT IGNORE INTO `timeline_pull_author` (username)
+SELECT following_username
+FROM `user_follow`
+GROUP BY following_username
+HAVING COUNT(*) > 1000;
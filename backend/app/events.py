@@ -0,0 +1,47 @@
+import inspect
+import logging
+from collections import defaultdict
+from enum import Enum
+from typing import Awaitable, Callable, Dict, List, Union
+
+logger = logging.getLogger(__name__)
+
+
+class BlogEvent(str, Enum):
+    PUBLISHED = "published"
+    DELISTED = "delisted"
+    EDITED = "edited"
+    RETAGGED = "retagged"
+    DELETED = "deleted"
+    COMMENTS_CHANGED = "comments_changed"
+    VOTED = "voted"
+
+
+Handler = Callable[[BlogEvent, int], Union[None, Awaitable[None]]]
+
+_subscribers: Dict[BlogEvent, List[Handler]] = defaultdict(list)
+
+
+def subscribe(*events: BlogEvent) -> Callable[[Handler], Handler]:
+    """Register a handler for the given events; handlers may be sync or async."""
+
+    def decorator(handler: Handler) -> Handler:
+        for event in events:
+            _subscribers[event].append(handler)
+        return handler
+
+    return decorator
+
+
+async def emit(event: BlogEvent, blog_id: int) -> None:
+    """Notify subscribers after a change has been committed.
+
+    A failing handler is logged and never fails the request that emitted it.
+    """
+    for handler in _subscribers[event]:
+        try:
+            result = handler(event, blog_id)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.exception("Handler %r failed for %s", handler, event.value)
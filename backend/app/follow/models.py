@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, String
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import BaseModel
@@ -38,4 +38,7 @@ class UserFollow(BaseModel):
         CheckConstraint(
             "follower_username != following_username", name="check_no_self_follow"
         ),
+        Index(
+            "ix_user_follow_following_created", "following_username", "created_at"
+        ),
     )
@@ -3,7 +3,7 @@ from typing import List
 from fastapi import APIRouter, Request, status
 
 from app.auth.dependencies import UserDependency
-from app.db.dependencies import DatabaseDependency
+from app.db.dependencies import DatabaseDependency, ReadDatabaseDependency
 from app.follow.schemas import (
     FollowerResponse,
     FollowingResponse,
@@ -45,13 +45,13 @@ async def unfollow_user(
 
 @router.get("/users/{username}/followers", response_model=List[FollowerResponse])
 @limiter.limit("60/minute")
-async def get_followers(request: Request, username: str, db: DatabaseDependency):
+async def get_followers(request: Request, username: str, db: ReadDatabaseDependency):
     return await get_followers_service(username, db)
 
 
 @router.get("/users/{username}/following", response_model=List[FollowingResponse])
 @limiter.limit("60/minute")
-async def get_following(request: Request, username: str, db: DatabaseDependency):
+async def get_following(request: Request, username: str, db: ReadDatabaseDependency):
     return await get_following_service(username, db)
 
 
@@ -12,6 +12,7 @@ from app.follow.schemas import (
     FollowResponse,
     UserFollowStats,
 )
+from app.timeline.fanout import add_author_to_timeline, remove_author_from_timeline
 
 
 async def follow_user_service(
@@ -45,6 +46,7 @@ async def follow_user_service(
         follower_username=current_user.username, following_username=target_username
     )
     db.add(follow)
+    await add_author_to_timeline(db, current_user.username, target_username)
     await db.commit()
     await db.refresh(follow)
 
@@ -67,6 +69,7 @@ async def unfollow_user_service(
         )
 
     await db.delete(follow)
+    await remove_author_from_timeline(db, current_user.username, target_username)
     await db.commit()
 
 
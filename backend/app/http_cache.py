@@ -0,0 +1,38 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+from app.config import settings
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong entity tag for a representation identified by ``parts``."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether ``If-None-Match`` already names ``etag`` (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in header.split(","))
+    return etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+def cache_control_for(policy: str) -> str:
+    return settings.CACHE_CONTROL_POLICIES.get(policy, "no-cache")
+
+
+def set_cache_headers(response: Response, etag: str, policy: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control_for(policy)
+
+
+def not_modified(etag: str, policy: str) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(response, etag, policy)
+    return response
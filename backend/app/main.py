@@ -1,25 +1,106 @@
 from contextlib import asynccontextmanager
+from functools import partial
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.auth.security import password_hasher
+from app.blog.hot import refresh_hot_scores
+from app.blog.tags import sweep_orphaned_tags
+from app.blog.votes import vote_buffer
 from app.config import settings
+from app.db.engine import create_db_engine, prewarm_pool
+from app.db.instrumentation import instrument_engine, query_stats_middleware
 from app.limiter import limiter
 from app.routers import api_router
+from app.search.indexer import search_indexer
+from app.tasks import cancel_tasks, run_periodically
+from app.timeline.fanout import refresh_pull_authors, trim_timelines
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.state.db_engine = create_async_engine(
-        str(settings.DB_URL), echo=settings.DEBUG, future=True
-    )
+    app.state.db_engine = create_db_engine(str(settings.DB_URL))
+    if settings.SQL_INSTRUMENTATION:
+        instrument_engine(app.state.db_engine)
     app.state.db_session = async_sessionmaker(
         bind=app.state.db_engine, expire_on_commit=False, class_=AsyncSession
     )
+    await prewarm_pool(app.state.db_engine, settings.DB_POOL_PREWARM)
+
+    app.state.db_replica_engine = None
+    app.state.db_read_session = app.state.db_session
+    if settings.DB_REPLICA_URL:
+        app.state.db_replica_engine = create_db_engine(str(settings.DB_REPLICA_URL))
+        if settings.SQL_INSTRUMENTATION:
+            instrument_engine(app.state.db_replica_engine)
+        app.state.db_read_session = async_sessionmaker(
+            bind=app.state.db_replica_engine,
+            expire_on_commit=False,
+            class_=AsyncSession,
+        )
+        await prewarm_pool(app.state.db_replica_engine, settings.DB_POOL_PREWARM)
+
+    password_hasher.start()
+
+    background_tasks = [
+        run_periodically(
+            "tag_gc",
+            settings.TAG_GC_INTERVAL_SECONDS,
+            partial(sweep_orphaned_tags, app.state.db_session, settings.TAG_GC_BATCH_SIZE),
+        ),
+        run_periodically(
+            "vote_flush",
+            settings.VOTE_FLUSH_INTERVAL_SECONDS,
+            partial(vote_buffer.flush, app.state.db_session),
+        ),
+        run_periodically(
+            "hot_score_refresh",
+            settings.HOT_SCORE_REFRESH_SECONDS,
+            partial(refresh_hot_scores, app.state.db_session),
+        ),
+        run_periodically(
+            "timeline_pull_authors",
+            settings.TIMELINE_PULL_AUTHORS_REFRESH_SECONDS,
+            partial(refresh_pull_authors, app.state.db_session),
+        ),
+        run_periodically(
+            "timeline_trim",
+            settings.TIMELINE_TRIM_INTERVAL_SECONDS,
+            partial(
+                trim_timelines,
+                app.state.db_session,
+                settings.TIMELINE_MAX_ENTRIES,
+                settings.TIMELINE_TRIM_BATCH_SIZE,
+            ),
+        ),
+    ]
+    if settings.SEARCH_BACKEND == "bm25":
+        await search_indexer.start(app.state.db_session)
+        background_tasks += [
+            run_periodically(
+                "search_index_refresh",
+                settings.SEARCH_INDEX_REFRESH_SECONDS,
+                search_indexer.refresh,
+            ),
+            run_periodically(
+                "search_index_snapshot",
+                settings.SEARCH_SNAPSHOT_INTERVAL_SECONDS,
+                search_indexer.snapshot,
+            ),
+        ]
+
     yield
+    await cancel_tasks(*background_tasks)
+    await vote_buffer.flush(app.state.db_session)
+    await search_indexer.snapshot()
+    password_hasher.shutdown()
+    await app.state.db_engine.dispose()
+    if app.state.db_replica_engine is not None:
+        await app.state.db_replica_engine.dispose()
 
 
 app = FastAPI(
@@ -35,6 +116,9 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
+if settings.SQL_INSTRUMENTATION:
+    app.middleware("http")(query_stats_middleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Request
+
+from app.cache import get_cache_stats
+from app.db.engine import pool_status
+from app.limiter import limiter
+
+router = APIRouter()
+
+
+@router.get("/caches")
+@limiter.limit("60/minute")
+async def cache_metrics(request: Request):
+    return {"caches": get_cache_stats()}
+
+
+@router.get("/pool")
+@limiter.limit("60/minute")
+async def pool_metrics(request: Request):
+    pools = {"primary": pool_status(request.app.state.db_engine)}
+    if request.app.state.db_replica_engine is not None:
+        pools["replica"] = pool_status(request.app.state.db_replica_engine)
+    return pools
@@ -4,6 +4,8 @@ from app.auth.router import router as auth_router
 from app.blog.router import router as blog_router
 from app.comment.router import router as comment_router
 from app.follow.router import router as follow_router
+from app.metrics.router import router as metrics_router
+from app.timeline.router import router as timeline_router
 from app.user.router import router as user_router
 
 api_router = APIRouter()
@@ -14,3 +16,5 @@ api_router.include_router(blog_router, prefix="/blog", tags=["blog"])
 api_router.include_router(comment_router, prefix="/blog", tags=["comments"])
 api_router.include_router(follow_router, prefix="/follow", tags=["follow"])
 api_router.include_router(user_router, prefix="/users", tags=["users"])
+api_router.include_router(timeline_router, prefix="/timeline", tags=["timeline"])
+api_router.include_router(metrics_router, prefix="/metrics", tags=["metrics"])
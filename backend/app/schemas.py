@@ -1,4 +1,5 @@
-from typing import Generic, List, TypeVar
+from enum import Enum
+from typing import Generic, List, Literal, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -26,5 +27,32 @@ class PaginationMeta(BaseModel):
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response"""
 
+    pagination: Literal["offset"] = "offset"
     items: List[T]
     meta: PaginationMeta
+
+
+class PaginationMode(str, Enum):
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
+class CursorPaginationMeta(BaseModel):
+    """Keyset pagination metadata"""
+
+    size: int = Field(..., description="Items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, if there is one"
+    )
+    has_next: bool = Field(..., description="Whether there is a next page")
+    total: Optional[int] = Field(
+        None, description="Total number of items, only when requested"
+    )
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Generic keyset-paginated response"""
+
+    pagination: Literal["cursor"] = "cursor"
+    items: List[T]
+    meta: CursorPaginationMeta
@@ -0,0 +1,142 @@
+"""Measure the statements and latency of creating a comment.
+
+Runs the application in-process against the configured database. Bench
+users, a blog and a root comment are created first and deleted again at
+the end; every request then posts a reply as one of the bench users. Run
+it on both sides of a change to the comment path to compare:
+
+    python -m app.scripts.bench_comment_create
+    python -m app.scripts.bench_comment_create --comments 2000 --concurrency 16
+
+The statement count comes from the X-DB-Query-Count header and includes
+authentication; commits are not statements and are not counted.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+from sqlalchemy import delete
+
+from app.auth.models import User
+from app.auth.security import create_access_token
+from app.blog.models import Blog
+from app.blog.types import BlogStatus
+from app.comment.models import Comment, Sentiment
+from app.limiter import limiter
+from app.main import app
+from app.scripts.bench_search import report
+from app.user.models import UserLimits
+
+BENCH_PREFIX = "bench_cc_"
+
+
+async def create_fixtures(users: int) -> tuple[list[str], int, int]:
+    usernames = [f"{BENCH_PREFIX}{i:04d}" for i in range(users + 1)]
+    async with app.state.db_session() as db:
+        for i, username in enumerate(usernames):
+            db.add(
+                User(
+                    username=username,
+                    hashed_password="!",
+                    email=f"{username}@bench.invalid",
+                    phone=f"+1202555{i:04d}",
+                    first_name="Bench",
+                    last_name="User",
+                )
+            )
+            db.add(
+                UserLimits(
+                    username=username,
+                    comment_creation_limit=1_000_000,
+                    blog_creation_limit=0,
+                )
+            )
+        await db.flush()
+
+        blog = Blog(
+            subject="Comment benchmark",
+            description="",
+            content="",
+            author_username=usernames[0],
+            status=BlogStatus.PUBLISHED,
+        )
+        db.add(blog)
+        await db.flush()
+        root = Comment(
+            content="root",
+            sentiment=Sentiment.POSITIVE,
+            blog_id=blog.id,
+            author_username=usernames[0],
+        )
+        db.add(root)
+        await db.commit()
+        return usernames[1:], blog.id, root.id
+
+
+async def drop_fixtures(usernames: list[str], blog_id: int) -> None:
+    async with app.state.db_session() as db:
+        # Comments go with the blog; the users' limits and activity with them.
+        await db.execute(delete(Blog).where(Blog.id == blog_id))
+        await db.execute(
+            delete(User).where(User.username.startswith(BENCH_PREFIX, autoescape=True))
+        )
+        await db.commit()
+
+
+async def run(args: argparse.Namespace) -> None:
+    limiter.enabled = False
+    async with app.router.lifespan_context(app):
+        usernames, blog_id, root_id = await create_fixtures(args.users)
+        tokens = {
+            username: create_access_token(data={"sub": username})
+            for username in usernames
+        }
+        latencies: list[float] = []
+        statements: Counter[int] = Counter()
+        failures = 0
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def post(client: httpx.AsyncClient, i: int) -> None:
+            nonlocal failures
+            username = usernames[i % len(usernames)]
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(
+                    f"/api/v1/blog/{blog_id}/comments",
+                    headers={"Authorization": f"Bearer {tokens[username]}"},
+                    json={
+                        "content": f"reply {i}",
+                        "sentiment": "positive",
+                        "parent_comment_id": root_id,
+                    },
+                )
+                latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 201:
+                failures += 1
+            statements[int(response.headers.get("X-DB-Query-Count", 0))] += 1
+
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                await asyncio.gather(*(post(client, i) for i in range(args.comments)))
+        finally:
+            await drop_fixtures(usernames, blog_id)
+
+        print(
+            f"comments={args.comments} users={args.users} "
+            f"concurrency={args.concurrency} failed={failures}"
+        )
+        report("create comment", latencies)
+        for count, requests in sorted(statements.items()):
+            print(f"  {count:>3} statements: {requests} requests")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comments", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,115 @@
+"""Measure latency of an unrelated endpoint while a login storm is running.
+
+Runs the application in-process against the configured database (seed it
+first with ``python -m app.scripts.seed``). Compare inline hashing with the
+process pool by changing ``PASSWORD_HASH_WORKERS``:
+
+    PASSWORD_HASH_WORKERS=0 python -m app.scripts.bench_login_storm
+    PASSWORD_HASH_WORKERS=4 python -m app.scripts.bench_login_storm
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+import httpx
+
+from app.config import settings
+from app.limiter import limiter
+from app.main import app
+
+PROBE_PATH = "/api/v1/blog/activity-dates?start_date=2020-01-01&end_date=2030-01-01"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def probe(client: httpx.AsyncClient, stop: asyncio.Event) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get(PROBE_PATH)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.005)
+    return latencies
+
+
+async def login_storm(
+    client: httpx.AsyncClient, users: list[dict], total: int, concurrency: int
+) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def login(i: int):
+        nonlocal failures
+        user = users[i % len(users)]
+        async with semaphore:
+            response = await client.post(
+                "/api/v1/auth/login",
+                json={"username": user["username"], "password": user["password"]},
+            )
+            if response.status_code != 200:
+                failures += 1
+
+    await asyncio.gather(*(login(i) for i in range(total)))
+    return failures
+
+
+def report(label: str, latencies: list[float]) -> None:
+    print(
+        f"{label:<14} n={len(latencies):<6} "
+        f"p50={statistics.median(latencies):8.2f}ms "
+        f"p99={percentile(latencies, 99):8.2f}ms "
+        f"max={max(latencies):8.2f}ms"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    limiter.enabled = False
+    data_path = Path(__file__).parent / "blog_platform_mock_data.json"
+    with open(data_path, "r", encoding="utf-8") as f:
+        users = json.load(f)["users"]
+
+    print(
+        f"PASSWORD_HASH_WORKERS={settings.PASSWORD_HASH_WORKERS} "
+        f"logins={args.logins} concurrency={args.concurrency}"
+    )
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            stop = asyncio.Event()
+            probe_task = asyncio.create_task(probe(client, stop))
+            await asyncio.sleep(args.baseline_seconds)
+            stop.set()
+            report("idle", await probe_task)
+
+            stop = asyncio.Event()
+            probe_task = asyncio.create_task(probe(client, stop))
+            start = time.perf_counter()
+            failures = await login_storm(client, users, args.logins, args.concurrency)
+            elapsed = time.perf_counter() - start
+            stop.set()
+            report("login storm", await probe_task)
+
+            print(
+                f"{args.logins} logins in {elapsed:.2f}s "
+                f"({args.logins / elapsed:.1f}/s, {failures} failed)"
+            )
+
+        await app.state.db_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--baseline-seconds", type=float, default=3.0)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,221 @@
+"""Compare the in-process BM25 index with MySQL FULLTEXT on a synthetic corpus.
+
+The corpus is generated deterministically from a Zipf-distributed vocabulary,
+so both engines see identical documents and queries. The BM25 side always
+runs; the FULLTEXT side loads the same corpus into a scratch table of the
+configured MySQL database when ``--mysql`` is given:
+
+    python -m app.scripts.bench_search --blogs 1000000
+    python -m app.scripts.bench_search --blogs 1000000 --mysql
+
+A million documents needs several GB of RAM for the index; use ``--blogs``
+to scale down on small machines.
+"""
+
+import argparse
+import asyncio
+import pickle
+import random
+import resource
+import statistics
+import time
+from itertools import accumulate
+from typing import Callable, Iterator, List, Tuple
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.db.engine import create_db_engine
+from app.search.index import InvertedIndex
+
+SCRATCH_TABLE = "bench_blog_fulltext"
+INSERT_BATCH_SIZE = 5_000
+
+Document = Tuple[int, str, str, str]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def report(label: str, latencies: list[float]) -> None:
+    print(
+        f"{label:<26} n={len(latencies):<5} "
+        f"p50={statistics.median(latencies):9.2f}ms "
+        f"p99={percentile(latencies, 99):9.2f}ms "
+        f"max={max(latencies):9.2f}ms"
+    )
+
+
+def make_vocabulary(size: int, rng: random.Random) -> List[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(3, 10))))
+    vocabulary = sorted(words)
+    rng.shuffle(vocabulary)
+    return vocabulary
+
+
+def generate_corpus(args: argparse.Namespace) -> Tuple[List[str], Callable[[], Iterator[Document]]]:
+    rng = random.Random(args.seed)
+    vocabulary = make_vocabulary(args.vocabulary, rng)
+    cum_weights = list(accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def words(doc_rng: random.Random, count: int) -> str:
+        return " ".join(doc_rng.choices(vocabulary, cum_weights=cum_weights, k=count))
+
+    def documents() -> Iterator[Document]:
+        doc_rng = random.Random(args.seed + 1)
+        for doc_id in range(1, args.blogs + 1):
+            yield (
+                doc_id,
+                words(doc_rng, doc_rng.randint(3, 8)),
+                words(doc_rng, doc_rng.randint(10, 30)),
+                words(doc_rng, doc_rng.randint(args.content_words // 2, args.content_words)),
+            )
+
+    return vocabulary, documents
+
+
+def make_queries(vocabulary: List[str], count: int, seed: int) -> dict[str, List[str]]:
+    rng = random.Random(seed + 2)
+    common = vocabulary[:50]
+    middle = vocabulary[1_000:5_000]
+    rare = vocabulary[-20_000:]
+    return {
+        "common word": [rng.choice(common) for _ in range(count)],
+        "mid-frequency word": [rng.choice(middle) for _ in range(count)],
+        "rare word": [rng.choice(rare) for _ in range(count)],
+        "two words": [f"{rng.choice(middle)} {rng.choice(rare)}" for _ in range(count)],
+        "prefix": [rng.choice(middle)[:3] for _ in range(count)],
+    }
+
+
+def bench_bm25(documents: Callable[[], Iterator[Document]], queries: dict, limit: int) -> None:
+    index = InvertedIndex()
+    start = time.perf_counter()
+    index.bulk_add(documents())
+    build_seconds = time.perf_counter() - start
+    print(
+        f"bm25 build: {len(index)} docs in {build_seconds:.1f}s, "
+        f"max RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB"
+    )
+
+    start = time.perf_counter()
+    data = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+    dump_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    pickle.loads(data)
+    load_seconds = time.perf_counter() - start
+    print(
+        f"bm25 snapshot: {len(data) / 2**20:.0f} MB, "
+        f"dump {dump_seconds:.1f}s, load {load_seconds:.1f}s"
+    )
+
+    for label, terms in queries.items():
+        latencies = []
+        for query in terms:
+            start = time.perf_counter()
+            index.search(query, limit=limit)
+            latencies.append((time.perf_counter() - start) * 1000)
+        report(f"bm25 {label}", latencies)
+
+
+async def bench_fulltext(
+    documents: Callable[[], Iterator[Document]], queries: dict, limit: int, keep_table: bool
+) -> None:
+    engine = create_db_engine(str(settings.DB_URL))
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP TABLE IF EXISTS `{SCRATCH_TABLE}`"))
+            await conn.execute(
+                text(
+                    f"CREATE TABLE `{SCRATCH_TABLE}` ("
+                    "id INT PRIMARY KEY, subject VARCHAR(255), description TEXT, content TEXT"
+                    ") ENGINE=InnoDB"
+                )
+            )
+
+        insert = text(
+            f"INSERT INTO `{SCRATCH_TABLE}` (id, subject, description, content) "
+            "VALUES (:id, :subject, :description, :content)"
+        )
+        start = time.perf_counter()
+        batch = []
+        async with engine.begin() as conn:
+            for doc_id, subject, description, content in documents():
+                batch.append(
+                    {"id": doc_id, "subject": subject, "description": description, "content": content}
+                )
+                if len(batch) == INSERT_BATCH_SIZE:
+                    await conn.execute(insert, batch)
+                    batch = []
+            if batch:
+                await conn.execute(insert, batch)
+        load_seconds = time.perf_counter() - start
+
+        # Built after loading, as a bulk FULLTEXT build is much faster than
+        # maintaining the index row by row.
+        start = time.perf_counter()
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    f"ALTER TABLE `{SCRATCH_TABLE}` "
+                    "ADD FULLTEXT KEY bench_search_idx (subject, description, content)"
+                )
+            )
+        print(
+            f"fulltext build: load {load_seconds:.1f}s, "
+            f"index {time.perf_counter() - start:.1f}s"
+        )
+
+        search = text(
+            "SELECT id, MATCH(subject, description, content) "
+            "AGAINST(:term IN BOOLEAN MODE) AS relevance "
+            f"FROM `{SCRATCH_TABLE}` "
+            "WHERE MATCH(subject, description, content) AGAINST(:term IN BOOLEAN MODE) "
+            "ORDER BY relevance DESC LIMIT :limit"
+        )
+        async with engine.connect() as conn:
+            for label, terms in queries.items():
+                latencies = []
+                for query in terms:
+                    term = " ".join(f"{word}*" for word in query.split())
+                    start = time.perf_counter()
+                    await conn.execute(search, {"term": term, "limit": limit})
+                    latencies.append((time.perf_counter() - start) * 1000)
+                report(f"fulltext {label}", latencies)
+    finally:
+        if not keep_table:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP TABLE IF EXISTS `{SCRATCH_TABLE}`"))
+        await engine.dispose()
+
+
+async def run(args: argparse.Namespace) -> None:
+    vocabulary, documents = generate_corpus(args)
+    queries = make_queries(vocabulary, args.queries, args.seed)
+    print(
+        f"corpus: {args.blogs} blogs, {len(vocabulary)} word vocabulary, "
+        f"{args.queries} queries per kind, top {args.limit}"
+    )
+
+    bench_bm25(documents, queries, args.limit)
+    if args.mysql:
+        await bench_fulltext(documents, queries, args.limit, args.keep_table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blogs", type=int, default=1_000_000)
+    parser.add_argument("--vocabulary", type=int, default=50_000)
+    parser.add_argument("--content-words", type=int, default=60)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=440)
+    parser.add_argument("--mysql", action="store_true", help="also benchmark FULLTEXT")
+    parser.add_argument("--keep-table", action="store_true")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,156 @@
+"""Measure the home timeline at several fan-out thresholds on a seeded database.
+
+Uses the follow graph written by app.scripts.seed, whose follower counts
+are skewed (a few users with many followers, most with few). For each
+threshold the timelines are rebuilt, then the benchmark reports how many
+authors are pulled, the stored entries, the write cost of publishing a
+blog and the read latency of the first two timeline pages:
+
+    python -m app.scripts.seed
+    python -m app.scripts.bench_timeline --thresholds 0 20 40 1000000
+
+Publishes are rolled back. The timelines are rebuilt with the configured
+threshold when the run ends.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.models import User
+from app.blog.models import Blog
+from app.blog.types import BlogStatus
+from app.comment.models import Comment  # noqa: F401  Import to ensure proper relationship setup
+from app.config import settings
+from app.db.engine import create_db_engine
+from app.follow.models import UserFollow
+from app.scripts.bench_search import percentile, report
+from app.timeline.fanout import (
+    pull_authors,
+    push_to_followers,
+    rebuild_timelines,
+    trim_timelines,
+)
+from app.timeline.models import TimelineEntry
+from app.timeline.service import get_home_timeline_service
+from app.user.models import UserLimits  # noqa: F401
+
+
+async def describe_graph(db: AsyncSession) -> None:
+    counts = list(
+        await db.scalars(
+            select(func.count())
+            .select_from(UserFollow)
+            .group_by(UserFollow.following_username)
+        )
+    )
+    if not counts:
+        raise SystemExit("No follows found; run app.scripts.seed first")
+    print(
+        f"follow graph: {sum(counts)} follows of {len(counts)} authors, "
+        f"followers p50={statistics.median(counts):.0f} "
+        f"p99={percentile(counts, 99):.0f} max={max(counts)}"
+    )
+
+
+async def bench_threshold(
+    session_maker: async_sessionmaker[AsyncSession],
+    threshold: int,
+    readers: List[str],
+    blog_ids: List[int],
+) -> None:
+    settings.TIMELINE_FANOUT_MAX_FOLLOWERS = threshold
+    print(f"\nthreshold {threshold}")
+
+    async with session_maker() as db:
+        start = time.perf_counter()
+        async with db.begin():
+            await rebuild_timelines(db)
+        await trim_timelines(
+            session_maker, settings.TIMELINE_MAX_ENTRIES, settings.TIMELINE_TRIM_BATCH_SIZE
+        )
+        rebuild_seconds = time.perf_counter() - start
+        entries = await db.scalar(select(func.count()).select_from(TimelineEntry))
+        pulled = len(await pull_authors(db))
+        await db.rollback()
+    print(
+        f"  rebuild {rebuild_seconds:.1f}s, {entries} entries, "
+        f"{pulled} authors pulled at read time"
+    )
+
+    latencies = []
+    async with session_maker() as db:
+        for blog_id in blog_ids:
+            blog = await db.get(Blog, blog_id)
+            start = time.perf_counter()
+            await push_to_followers(db, blog)
+            latencies.append((time.perf_counter() - start) * 1000)
+            await db.rollback()
+    report("  publish", latencies)
+
+    first_page, second_page = [], []
+    async with session_maker() as db:
+        for username in readers:
+            user = await db.get(User, username)
+            start = time.perf_counter()
+            page = await get_home_timeline_service(user, db, size=20)
+            first_page.append((time.perf_counter() - start) * 1000)
+            if page.meta.next_cursor:
+                start = time.perf_counter()
+                await get_home_timeline_service(user, db, page.meta.next_cursor, 20)
+                second_page.append((time.perf_counter() - start) * 1000)
+            await db.rollback()
+    report("  read first page", first_page)
+    if second_page:
+        report("  read second page", second_page)
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    engine = create_db_engine(str(settings.DB_URL))
+    session_maker = async_sessionmaker(
+        bind=engine, expire_on_commit=False, class_=AsyncSession
+    )
+    configured = settings.TIMELINE_FANOUT_MAX_FOLLOWERS
+    try:
+        async with session_maker() as db:
+            await describe_graph(db)
+            followers = sorted(
+                set(await db.scalars(select(UserFollow.follower_username)))
+            )
+            published = list(
+                await db.scalars(
+                    select(Blog.id).where(Blog.status == BlogStatus.PUBLISHED)
+                )
+            )
+        readers = rng.sample(followers, min(args.readers, len(followers)))
+        blog_ids = rng.sample(published, min(args.publishes, len(published)))
+
+        for threshold in args.thresholds:
+            await bench_threshold(session_maker, threshold, readers, blog_ids)
+    finally:
+        settings.TIMELINE_FANOUT_MAX_FOLLOWERS = configured
+        async with session_maker() as db:
+            async with db.begin():
+                await rebuild_timelines(db)
+        await trim_timelines(
+            session_maker, settings.TIMELINE_MAX_ENTRIES, settings.TIMELINE_TRIM_BATCH_SIZE
+        )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--thresholds", type=int, nargs="+", default=[0, 20, 40, 1_000_000]
+    )
+    parser.add_argument("--readers", type=int, default=200)
+    parser.add_argument("--publishes", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=19)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,280 @@
+"""Schema and query-plan regression checks against the configured database.
+
+1. Non-unique secondary indexes declared in init.sql must match the ones
+   declared on BaseModel.metadata.
+2. Every SELECT issued by the read services is run through EXPLAIN; a full
+   table scan with no usable index fails the check unless it is listed in
+   ALLOWED_FULL_SCANS.
+3. Only the checks in BLOG_BODY_READERS may select the deferred blog
+   description and content columns.
+4. The blog export, read in several small batches, must return every
+   published blog exactly once.
+
+Run against a migrated, seeded database:
+
+    python -m app.db.migrate && python -m app.scripts.check_indexes
+"""
+
+import asyncio
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Set, Tuple
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.models import User
+from app.blog.export import stream_published_blogs
+from app.blog.models import Blog, Tag
+from app.blog.service import (
+    get_blog_activity_dates_service,
+    get_blog_service,
+    list_blogs_service,
+    search_blogs_service,
+)
+from app.blog.types import BlogSortBy, BlogSortOrder, BlogStatus
+from app.comment.counters import count_comment_subtree
+from app.comment.models import Comment
+from app.comment.service import (
+    list_blog_comments_service,
+    list_comment_thread_service,
+)
+from app.config import settings
+from app.db.engine import create_db_engine
+from app.follow.models import UserFollow
+from app.follow.service import (
+    get_follow_stats_service,
+    get_followers_service,
+    get_following_service,
+)
+from app.models import BaseModel
+from app.timeline.service import get_home_timeline_service
+from app.user.service import get_public_profile_service, get_user_comments_service
+
+INIT_SQL = Path(__file__).resolve().parents[2] / "init.sql"
+
+# (check name, table) pairs whose full scans are known and accepted.
+ALLOWED_FULL_SCANS: Set[Tuple[str, str]] = set()
+
+# Checks whose responses include the blog text.
+BLOG_BODY_READERS: Set[str] = {"get blog", "export blogs"}
+BLOG_BODY_COLUMN = re.compile(r"\bblog\.(description|content)\b")
+FULLTEXT_MATCH = re.compile(r"MATCH\s*\([^)]*\)", re.IGNORECASE)
+
+
+def init_sql_indexes() -> Dict[str, Set[str]]:
+    sql = INIT_SQL.read_text(encoding="utf-8")
+    indexes: Dict[str, Set[str]] = defaultdict(set)
+    for table, body in re.findall(
+        r"CREATE TABLE IF NOT EXISTS `(\w+)` \((.*?)\n\);", sql, re.DOTALL
+    ):
+        for line in body.splitlines():
+            match = re.match(r"\s*(?:INDEX|KEY) `(\w+)`", line)
+            if match:
+                indexes[table].add(match.group(1))
+    return indexes
+
+
+def metadata_indexes() -> Dict[str, Set[str]]:
+    indexes: Dict[str, Set[str]] = defaultdict(set)
+    for table in BaseModel.metadata.sorted_tables:
+        for index in table.indexes:
+            if not index.unique:
+                indexes[table.name].add(index.name)
+    return indexes
+
+
+def check_schema_sync() -> List[str]:
+    problems = []
+    from_sql = init_sql_indexes()
+    from_metadata = metadata_indexes()
+    for table in sorted(set(from_sql) | set(from_metadata)):
+        for name in sorted(from_sql[table] - from_metadata[table]):
+            problems.append(f"{table}.{name} is in init.sql but not in the models")
+        for name in sorted(from_metadata[table] - from_sql[table]):
+            problems.append(f"{table}.{name} is in the models but not in init.sql")
+    return problems
+
+
+async def build_checks(
+    db: AsyncSession,
+) -> List[Tuple[str, Callable[[], Awaitable[object]]]]:
+    blog = await db.scalar(
+        select(Blog).where(Blog.status == BlogStatus.PUBLISHED).limit(1)
+    )
+    reply = await db.scalar(
+        select(Comment).where(Comment.parent_comment_id.is_not(None)).limit(1)
+    )
+    followed = await db.scalar(select(UserFollow.following_username).limit(1))
+    follower = await db.get(
+        User, await db.scalar(select(UserFollow.follower_username).limit(1))
+    )
+    author = await db.get(User, blog.author_username)
+    tag_names = (await db.scalars(select(Tag.name).limit(2))).all()
+
+    return [
+        ("get blog", lambda: get_blog_service(blog.id, db)),
+        ("list blogs", lambda: list_blogs_service(author, db)),
+        (
+            "search blogs",
+            lambda: search_blogs_service(
+                db, None, tag_names, False, [author.username], False,
+                BlogSortBy.CREATED_AT, BlogSortOrder.DESC,
+            ),
+        ),
+        (
+            "search blogs all tags",
+            lambda: search_blogs_service(
+                db, None, tag_names, True, None, False,
+                BlogSortBy.UPDATED_AT, BlogSortOrder.DESC,
+            ),
+        ),
+        (
+            "search blogs positive comments",
+            lambda: search_blogs_service(
+                db, None, None, False, None, True,
+                BlogSortBy.CREATED_AT, BlogSortOrder.DESC,
+            ),
+        ),
+        ("list root comments", lambda: list_blog_comments_service(blog.id, db)),
+        (
+            "comment thread",
+            lambda: list_comment_thread_service(
+                blog.id, db, depth=settings.COMMENT_THREAD_MAX_DEPTH
+            ),
+        ),
+        ("comment subtree", lambda: count_comment_subtree(db, reply.parent_comment_id)),
+        (
+            "list replies",
+            lambda: list_blog_comments_service(
+                reply.blog_id, db, reply.parent_comment_id
+            ),
+        ),
+        ("export blogs", lambda: export_blogs(db, batch_size=2)),
+        ("followers", lambda: get_followers_service(followed, db)),
+        ("following", lambda: get_following_service(followed, db)),
+        ("follow stats", lambda: get_follow_stats_service(followed, db)),
+        ("home timeline", lambda: get_home_timeline_service(follower, db)),
+        ("public profile", lambda: get_public_profile_service(followed, db)),
+        ("user comments", lambda: get_user_comments_service(reply.author_username, db)),
+        (
+            "blog activity dates",
+            lambda: get_blog_activity_dates_service(
+                blog.created_at.date(), blog.created_at.date(), db
+            ),
+        ),
+    ]
+
+
+async def export_blogs(db: AsyncSession, batch_size: int) -> List[int]:
+    return [
+        record.id
+        async for records in stream_published_blogs(db, batch_size=batch_size)
+        for record in records
+    ]
+
+
+async def check_export() -> List[str]:
+    engine = create_db_engine(str(settings.DB_URL))
+    session_factory = async_sessionmaker(
+        bind=engine, expire_on_commit=False, class_=AsyncSession
+    )
+    try:
+        async with session_factory() as db:
+            published = await db.scalar(
+                select(func.count()).where(Blog.status == BlogStatus.PUBLISHED)
+            )
+            # At least three batches, so every batch boundary is crossed.
+            batch_size = max(published // 3, 1)
+            exported = await export_blogs(db, batch_size)
+    finally:
+        await engine.dispose()
+
+    if len(exported) != published or len(set(exported)) != published:
+        return [
+            f"export blogs: {len(exported)} rows ({len(set(exported))} distinct) "
+            f"in batches of {batch_size} for {published} published blogs"
+        ]
+    print(f"  checked  export of {published} blogs in batches of {batch_size}")
+    return []
+
+
+async def check_query_plans() -> List[str]:
+    engine = create_db_engine(str(settings.DB_URL))
+    session_factory = async_sessionmaker(
+        bind=engine, expire_on_commit=False, class_=AsyncSession
+    )
+    captured: List[Tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    problems = []
+    try:
+        async with session_factory() as db:
+            checks = await build_checks(db)
+            event.listen(engine.sync_engine, "before_cursor_execute", capture)
+
+            for name, run_check in checks:
+                captured.clear()
+                await run_check()
+                statements = list(captured)
+
+                conn = await db.connection()
+                for statement, parameters in statements:
+                    # MATCH() names the columns without fetching them, and
+                    # only the select list is sent back to the client.
+                    select_list = re.split(r"\bFROM\b", statement, maxsplit=1)[0]
+                    select_list = FULLTEXT_MATCH.sub("", select_list)
+                    if name not in BLOG_BODY_READERS and BLOG_BODY_COLUMN.search(
+                        select_list
+                    ):
+                        problems.append(
+                            f"{name}: fetches blog text\n    {' '.join(statement.split())}"
+                        )
+                    result = await conn.exec_driver_sql(
+                        f"EXPLAIN {statement}", parameters
+                    )
+                    for row in result.mappings():
+                        table = row["table"] or ""
+                        if table.startswith("<"):
+                            continue
+                        if row["type"] != "ALL" or row["possible_keys"]:
+                            continue
+                        if (name, table) in ALLOWED_FULL_SCANS:
+                            print(f"  allowed  {name}: full scan of {table}")
+                            continue
+                        problems.append(
+                            f"{name}: full scan of {table}\n    {' '.join(statement.split())}"
+                        )
+                print(f"  checked  {name} ({len(statements)} statements)")
+    finally:
+        await engine.dispose()
+
+    return problems
+
+
+async def main() -> int:
+    print("Checking init.sql against model metadata...")
+    problems = check_schema_sync()
+
+    print("Checking service query plans...")
+    problems += await check_query_plans()
+
+    print("Checking the blog export...")
+    problems += await check_export()
+
+    for problem in problems:
+        print(f"FAIL {problem}")
+    if problems:
+        return 1
+
+    print("All index checks passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
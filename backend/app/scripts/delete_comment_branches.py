@@ -0,0 +1,101 @@
+"""Delete comments together with every reply below them.
+
+For moderation sweeps: give the comments to remove, or an author whose
+comments should all go, and each one is deleted with its whole branch.
+The blog comment counters and hot scores are adjusted in the same
+transaction:
+
+    python -m app.scripts.delete_comment_branches 120 4711
+    python -m app.scripts.delete_comment_branches --author spammer --dry-run
+    python -m app.scripts.delete_comment_branches --author spammer
+
+Branches are read from and deleted through the comment closure table, a
+batch of comments per transaction, so the job can run against a live
+database. Running workers show the new counts once their blog caches
+expire.
+"""
+
+import argparse
+import asyncio
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.models import User  # noqa: F401  Import to ensure proper relationship setup
+from app.blog.hot import update_hot_scores
+from app.blog.models import Blog
+from app.comment.closure import delete_comment_subtrees
+from app.comment.counters import count_comment_subtree
+from app.comment.models import Comment
+from app.config import settings
+from app.db.engine import create_db_engine
+from app.follow.models import UserFollow  # noqa: F401
+from app.user.models import UserLimits  # noqa: F401
+
+
+async def find_branches(db: AsyncSession, args: argparse.Namespace) -> List[int]:
+    query = select(Comment.id).order_by(Comment.id)
+    if args.author:
+        query = query.where(Comment.author_username == args.author)
+    else:
+        query = query.where(Comment.id.in_(args.comment_ids))
+    return list(await db.scalars(query))
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_db_engine(str(settings.DB_URL))
+    session_maker = async_sessionmaker(
+        bind=engine, expire_on_commit=False, class_=AsyncSession
+    )
+    try:
+        async with session_maker() as db:
+            branches = await find_branches(db, args)
+        if not branches:
+            print("No matching comments")
+            return
+
+        if args.dry_run:
+            async with session_maker() as db:
+                for comment_id in branches:
+                    counts = await count_comment_subtree(db, comment_id)
+                    print(
+                        f"comment {comment_id}: {counts['comments']} comments "
+                        f"({counts['positive']} positive, {counts['negative']} negative)"
+                    )
+            return
+
+        deleted = 0
+        blogs = set()
+        for start in range(0, len(branches), args.batch_size):
+            async with session_maker() as db:
+                # Branches nested in ones already deleted are simply gone.
+                removed = await delete_comment_subtrees(
+                    db, branches[start : start + args.batch_size]
+                )
+                if removed:
+                    await update_hot_scores(db, Blog.id.in_(removed))
+                await db.commit()
+            deleted += sum(removed.values())
+            blogs.update(removed)
+
+        print(
+            f"Deleted {deleted} comments in {len(branches)} branches "
+            f"on {len(blogs)} blogs"
+        )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("comment_ids", type=int, nargs="*")
+    parser.add_argument("--author", help="delete every comment by this user")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="only count what would be deleted"
+    )
+    args = parser.parse_args()
+    if bool(args.author) == bool(args.comment_ids):
+        parser.error("give either comment ids or --author")
+    asyncio.run(run(args))
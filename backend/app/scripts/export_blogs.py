@@ -0,0 +1,69 @@
+"""Write published blogs as NDJSON, one blog per line, in updated_at order.
+
+Rows are read and written in keyset batches of --batch-size blogs, so
+the export runs in constant memory. For an incremental pull pass the
+watermark printed by the previous run:
+
+    python -m app.scripts.export_blogs --output blogs.ndjson
+    python -m app.scripts.export_blogs --since 2025-06-01T12:00:00.123456 >> blogs.ndjson
+
+The watermark is inclusive, so the newest blog of the previous run is
+exported again; consumers should upsert by id.
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from typing import BinaryIO
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.models import User  # noqa: F401  Imports to ensure proper relationship setup
+from app.blog.export import stream_published_blogs, to_ndjson
+from app.comment.models import Comment  # noqa: F401
+from app.config import settings
+from app.db.engine import create_db_engine
+from app.follow.models import UserFollow  # noqa: F401
+from app.user.models import UserLimits  # noqa: F401
+
+
+async def export(args: argparse.Namespace, output: BinaryIO) -> None:
+    engine = create_db_engine(str(settings.DB_URL))
+    session_maker = async_sessionmaker(bind=engine, class_=AsyncSession)
+
+    exported = 0
+    watermark = args.since
+    try:
+        async with session_maker() as db:
+            async for records in stream_published_blogs(db, args.since, args.batch_size):
+                output.write(to_ndjson(records))
+                exported += len(records)
+                watermark = records[-1].updated_at
+    finally:
+        await engine.dispose()
+
+    output.flush()
+    print(f"Exported {exported} blogs", file=sys.stderr)
+    if watermark is not None:
+        print(f"Next run: --since {watermark.isoformat()}", file=sys.stderr)
+
+
+def main(args: argparse.Namespace) -> None:
+    if args.output == "-":
+        asyncio.run(export(args, sys.stdout.buffer))
+        return
+    with open(args.output, "wb") as output:
+        asyncio.run(export(args, output))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="only blogs updated at or after this ISO timestamp",
+    )
+    parser.add_argument("--output", default="-", help="file to write, - for stdout")
+    parser.add_argument("--batch-size", type=int, default=settings.BLOG_EXPORT_BATCH_SIZE)
+    main(parser.parse_args())
@@ -0,0 +1,69 @@
+"""Rebuild the denormalized per-blog comment counters from the comment table.
+
+Hot scores are recomputed from the recounted values, and the per-day
+blog_daily_activity rollup is recounted afterwards. The application keeps
+all of these current; run this after bulk imports, manual data fixes,
+cascading user deletes, or whenever drift is suspected:
+
+    python -m app.scripts.reconcile_counters
+    python -m app.scripts.reconcile_counters --batch-size 5000
+
+Blogs are recounted in id ranges, one short transaction per batch, so the
+job can run against a live database.
+
+Vote counters are only recounted from the blog_vote ledger with --votes.
+Running workers still hold unflushed vote deltas, so stop the application
+first:
+
+    python -m app.scripts.reconcile_counters --votes
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.blog.activity import rebuild_blog_activity
+from app.blog.hot import update_hot_scores
+from app.blog.models import Blog
+from app.blog.votes import reconcile_vote_counters
+from app.comment.counters import reconcile_comment_counters
+from app.config import settings
+from app.db.engine import create_db_engine
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_db_engine(str(settings.DB_URL))
+    session_maker = async_sessionmaker(bind=engine, class_=AsyncSession)
+
+    async with session_maker() as db:
+        max_id = await db.scalar(select(func.max(Blog.id))) or 0
+
+    updated = 0
+    for first_id in range(1, max_id + 1, args.batch_size):
+        async with session_maker() as db:
+            last_id = first_id + args.batch_size - 1
+            updated += await reconcile_comment_counters(db, first_id, last_id)
+            if args.votes:
+                await reconcile_vote_counters(db, first_id, last_id)
+            await update_hot_scores(db, Blog.id.between(first_id, last_id))
+            await db.commit()
+
+    counted = "comments and votes" if args.votes else "comments"
+    print(f"Recounted {counted} for {updated} blogs (ids up to {max_id})")
+
+    async with session_maker() as db:
+        days = await rebuild_blog_activity(db)
+        await db.commit()
+    print(f"Recounted blog activity for {days} days")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument(
+        "--votes", action="store_true", help="also recount votes (app must be stopped)"
+    )
+    asyncio.run(run(parser.parse_args()))
@@ -10,12 +10,18 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.auth.models import User
-from app.auth.security import hash_password
-from app.blog.models import Blog, Tag
+from app.auth.security import password_hasher
+from app.blog.activity import rebuild_blog_activity
+from app.blog.hot import update_hot_scores
+from app.blog.models import Blog
+from app.blog.tags import resolve_tags
 from app.blog.types import BlogStatus
+from app.comment.closure import rebuild_comment_closure
+from app.comment.counters import reconcile_comment_counters
 from app.comment.models import Comment, Sentiment
 from app.config import settings
 from app.follow.models import UserFollow  # Import to ensure proper relationship setup
+from app.timeline.fanout import rebuild_timelines, trim_timelines
 from app.user.models import UserDailyActivity, UserLimits
 from app.utils.phone import normalize_phone_number
 
@@ -43,20 +49,6 @@ def get_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-async def get_or_create_tag(
-    db: AsyncSession, tag_name: str, created_at: datetime
-) -> Tag:
-    result = await db.execute(select(Tag).where(Tag.name == tag_name))
-    tag = result.scalar_one_or_none()
-
-    if not tag:
-        tag = Tag(name=tag_name, created_at=created_at)
-        db.add(tag)
-        await db.flush()
-
-    return tag
-
-
 async def create_comment(
     db: AsyncSession,
     comment_data: Dict[str, Any],
@@ -142,7 +134,7 @@ async def seed_database():
                 user_created_at = random_date_in_range(five_years_ago, now)
                 user_creation_dates[user_data["username"]] = user_created_at
 
-                hashed_password = hash_password(user_data["password"])
+                hashed_password = await password_hasher.hash(user_data["password"])
 
                 email = user_data["email"]
                 base_email = email
@@ -286,17 +278,12 @@ async def seed_database():
                 blog_creation_dates[blog.id] = blog_created_at
 
                 async with db.begin_nested():
-                    unique_tag_names = list(set(blog_data["tags"]))
-
-                    tags_to_add = []
-                    for tag_name in unique_tag_names:
-                        tag_created_at = random_date_in_range(
-                            five_years_ago, blog_created_at
-                        )
-                        tag = await get_or_create_tag(db, tag_name, tag_created_at)
-                        tags_to_add.append(tag)
-
-                    blog.tags.extend(tags_to_add)
+                    tag_created_at = random_date_in_range(
+                        five_years_ago, blog_created_at
+                    )
+                    blog.tags.extend(
+                        await resolve_tags(db, blog_data["tags"], tag_created_at)
+                    )
 
                 async with db.begin_nested():
                     for comment_data in blog_data["comments"]:
@@ -480,6 +467,32 @@ async def seed_database():
 
         print(f"✅ Successfully created {follows_created} follow relationships ({mutual_follows} mutual)")
 
+        # Comments above are inserted directly, bypassing the counter updates
+        # in the comment service.
+        print("\n🔢 Rebuilding blog comment counters...")
+        async with db.begin():
+            blogs_counted = await reconcile_comment_counters(db)
+            await update_hot_scores(db)
+        print(f"✅ Comment counters and hot scores rebuilt for {blogs_counted} blogs")
+
+        print("\n🌳 Rebuilding comment closure table...")
+        async with db.begin():
+            paths_created = await rebuild_comment_closure(db)
+        print(f"✅ Comment closure rebuilt with {paths_created} rows")
+
+        print("\n📅 Rebuilding blog activity rollup...")
+        async with db.begin():
+            days_counted = await rebuild_blog_activity(db)
+        print(f"✅ Blog activity rebuilt for {days_counted} days")
+
+        print("\n📰 Rebuilding home timelines...")
+        async with db.begin():
+            entries_created = await rebuild_timelines(db)
+        await trim_timelines(
+            async_session, settings.TIMELINE_MAX_ENTRIES, settings.TIMELINE_TRIM_BATCH_SIZE
+        )
+        print(f"✅ Home timelines rebuilt with {entries_created} entries")
+
         print("\n" + "=" * 60)
         print("🎉 Database seeding completed successfully!")
         print("=" * 60)
@@ -509,6 +522,7 @@ async def seed_database():
         print("=" * 60)
 
     await engine.dispose()
+    password_hasher.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+import heapq
+import math
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class InvertedIndex:
+    """In-memory inverted index ranked with Okapi BM25.
+
+    Query words are treated as prefixes, like ``word*`` in the MySQL boolean
+    mode search this replaces, and any matching word is enough to match.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        subject_weight: int = 2,
+        max_expansions: int = 50,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.subject_weight = subject_weight
+        self.max_expansions = max_expansions
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._vocabulary: List[str] = []
+        self._doc_lengths: Dict[int, int] = {}
+        self._doc_terms: Dict[int, Tuple[str, ...]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self._doc_lengths
+
+    def doc_ids(self) -> List[int]:
+        return list(self._doc_lengths)
+
+    def add(
+        self,
+        doc_id: int,
+        subject: Optional[str],
+        description: Optional[str],
+        content: Optional[str],
+        keep_sorted: bool = True,
+    ) -> None:
+        """Index a document, replacing any previous version of it."""
+        self.remove(doc_id)
+
+        tokens = tokenize(subject) * self.subject_weight
+        tokens += tokenize(description) + tokenize(content)
+        frequencies = Counter(tokens)
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if keep_sorted:
+                    insort(self._vocabulary, term)
+            postings[doc_id] = frequency
+
+        self._doc_lengths[doc_id] = len(tokens)
+        self._doc_terms[doc_id] = tuple(frequencies)
+        self._total_length += len(tokens)
+
+    def remove(self, doc_id: int) -> None:
+        length = self._doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+
+        self._total_length -= length
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                position = bisect_left(self._vocabulary, term)
+                if position < len(self._vocabulary) and self._vocabulary[position] == term:
+                    del self._vocabulary[position]
+
+    def expand(self, prefix: str) -> List[str]:
+        """Indexed terms starting with ``prefix``, rarest first past the cap."""
+        vocabulary = self._vocabulary
+        position = bisect_left(vocabulary, prefix)
+        terms = []
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            terms.append(vocabulary[position])
+            position += 1
+
+        if len(terms) > self.max_expansions:
+            terms = heapq.nsmallest(
+                self.max_expansions, terms, key=lambda t: len(self._postings[t])
+            )
+        return terms
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Matching document ids with their scores, best first."""
+        doc_count = len(self._doc_lengths)
+        if not doc_count:
+            return []
+
+        terms = {term for word in tokenize(query) for term in self.expand(word)}
+        scores: Dict[int, float] = {}
+
+        # Hoisted out of the per-posting loop, which dominates common terms.
+        doc_lengths = self._doc_lengths
+        base_norm = self.k1 * (1 - self.b)
+        length_norm = self.k1 * self.b * doc_count / max(self._total_length, 1)
+        for term in terms:
+            postings = self._postings[term]
+            df = len(postings)
+            weight = math.log(1 + (doc_count - df + 0.5) / (df + 0.5)) * (self.k1 + 1)
+            for doc_id, tf in postings.items():
+                score = weight * tf / (tf + base_norm + length_norm * doc_lengths[doc_id])
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        if limit is not None and limit < len(scores):
+            return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+    def bulk_add(
+        self,
+        documents: Iterable[Tuple[int, Optional[str], Optional[str], Optional[str]]],
+        keep_sorted: bool = False,
+    ) -> None:
+        """Index many documents.
+
+        By default the vocabulary is sorted once at the end, far cheaper than
+        an insort per new term when building from scratch. Small incremental
+        batches bring few new terms; they pass ``keep_sorted`` instead of
+        re-sorting the whole vocabulary.
+        """
+        for doc_id, subject, description, content in documents:
+            self.add(doc_id, subject, description, content, keep_sorted=keep_sorted)
+        if not keep_sorted:
+            self._vocabulary = sorted(self._postings)
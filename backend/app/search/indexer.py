@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import os
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.blog.models import Blog
+from app.blog.types import BlogStatus
+from app.config import settings
+from app.events import BlogEvent, subscribe
+from app.search.index import InvertedIndex
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+CATCH_UP_BATCH_SIZE = 1_000
+
+
+class SearchIndexer:
+    """Keeps an InvertedIndex of published blogs in step with the database.
+
+    The index is restored from the last snapshot on startup and then caught
+    up from ``blog.updated_at``, so a restart only re-reads what changed.
+    Changes made in this process arrive through blog events; changes made by
+    other workers are picked up by the periodic ``refresh``.
+    """
+
+    def __init__(self, snapshot_path: str, max_results: int):
+        self.snapshot_path = Path(snapshot_path)
+        self.max_results = max_results
+        self.index = InvertedIndex()
+        self.watermark: Optional[datetime] = None
+        self.ready = False
+        self._session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+        # While a snapshot is pickled off the event loop the index must not
+        # change; blogs changed meanwhile are re-synced once it is done.
+        self._snapshot_writer: Optional[asyncio.Task] = None
+        self._deferred: Set[int] = set()
+
+    async def start(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        self._session_maker = session_maker
+        try:
+            await self._build()
+        except Exception:
+            # Searches keep using MySQL FULLTEXT until a refresh succeeds.
+            logger.exception("Search index build failed, falling back to FULLTEXT")
+
+    async def _build(self) -> None:
+        restored = await asyncio.to_thread(self._read_snapshot)
+        if restored is not None:
+            self.index, self.watermark = restored
+
+        async with self._session_maker() as db:
+            await self._catch_up(db, build=True)
+            if restored is not None:
+                await self._drop_unpublished(db)
+
+        self.ready = True
+        logger.info(
+            "Search index ready: %d blogs (%s)",
+            len(self.index),
+            "restored from snapshot" if restored is not None else "full build",
+        )
+
+    async def refresh(self) -> None:
+        if not self.ready:
+            await self._build()
+            return
+        if self._snapshotting:
+            # The watermark has not moved; the next refresh catches up.
+            return
+        async with self._session_maker() as db:
+            await self._catch_up(db)
+
+    @property
+    def _snapshotting(self) -> bool:
+        return self._snapshot_writer is not None and not self._snapshot_writer.done()
+
+    async def snapshot(self) -> None:
+        if not self.ready:
+            return
+        if not self._snapshotting:
+            self._snapshot_writer = asyncio.create_task(
+                asyncio.to_thread(self._write_snapshot, self.watermark)
+            )
+        try:
+            # Shielded: the thread keeps pickling even if this caller is
+            # cancelled, and no second dump may start until it is done.
+            await asyncio.shield(self._snapshot_writer)
+        finally:
+            if not self._snapshotting:
+                while self._deferred:
+                    await self.sync_blog(self._deferred.pop())
+
+    def search(self, query: str) -> List[Tuple[int, float]]:
+        return self.index.search(query, limit=self.max_results)
+
+    async def sync_blog(self, blog_id: int) -> None:
+        async with self._session_maker() as db:
+            row = (
+                await db.execute(
+                    select(Blog.subject, Blog.description, Blog.content, Blog.status).where(
+                        Blog.id == blog_id
+                    )
+                )
+            ).first()
+
+        if self._snapshotting:
+            self._deferred.add(blog_id)
+        elif row is None or row.status != BlogStatus.PUBLISHED:
+            self.index.remove(blog_id)
+        else:
+            self.index.add(blog_id, row.subject, row.description, row.content)
+
+    def remove_blog(self, blog_id: int) -> None:
+        if self._snapshotting:
+            self._deferred.add(blog_id)
+        else:
+            self.index.remove(blog_id)
+
+    async def _catch_up(self, db: AsyncSession, build: bool = False) -> None:
+        query = select(
+            Blog.id, Blog.subject, Blog.description, Blog.content, Blog.updated_at
+        ).where(Blog.status == BlogStatus.PUBLISHED)
+        # Inclusive, so rows sharing the watermark timestamp are never missed;
+        # re-indexing a row is idempotent.
+        if self.watermark is not None:
+            query = query.where(Blog.updated_at >= self.watermark)
+        # In watermark order, so an interrupted build resumes where it stopped.
+        query = query.order_by(Blog.updated_at)
+
+        result = await db.stream(query.execution_options(yield_per=CATCH_UP_BATCH_SIZE))
+        async for rows in result.partitions():
+            if self._snapshotting:
+                # Stopped at the watermark; the next refresh resumes from it.
+                break
+            self.index.bulk_add(
+                ((row.id, row.subject, row.description, row.content) for row in rows),
+                keep_sorted=not build,
+            )
+            latest = max(row.updated_at for row in rows)
+            if self.watermark is None or latest > self.watermark:
+                self.watermark = latest
+            # Let requests run between batches of a large build.
+            await asyncio.sleep(0)
+
+    async def _drop_unpublished(self, db: AsyncSession) -> None:
+        # Deletes and delists leave no updated_at trail, so compare ids once
+        # after restoring a snapshot.
+        published = set(
+            await db.scalars(select(Blog.id).where(Blog.status == BlogStatus.PUBLISHED))
+        )
+        for blog_id in self.index.doc_ids():
+            if blog_id not in published:
+                self.index.remove(blog_id)
+
+    def _read_snapshot(self) -> Optional[Tuple[InvertedIndex, Optional[datetime]]]:
+        if not self.snapshot_path.exists():
+            return None
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                data = pickle.load(f)
+        except Exception:
+            logger.exception("Ignoring unreadable search snapshot %s", self.snapshot_path)
+            return None
+
+        if data.get("version") != SNAPSHOT_VERSION:
+            logger.warning("Ignoring search snapshot with version %s", data.get("version"))
+            return None
+        return data["index"], data["watermark"]
+
+    def _write_snapshot(self, watermark: Optional[datetime]) -> None:
+        """Pickle the index straight to disk; runs in a worker thread."""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.snapshot_path.with_suffix(".tmp")
+        with open(temporary_path, "wb") as f:
+            pickle.dump(
+                {"version": SNAPSHOT_VERSION, "watermark": watermark, "index": self.index},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temporary_path, self.snapshot_path)
+
+
+search_indexer = SearchIndexer(
+    snapshot_path=settings.SEARCH_SNAPSHOT_PATH,
+    max_results=settings.SEARCH_BM25_MAX_RESULTS,
+)
+
+
+def search_matches(search: Optional[str]) -> Optional[List[Tuple[int, float]]]:
+    """Ranked BM25 matches, or None when MySQL FULLTEXT should handle the search."""
+    if not search or settings.SEARCH_BACKEND != "bm25" or not search_indexer.ready:
+        return None
+    return search_indexer.search(search)
+
+
+@subscribe(BlogEvent.PUBLISHED, BlogEvent.EDITED)
+async def _index_changed_blog(event: BlogEvent, blog_id: int) -> None:
+    if search_indexer.ready:
+        await search_indexer.sync_blog(blog_id)
+
+
+@subscribe(BlogEvent.DELISTED, BlogEvent.DELETED)
+def _unindex_removed_blog(event: BlogEvent, blog_id: int) -> None:
+    search_indexer.remove_blog(blog_id)
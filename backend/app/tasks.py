@@ -0,0 +1,30 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+def run_periodically(
+    name: str, interval_seconds: float, job: Callable[[], Awaitable[None]]
+) -> asyncio.Task:
+    """Run ``job`` every ``interval_seconds`` until the returned task is cancelled.
+
+    Failures are logged and the job is retried on the next tick.
+    """
+
+    async def loop() -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await job()
+            except Exception:
+                logger.exception("Periodic task %s failed", name)
+
+    return asyncio.create_task(loop(), name=name)
+
+
+async def cancel_tasks(*tasks: asyncio.Task) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,328 @@
+"""Write side of the home timeline.
+
+Blogs of authors with at most TIMELINE_FANOUT_MAX_FOLLOWERS followers are
+pushed into a timeline_entry row per follower when they are published.
+Blogs of authors above the threshold are never pushed; readers merge them
+in from the blog table instead (see app.timeline.service). Those authors
+are listed in timeline_pull_author, which a background task recounts;
+an author who drops below the threshold is pulled until their recent blogs
+have been backfilled into the followers' timelines.
+Each timeline is trimmed to its newest TIMELINE_MAX_ENTRIES entries in the
+background.
+"""
+
+import logging
+from datetime import timedelta, timezone
+from typing import FrozenSet, Set, Tuple
+
+from sqlalchemy import Select, delete, func, literal, select, true, tuple_, update
+from sqlalchemy.dialects.mysql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.blog.models import Blog, get_current_time
+from app.blog.types import BlogStatus
+from app.cache import TTLCache
+from app.config import settings
+from app.follow.models import UserFollow
+from app.timeline.models import TimelineEntry, TimelinePullAuthor
+
+logger = logging.getLogger(__name__)
+
+pull_authors_cache: TTLCache[str, FrozenSet[str]] = TTLCache(
+    "timeline_pull_authors",
+    max_size=2,
+    ttl_seconds=settings.TIMELINE_PULL_AUTHORS_TTL_SECONDS,
+)
+
+_TIMELINE_COLUMNS = ["username", "blog_id", "author_username", "blog_created_at"]
+
+
+async def _cached_pull_authors(db: AsyncSession, key: str) -> FrozenSet[str]:
+    authors = pull_authors_cache.get(key)
+    if authors is None:
+        rows = (
+            await db.execute(
+                select(TimelinePullAuthor.username, TimelinePullAuthor.leaving_since)
+            )
+        ).all()
+        loaded = {
+            "pulled": frozenset(row.username for row in rows),
+            "unpushed": frozenset(
+                row.username for row in rows if row.leaving_since is None
+            ),
+        }
+        for name, value in loaded.items():
+            pull_authors_cache.set(name, value)
+        authors = loaded[key]
+    return authors
+
+
+async def pull_authors(db: AsyncSession) -> FrozenSet[str]:
+    """Authors whose blogs readers merge in from the blog table.
+
+    Read from timeline_pull_author and cached, so the publish and read
+    paths agree on which authors are pulled. Includes authors still
+    leaving the pull set, whose older blogs may not be pushed yet.
+    """
+    return await _cached_pull_authors(db, "pulled")
+
+
+async def unpushed_authors(db: AsyncSession) -> FrozenSet[str]:
+    """Pull authors whose blogs are not pushed to followers on publish."""
+    return await _cached_pull_authors(db, "unpushed")
+
+
+async def recount_pull_authors(db: AsyncSession) -> Tuple[Set[str], Set[str]]:
+    """Bring timeline_pull_author in line with the follow graph.
+
+    One grouped scan of the follow index. An author who drops below the
+    threshold is first marked as leaving, so every worker starts pushing
+    their new blogs. Once the pull author cache has expired everywhere, a
+    later recount backfills their recent blogs to the followers and drops
+    the row. Returns the authors that joined and those that finished
+    leaving; the caller commits.
+    """
+    rows = (
+        await db.execute(
+            select(TimelinePullAuthor.username, TimelinePullAuthor.leaving_since)
+            .with_for_update()
+        )
+    ).all()
+    counted = set(
+        await db.scalars(
+            select(UserFollow.following_username)
+            .group_by(UserFollow.following_username)
+            .having(func.count() > settings.TIMELINE_FANOUT_MAX_FOLLOWERS)
+        )
+    )
+    now = get_current_time()
+    settled_before = now - timedelta(seconds=settings.TIMELINE_PULL_AUTHORS_TTL_SECONDS)
+
+    joined = counted - {row.username for row in rows}
+    rejoined, leaving, left = set(), set(), set()
+    for username, leaving_since in rows:
+        if username in counted:
+            if leaving_since is not None:
+                rejoined.add(username)
+        elif leaving_since is None:
+            leaving.add(username)
+        else:
+            if leaving_since.tzinfo is None:
+                leaving_since = leaving_since.replace(tzinfo=timezone.utc)
+            if leaving_since <= settled_before:
+                left.add(username)
+
+    if joined:
+        statement = insert(TimelinePullAuthor).values(
+            [{"username": author} for author in sorted(joined)]
+        )
+        # Another worker's refresh may have added them meanwhile.
+        await db.execute(
+            statement.on_duplicate_key_update(username=TimelinePullAuthor.username)
+        )
+    if rejoined:
+        await db.execute(
+            update(TimelinePullAuthor)
+            .where(TimelinePullAuthor.username.in_(rejoined))
+            .values(leaving_since=None)
+        )
+    if leaving:
+        await db.execute(
+            update(TimelinePullAuthor)
+            .where(TimelinePullAuthor.username.in_(leaving))
+            .values(leaving_since=now)
+        )
+    for author in sorted(left):
+        await _backfill_followers(db, author)
+    if left:
+        await db.execute(
+            delete(TimelinePullAuthor).where(TimelinePullAuthor.username.in_(left))
+        )
+    return joined, left
+
+
+async def refresh_pull_authors(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    """Recount the pull authors in the background.
+
+    Requests only read the stored list, never the follow counts.
+    """
+    async with session_maker() as db:
+        joined, left = await recount_pull_authors(db)
+        await db.commit()
+    pull_authors_cache.clear()
+    if joined or left:
+        logger.info(
+            "Timeline pull authors: %d joined, %d left", len(joined), len(left)
+        )
+
+
+def _upsert(rows: Select) -> Insert:
+    statement = insert(TimelineEntry).from_select(_TIMELINE_COLUMNS, rows)
+    # Republishing a blog refreshes the rows it already has.
+    return statement.on_duplicate_key_update(
+        blog_created_at=statement.inserted.blog_created_at
+    )
+
+
+async def push_to_followers(db: AsyncSession, blog: Blog) -> None:
+    """Insert a just-published blog into the timelines of its author's followers."""
+    if blog.author_username in await unpushed_authors(db):
+        return
+    await db.execute(
+        _upsert(
+            select(
+                UserFollow.follower_username,
+                literal(blog.id),
+                literal(blog.author_username),
+                literal(blog.created_at, TimelineEntry.blog_created_at.type),
+            ).where(UserFollow.following_username == blog.author_username)
+        )
+    )
+
+
+async def add_author_to_timeline(db: AsyncSession, username: str, author: str) -> None:
+    """Backfill a newly followed author's recent blogs into the follower's timeline."""
+    if author in await unpushed_authors(db):
+        return
+    await db.execute(
+        _upsert(
+            select(
+                literal(username, TimelineEntry.username.type),
+                Blog.id,
+                Blog.author_username,
+                Blog.created_at,
+            )
+            .where(Blog.author_username == author, Blog.status == BlogStatus.PUBLISHED)
+            .order_by(Blog.created_at.desc())
+            .limit(settings.TIMELINE_MAX_ENTRIES)
+        )
+    )
+
+
+async def _backfill_followers(db: AsyncSession, author: str) -> None:
+    """Push an author's recent blogs into the timelines of all their followers."""
+    recent = (
+        select(Blog.id, Blog.author_username, Blog.created_at)
+        .where(Blog.author_username == author, Blog.status == BlogStatus.PUBLISHED)
+        .order_by(Blog.created_at.desc())
+        .limit(settings.TIMELINE_MAX_ENTRIES)
+        .subquery()
+    )
+    await db.execute(
+        _upsert(
+            select(
+                UserFollow.follower_username,
+                recent.c.id,
+                recent.c.author_username,
+                recent.c.created_at,
+            )
+            .join(recent, true())
+            .where(UserFollow.following_username == author)
+        )
+    )
+
+
+async def remove_author_from_timeline(
+    db: AsyncSession, username: str, author: str
+) -> None:
+    await db.execute(
+        delete(TimelineEntry).where(
+            TimelineEntry.username == username,
+            TimelineEntry.author_username == author,
+        )
+    )
+
+
+async def rebuild_timelines(db: AsyncSession) -> int:
+    """Recreate every pushed timeline entry from the follow graph and the blogs.
+
+    Needed after bulk imports or a change of the fan-out threshold; run
+    ``trim_timelines`` afterwards.
+    """
+    await recount_pull_authors(db)
+    pull_authors_cache.clear()
+    await db.execute(delete(TimelineEntry))
+    result = await db.execute(
+        insert(TimelineEntry).from_select(
+            _TIMELINE_COLUMNS,
+            select(
+                UserFollow.follower_username,
+                Blog.id,
+                Blog.author_username,
+                Blog.created_at,
+            )
+            .join(Blog, Blog.author_username == UserFollow.following_username)
+            .where(
+                Blog.status == BlogStatus.PUBLISHED,
+                Blog.author_username.not_in(await unpushed_authors(db)),
+            ),
+        )
+    )
+    return result.rowcount
+
+
+async def trim_timelines(
+    session_maker: async_sessionmaker[AsyncSession], max_entries: int, batch_size: int
+) -> None:
+    """Cut every timeline down to its newest ``max_entries`` entries.
+
+    Walks the timeline owners in username order, ``batch_size`` owners per
+    transaction.
+    """
+    last_username = ""
+    deleted = 0
+    while True:
+        async with session_maker() as db:
+            owners = list(
+                await db.scalars(
+                    select(TimelineEntry.username)
+                    .where(TimelineEntry.username > last_username)
+                    .group_by(TimelineEntry.username)
+                    .order_by(TimelineEntry.username)
+                    .limit(batch_size)
+                )
+            )
+            if not owners:
+                break
+
+            ranked = (
+                select(
+                    TimelineEntry.username,
+                    TimelineEntry.blog_id,
+                    func.row_number()
+                    .over(
+                        partition_by=TimelineEntry.username,
+                        order_by=(
+                            TimelineEntry.blog_created_at.desc(),
+                            TimelineEntry.blog_id.desc(),
+                        ),
+                    )
+                    .label("position"),
+                )
+                .where(TimelineEntry.username.in_(owners))
+                .subquery()
+            )
+            overflow = (
+                await db.execute(
+                    select(ranked.c.username, ranked.c.blog_id).where(
+                        ranked.c.position > max_entries
+                    )
+                )
+            ).all()
+            if overflow:
+                await db.execute(
+                    delete(TimelineEntry).where(
+                        tuple_(TimelineEntry.username, TimelineEntry.blog_id).in_(
+                            [tuple(row) for row in overflow]
+                        )
+                    )
+                )
+                await db.commit()
+
+        deleted += len(overflow)
+        last_username = owners[-1]
+        if len(owners) < batch_size:
+            break
+
+    if deleted:
+        logger.info("Trimmed %d timeline entries", deleted)
@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import BaseModel
+
+
+class TimelineEntry(BaseModel):
+    """A blog pushed into a follower's home timeline when it was published."""
+
+    __tablename__ = "timeline_entry"
+
+    username: Mapped[str] = mapped_column(
+        String(50), ForeignKey("user.username", ondelete="CASCADE"), primary_key=True
+    )
+    blog_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("blog.id", ondelete="CASCADE"), primary_key=True
+    )
+    author_username: Mapped[str] = mapped_column(String(50))
+    # Copy of blog.created_at, the timeline order, so a page is read from
+    # this table's index alone.
+    blog_created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index(
+            "ix_timeline_entry_user_created", "username", "blog_created_at", "blog_id"
+        ),
+        Index("ix_timeline_entry_blog_id", "blog_id"),
+    )
+
+
+class TimelinePullAuthor(BaseModel):
+    """An author with more followers than the fan-out threshold.
+
+    Kept up to date by ``refresh_pull_authors`` in the background, so the
+    publish and read paths never count followers themselves.
+    """
+
+    __tablename__ = "timeline_pull_author"
+
+    username: Mapped[str] = mapped_column(
+        String(50), ForeignKey("user.username", ondelete="CASCADE"), primary_key=True
+    )
+    # Set once the author drops below the threshold. Their new blogs are
+    # pushed from then on, while readers keep pulling them until their
+    # older blogs have been backfilled into the followers' timelines.
+    leaving_since: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from fastapi import APIRouter, Query, Request
+
+from app.auth.dependencies import UserDependency
+from app.blog.schemas import BlogSearchResponse
+from app.db.dependencies import ReadDatabaseDependency
+from app.limiter import limiter
+from app.schemas import CursorPaginatedResponse
+from app.timeline.service import get_home_timeline_service
+
+router = APIRouter()
+
+
+@router.get("/", response_model=CursorPaginatedResponse[BlogSearchResponse])
+@limiter.limit("120/minute")
+async def home_timeline(
+    request: Request,
+    db: ReadDatabaseDependency,
+    user: UserDependency,
+    size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+):
+    """Published blogs of the users the current user follows, newest first."""
+    return await get_home_timeline_service(user, db, cursor, size)
@@ -0,0 +1,118 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.auth.models import User
+from app.blog.exceptions import InvalidCursorException, handle_database_error
+from app.blog.models import Blog
+from app.blog.schemas import BlogSearchResponse
+from app.blog.types import BlogStatus
+from app.follow.models import UserFollow
+from app.schemas import CursorPaginatedResponse, CursorPaginationMeta
+from app.timeline.fanout import pull_authors
+from app.timeline.models import TimelineEntry
+from app.utils.cursor import decode_cursor, encode_cursor
+
+
+def _before(created_column, id_column, position: Tuple[datetime, int]):
+    created_at, blog_id = position
+    return or_(
+        created_column < created_at,
+        and_(created_column == created_at, id_column < blog_id),
+    )
+
+
+async def get_home_timeline_service(
+    user: User,
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    size: int = 20,
+) -> CursorPaginatedResponse[BlogSearchResponse]:
+    """Published blogs of the followed authors, newest first.
+
+    Pushed blogs are read from the user's own timeline entries; blogs of
+    followed authors above the fan-out threshold are read from the blog
+    table and merged in. Each source contributes at most one page.
+    """
+    position = None
+    if cursor:
+        try:
+            position = tuple(decode_cursor(cursor, 2))
+        except ValueError as e:
+            raise InvalidCursorException(str(e))
+
+    try:
+        pushed = (
+            select(TimelineEntry.blog_id, TimelineEntry.blog_created_at)
+            .join(Blog, Blog.id == TimelineEntry.blog_id)
+            .where(
+                TimelineEntry.username == user.username,
+                Blog.status == BlogStatus.PUBLISHED,
+            )
+        )
+        if position:
+            pushed = pushed.where(
+                _before(TimelineEntry.blog_created_at, TimelineEntry.blog_id, position)
+            )
+        pushed = pushed.order_by(
+            TimelineEntry.blog_created_at.desc(), TimelineEntry.blog_id.desc()
+        )
+        candidates: Dict[int, datetime] = dict(
+            (await db.execute(pushed.limit(size + 1))).tuples().all()
+        )
+
+        pulled_authors = await pull_authors(db)
+        if pulled_authors:
+            followed = list(
+                await db.scalars(
+                    select(UserFollow.following_username).where(
+                        UserFollow.follower_username == user.username,
+                        UserFollow.following_username.in_(pulled_authors),
+                    )
+                )
+            )
+            if followed:
+                pulled = select(Blog.id, Blog.created_at).where(
+                    Blog.author_username.in_(followed),
+                    Blog.status == BlogStatus.PUBLISHED,
+                )
+                if position:
+                    pulled = pulled.where(_before(Blog.created_at, Blog.id, position))
+                pulled = pulled.order_by(Blog.created_at.desc(), Blog.id.desc())
+                candidates.update(
+                    (await db.execute(pulled.limit(size + 1))).tuples().all()
+                )
+
+        page: List[Tuple[int, datetime]] = sorted(
+            candidates.items(), key=lambda item: (item[1], item[0]), reverse=True
+        )[: size + 1]
+        has_next = len(page) > size
+        page = page[:size]
+
+        blogs = {
+            blog.id: blog
+            for blog in await db.scalars(
+                select(Blog)
+                .where(Blog.id.in_([blog_id for blog_id, _ in page]))
+                .options(selectinload(Blog.tags))
+            )
+        }
+    except Exception as e:
+        handle_database_error(e, "home timeline")
+
+    next_cursor = None
+    if has_next:
+        blog_id, created_at = page[-1]
+        next_cursor = encode_cursor([created_at, blog_id])
+
+    return CursorPaginatedResponse(
+        items=[
+            BlogSearchResponse.model_validate(blogs[blog_id])
+            for blog_id, _ in page
+            if blog_id in blogs
+        ],
+        meta=CursorPaginationMeta(size=size, next_cursor=next_cursor, has_next=has_next),
+    )
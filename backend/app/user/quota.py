@@ -0,0 +1,102 @@
+"""Daily blog and comment creation quotas.
+
+A user may create up to the limits in their ``user_limits`` row per day;
+the day's usage is counted in ``user_daily_activity``. The limits are
+cached in-process, so taking a quota is usually a single conditional
+UPDATE that checks and increments the usage at once.
+"""
+
+from datetime import date
+from enum import Enum
+from typing import Dict, Optional
+
+from sqlalchemy import event, select, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import TTLCache
+from app.config import settings
+from app.user.models import UserDailyActivity, UserLimits
+
+
+class Quota(str, Enum):
+    BLOG = "blog"
+    COMMENT = "comment"
+
+
+_USAGE_COLUMNS = {
+    Quota.BLOG: UserDailyActivity.blogs_made,
+    Quota.COMMENT: UserDailyActivity.comments_made,
+}
+
+limits_cache: TTLCache[str, Dict[Quota, int]] = TTLCache(
+    "user_limits",
+    max_size=settings.USER_LIMITS_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_LIMITS_CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(UserLimits, "after_update")
+@event.listens_for(UserLimits, "after_delete")
+def _invalidate_changed_limits(mapper, connection, target: UserLimits) -> None:
+    limits_cache.invalidate(target.username)
+
+
+async def get_limits(db: AsyncSession, username: str) -> Optional[Dict[Quota, int]]:
+    limits = limits_cache.get(username)
+    if limits is None:
+        row = (
+            await db.execute(
+                select(
+                    UserLimits.blog_creation_limit, UserLimits.comment_creation_limit
+                ).where(UserLimits.username == username)
+            )
+        ).first()
+        if row is None:
+            return None
+        limits = {
+            Quota.BLOG: row.blog_creation_limit,
+            Quota.COMMENT: row.comment_creation_limit,
+        }
+        limits_cache.set(username, limits)
+    return limits
+
+
+async def consume_quota(db: AsyncSession, username: str, quota: Quota) -> bool:
+    """Take one unit of today's ``quota`` if the user has one left.
+
+    The limit check is part of the UPDATE's WHERE clause, so concurrent
+    requests cannot both take the last unit. The first use of a day also
+    creates the activity row, with a no-op upsert that tolerates a
+    concurrent creator. Nothing is committed: the unit belongs to the
+    caller's transaction and is given back if that rolls back.
+    """
+    limits = await get_limits(db, username)
+    if not limits or limits[quota] <= 0:
+        return False
+
+    today = date.today()
+    usage = _USAGE_COLUMNS[quota]
+    consume = (
+        update(UserDailyActivity)
+        .where(
+            UserDailyActivity.username == username,
+            UserDailyActivity.activity_date == today,
+            usage < limits[quota],
+        )
+        .values({usage: usage + 1})
+        .execution_options(synchronize_session=False)
+    )
+    if (await db.execute(consume)).rowcount:
+        return True
+
+    # One upsert cannot both create the row and report whether the limit
+    # allowed the increment: the driver counts found rather than changed
+    # rows. So the row is created first and the UPDATE retried.
+    statement = insert(UserDailyActivity).values(
+        username=username, activity_date=today, comments_made=0, blogs_made=0
+    )
+    await db.execute(
+        statement.on_duplicate_key_update(username=UserDailyActivity.username)
+    )
+    return bool((await db.execute(consume)).rowcount)
@@ -1,9 +1,10 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Query, Request, Response
 
 from app.auth.dependencies import UserDependency
-from app.db.dependencies import DatabaseDependency
+from app.db.dependencies import DatabaseDependency, ReadDatabaseDependency
+from app.http_cache import etag_matches, make_etag, not_modified, set_cache_headers
 from app.limiter import limiter
 from app.user.schemas import (
     UserCommentResponse,
@@ -76,10 +77,19 @@ async def get_my_profile(
 @limiter.limit("100/minute")
 async def get_user_profile(
     request: Request,
+    response: Response,
     username: str,
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
 ):
-    return await get_public_profile_service(username, db)
+    profile = await get_public_profile_service(username, db)
+    # Follower counts have no cheap version of their own, so the tag hashes
+    # the (small) profile and a match only saves serialization and transfer.
+    etag = make_etag(profile.model_dump_json())
+    if etag_matches(request, etag):
+        return not_modified(etag, "user_profile")
+
+    set_cache_headers(response, etag, "user_profile")
+    return profile
 
 
 @router.get("/{username}/comments", response_model=List[UserCommentResponse])
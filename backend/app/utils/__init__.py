@@ -1,5 +1,6 @@
 """Utility modules."""
 
+from app.utils.cursor import decode_cursor, encode_cursor
 from app.utils.phone import (
     get_phone_region,
     normalize_phone_number,
@@ -10,4 +11,6 @@ __all__ = [
     "normalize_phone_number",
     "validate_phone_number",
     "get_phone_region",
+    "encode_cursor",
+    "decode_cursor",
 ]
@@ -0,0 +1,37 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(values: List[Any]) -> str:
+    payload = json.dumps([_encode_value(value) for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Malformed cursor: {cursor}") from e
+
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError(f"Malformed cursor: {cursor}")
+
+    try:
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Malformed cursor: {cursor}") from e
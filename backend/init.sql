@@ -16,8 +16,12 @@ CREATE TABLE IF NOT EXISTS `blog` (
     author_username VARCHAR(50) NOT NULL,
     upvotes INT DEFAULT 0,
     downvotes INT DEFAULT 0,
+    comment_count INT NOT NULL DEFAULT 0,
+    positive_count INT NOT NULL DEFAULT 0,
+    negative_count INT NOT NULL DEFAULT 0,
+    hot_score DOUBLE NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
     FOREIGN KEY (author_username) REFERENCES `user`(username) ON DELETE CASCADE,
     CHECK (upvotes >= 0),
     CHECK (downvotes >= 0),
@@ -27,7 +31,12 @@ CREATE TABLE IF NOT EXISTS `blog` (
     INDEX `ix_blog_author_username` (author_username),
     INDEX `ix_blog_created_at` (created_at),
     INDEX `ix_blog_updated_at` (updated_at),
-    INDEX `idx_blog_status_created` (status, created_at)
+    INDEX `idx_blog_status_created` (status, created_at),
+    INDEX `idx_blog_author_created` (author_username, created_at),
+    INDEX `idx_blog_status_updated` (status, updated_at),
+    INDEX `idx_blog_status_subject` (status, subject),
+    INDEX `idx_blog_status_sentiment` (status, negative_count, comment_count),
+    INDEX `idx_blog_status_hot` (status, hot_score)
 );
 
 CREATE TABLE IF NOT EXISTS `tag` (
@@ -45,6 +54,18 @@ CREATE TABLE IF NOT EXISTS `blog_tag` (
     FOREIGN KEY (tag_id) REFERENCES `tag`(id) ON DELETE CASCADE
 );
 
+CREATE TABLE IF NOT EXISTS `blog_vote` (
+    blog_id INT NOT NULL,
+    username VARCHAR(50) NOT NULL,
+    direction VARCHAR(10) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (blog_id, username),
+    FOREIGN KEY (blog_id) REFERENCES `blog`(id) ON DELETE CASCADE,
+    FOREIGN KEY (username) REFERENCES `user`(username) ON DELETE CASCADE,
+    CHECK (direction IN ('UP', 'DOWN')),
+    INDEX `ix_blog_vote_username` (username)
+);
+
 CREATE TABLE IF NOT EXISTS `comment` (
     id INT AUTO_INCREMENT PRIMARY KEY,
     content TEXT NOT NULL,
@@ -56,7 +77,20 @@ CREATE TABLE IF NOT EXISTS `comment` (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (blog_id) REFERENCES `blog`(id) ON DELETE CASCADE,
     FOREIGN KEY (author_username) REFERENCES `user`(username) ON DELETE CASCADE,
-    FOREIGN KEY (parent_comment_id) REFERENCES `comment`(id) ON DELETE CASCADE
+    FOREIGN KEY (parent_comment_id) REFERENCES `comment`(id) ON DELETE CASCADE,
+    INDEX `ix_comment_blog_parent_created` (blog_id, parent_comment_id, created_at),
+    INDEX `ix_comment_parent_comment_id` (parent_comment_id),
+    INDEX `ix_comment_author_created` (author_username, created_at)
+);
+
+CREATE TABLE IF NOT EXISTS `comment_closure` (
+    ancestor_id INT NOT NULL,
+    descendant_id INT NOT NULL,
+    depth INT NOT NULL,
+    PRIMARY KEY (ancestor_id, descendant_id),
+    FOREIGN KEY (ancestor_id) REFERENCES `comment`(id) ON DELETE CASCADE,
+    FOREIGN KEY (descendant_id) REFERENCES `comment`(id) ON DELETE CASCADE,
+    INDEX `ix_comment_closure_descendant` (descendant_id)
 );
 
 CREATE TABLE IF NOT EXISTS `user_limits` (
@@ -79,6 +113,12 @@ CREATE TABLE IF NOT EXISTS `user_daily_activity` (
     CHECK (blogs_made >= 0)
 );
 
+CREATE TABLE IF NOT EXISTS `blog_daily_activity` (
+    activity_date DATE PRIMARY KEY,
+    blog_count INT NOT NULL DEFAULT 0,
+    CHECK (blog_count >= 0)
+);
+
 CREATE TABLE IF NOT EXISTS `user_follow` (
     follower_username VARCHAR(50) NOT NULL,
     following_username VARCHAR(50) NOT NULL,
@@ -86,5 +126,44 @@ CREATE TABLE IF NOT EXISTS `user_follow` (
     PRIMARY KEY (follower_username, following_username),
     FOREIGN KEY (follower_username) REFERENCES `user`(username) ON DELETE CASCADE,
     FOREIGN KEY (following_username) REFERENCES `user`(username) ON DELETE CASCADE,
-    CHECK (follower_username != following_username)
-);
\ No newline at end of file
+    CHECK (follower_username != following_username),
+    INDEX `ix_user_follow_following_created` (following_username, created_at)
+);
+
+CREATE TABLE IF NOT EXISTS `timeline_entry` (
+    username VARCHAR(50) NOT NULL,
+    blog_id INT NOT NULL,
+    author_username VARCHAR(50) NOT NULL,
+    blog_created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (username, blog_id),
+    FOREIGN KEY (username) REFERENCES `user`(username) ON DELETE CASCADE,
+    FOREIGN KEY (blog_id) REFERENCES `blog`(id) ON DELETE CASCADE,
+    INDEX `ix_timeline_entry_user_created` (username, blog_created_at, blog_id),
+    INDEX `ix_timeline_entry_blog_id` (blog_id)
+);
+
+CREATE TABLE IF NOT EXISTS `timeline_pull_author` (
+    username VARCHAR(50) NOT NULL PRIMARY KEY,
+    leaving_since TIMESTAMP NULL,
+    FOREIGN KEY (username) REFERENCES `user`(username) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS `schema_migrations` (
+    version VARCHAR(255) PRIMARY KEY,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Fresh databases already contain every migration below.
+INSERT INTO `schema_migrations` (version) VALUES
+    ('0001_comment_and_follow_indexes'),
+    ('0002_blog_keyset_indexes'),
+    ('0003_blog_comment_counters'),
+    ('0004_blog_updated_at_precision'),
+    ('0005_blog_daily_activity'),
+    ('0006_blog_author_created_index'),
+    ('0007_blog_vote'),
+    ('0008_blog_hot_score'),
+    ('0009_timeline_entry'),
+    ('0010_comment_page_index'),
+    ('0011_comment_closure'),
+    ('0012_timeline_pull_author');
\ No newline at end of file
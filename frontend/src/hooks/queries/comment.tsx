@@ -1,20 +1,27 @@
 import { useApi } from "@/lib/api";
-import type { CommentResponse } from "@/types";
-import { useQuery } from "@tanstack/react-query";
+import type { CommentResponse, CursorPaginatedResponse } from "@/types";
+import { useInfiniteQuery } from "@tanstack/react-query";
 
 export function useBlogComments(blogId: number, parentCommentId?: number | null) {
   const api = useApi();
 
-  return useQuery({
+  return useInfiniteQuery({
     queryKey: ["blog-comments", blogId, parentCommentId ?? "root"],
-    queryFn: async () => {
+    queryFn: async ({ pageParam }) => {
       const searchParams = new URLSearchParams();
       if (parentCommentId !== undefined && parentCommentId !== null) {
         searchParams.append("parent_comment_id", String(parentCommentId));
       }
+      if (pageParam) {
+        searchParams.append("cursor", pageParam);
+      }
 
       const url = `/blog/${blogId}/comments${searchParams.toString() ? `?${searchParams.toString()}` : ""}`;
-      return api.get<CommentResponse[]>(url, false);
+      return api.get<CursorPaginatedResponse<CommentResponse>>(url, false);
+    },
+    getNextPageParam: (lastPage) => {
+      return lastPage.meta.has_next ? lastPage.meta.next_cursor : undefined;
     },
+    initialPageParam: null as string | null,
   });
 }
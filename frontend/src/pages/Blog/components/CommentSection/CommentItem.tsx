@@ -51,6 +51,8 @@ export function CommentItem({ comment, level = 0, blogId }: CommentItemProps) {
     formattedDate,
     replies,
     isLoadingReplies,
+    hasMoreReplies,
+    isLoadingMoreReplies,
     isPending,
     isUpdating,
     isDeleting,
@@ -62,6 +64,7 @@ export function CommentItem({ comment, level = 0, blogId }: CommentItemProps) {
     handleCancelReply,
     handleCancelEdit,
     handleToggleReplies,
+    handleLoadMoreReplies,
     handleStartReply,
     handleStartEdit,
 
@@ -255,6 +258,16 @@ export function CommentItem({ comment, level = 0, blogId }: CommentItemProps) {
           {replies.map((reply) => (
             <CommentItem key={reply.id} comment={reply} level={level + 1} blogId={blogId} />
           ))}
+          {hasMoreReplies && (
+            <Button
+              variant="ghost"
+              size="sm"
+              onClick={handleLoadMoreReplies}
+              disabled={isLoadingMoreReplies}
+            >
+              {isLoadingMoreReplies ? "Loading..." : "Load more replies"}
+            </Button>
+          )}
         </div>
       )}
     </div>
@@ -1,5 +1,6 @@
 import { useAuth } from "@/hooks/useAuth";
 import { useBlogComments } from "@/hooks";
+import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { CommentForm, CommentFormSkeleton } from "./CommentForm";
 import { CommentList, CommentListSkeleton } from "./CommentList";
@@ -25,7 +26,14 @@ function CommentSectionSkeleton() {
 
 export function CommentSection({ blogId, isAuthor }: CommentSectionProps) {
   const { isAuthenticated } = useAuth();
-  const { data: comments, isLoading } = useBlogComments(blogId);
+  const {
+    data,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+    isLoading,
+  } = useBlogComments(blogId);
+  const comments = data?.pages.flatMap((page) => page.items) ?? [];
 
   if (isLoading) {
     return <CommentSectionSkeleton />;
@@ -50,7 +58,19 @@ export function CommentSection({ blogId, isAuthor }: CommentSectionProps) {
             Please log in to leave a comment.
           </div>
         )}
-        <CommentList comments={comments || []} blogId={blogId} />
+        <CommentList comments={comments} blogId={blogId} />
+        {hasNextPage && (
+          <div className="text-center">
+            <Button
+              variant="outline"
+              size="sm"
+              onClick={() => fetchNextPage()}
+              disabled={isFetchingNextPage}
+            >
+              {isFetchingNextPage ? "Loading..." : "Load more comments"}
+            </Button>
+          </div>
+        )}
       </CardContent>
     </Card>
   );
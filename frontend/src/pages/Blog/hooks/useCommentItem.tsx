@@ -24,10 +24,14 @@ export function useCommentItem({ comment, blogId }: UseCommentItemProps) {
   const { mutate: updateComment, isPending: isUpdating } = useUpdateComment(blogId, comment.id);
   const { mutate: deleteComment, isPending: isDeleting } = useDeleteComment(blogId, comment.id);
 
-  const { data: replies = [], isLoading: isLoadingReplies } = useBlogComments(
-    blogId,
-    showReplies ? comment.id : null
-  );
+  const {
+    data: replyPages,
+    isLoading: isLoadingReplies,
+    fetchNextPage: fetchMoreReplies,
+    hasNextPage: hasMoreReplies,
+    isFetchingNextPage: isLoadingMoreReplies,
+  } = useBlogComments(blogId, showReplies ? comment.id : null);
+  const replies = replyPages?.pages.flatMap((page) => page.items) ?? [];
 
   const isPositive = comment.sentiment === Sentiment.POSITIVE;
   const isOwnComment = currentUser?.username === comment.author_username;
@@ -98,6 +102,10 @@ export function useCommentItem({ comment, blogId }: UseCommentItemProps) {
     setShowReplies(!showReplies);
   };
 
+  const handleLoadMoreReplies = () => {
+    fetchMoreReplies();
+  };
+
   const handleStartReply = () => {
     setIsReplying(!isReplying);
   };
@@ -132,6 +140,8 @@ export function useCommentItem({ comment, blogId }: UseCommentItemProps) {
     formattedDate,
     replies,
     isLoadingReplies,
+    hasMoreReplies,
+    isLoadingMoreReplies,
     isPending,
     isUpdating,
     isDeleting,
@@ -143,6 +153,7 @@ export function useCommentItem({ comment, blogId }: UseCommentItemProps) {
     handleCancelReply,
     handleCancelEdit,
     handleToggleReplies,
+    handleLoadMoreReplies,
     handleStartReply,
     handleStartEdit,
 
@@ -15,3 +15,15 @@ export interface PaginatedResponse<T> {
   items: T[];
   meta: PaginationMeta;
 }
+
+export interface CursorPaginationMeta {
+  size: number;
+  next_cursor: string | null;
+  has_next: boolean;
+  total: number | null;
+}
+
+export interface CursorPaginatedResponse<T> {
+  items: T[];
+  meta: CursorPaginationMeta;
+}
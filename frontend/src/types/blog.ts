@@ -14,7 +14,7 @@ export interface BlogResponse {
 }
 
 export interface BlogSearchResponse extends BlogResponse {
-  subject: string;
+  subject: string | null;
   tags: string[];
 }
 